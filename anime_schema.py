@@ -0,0 +1,582 @@
+"""
+Schema field halaman anime, dipakai bersama oleh scrape_all_anime / async_engine,
+scrape_one_anime dan scrape_N_M.
+
+FIELDS adalah daftar deklaratif: kolom → halaman sumber → cara ambil (selector CSS,
+label sidebar, atau konteks) → transform. Selector CSS dikompilasi sekali saat import,
+compile_fields(names) menyusun extractor untuk sekumpulan kolom (di-cache), dan kolom yang
+tidak diminta tidak dijalankan sama sekali.
+
+Halaman utama di-parse dengan jalur tercepat yang bisa melayani semua kolom yang diminta:
+fast path regex → partial parse (potongan HTML) → full parse DOM.
+"""
+import os
+import re
+from functools import lru_cache
+from html import unescape
+
+import soupsieve
+from dotenv import load_dotenv
+
+from html_parser import make_soup
+
+load_dotenv()
+
+# ==========================================
+# KONFIGURASI
+# ==========================================
+# Partial parse: hanya potongan HTML yang dipakai (meta, h1, synopsis, div.leftside) yang di-parse.
+# Kalau struktur halaman tidak dikenali, otomatis kembali ke full parse.
+PARTIAL_PARSE = os.getenv("PARTIAL_PARSE", "True").strip().lower() in ("1", "true", "yes")
+
+# Fast path: ambil field langsung dari HTML mentah dengan regex, tanpa DOM.
+# Hasil divalidasi required_fields_found; halaman yang gagal validasi di-parse ulang dengan BeautifulSoup.
+FAST_PARSE = os.getenv("FAST_PARSE", "True").strip().lower() in ("1", "true", "yes")
+
+# Halaman sumber: "main" (/anime/{id}) atau "characters" (/anime/{id}/.../characters)
+PAGES = ("main", "characters")
+
+
+# ==========================================
+# TRANSFORM
+# ==========================================
+def text(tag):
+    return tag.get_text(strip=True)
+
+
+def image_src(img):
+    return img.get("data-src") or img.get("src")
+
+
+def canonical_url(tag):
+    return tag.get("content") if tag.name == "meta" else tag.get("href")
+
+
+def released_season(premiered):
+    s = re.search(r"(Winter|Spring|Summer|Fall)", premiered, re.IGNORECASE) if premiered else None
+    return s.group(1).capitalize() if s else None
+
+
+def released_year(premiered):
+    y = re.search(r"(\d{4})", premiered) if premiered else None
+    return int(y.group(1)) if y else None
+
+
+CAPTION = soupsieve.compile(".caption")
+RELATION = soupsieve.compile(".relation")
+RELATED_TITLE = soupsieve.compile(".title a")
+ANIME_LINK = soupsieve.compile("a[href*='/anime/']")
+
+
+def external_link(a):
+    return {"name": (CAPTION.select_one(a) or a).get_text(strip=True), "url": a.get("href")}
+
+
+def streaming_platform(a):
+    caption = CAPTION.select_one(a)
+    return {"platform": a.get("title") or (caption.get_text(strip=True) if caption else ""), "url": a.get("href")}
+
+
+def related_entry(entry):
+    """Satu entry di div.related-entries; None untuk entry non-anime (manga, dll)."""
+    link_tag = ANIME_LINK.select_one(entry)
+    title_tag = RELATED_TITLE.select_one(entry)
+    if not link_tag or not title_tag:
+        return None
+    rel_text = RELATION.select_one(entry)
+    rel_text_clean = rel_text.get_text(" ", strip=True) if rel_text else ""
+    match_type = re.search(r"\(([^)]+)\)", rel_text_clean)
+
+    link_url = link_tag.get("href")
+    id_match = re.search(r"/anime/(\d+)", link_url)
+    return {
+        "relation": rel_text_clean.split("(")[0].strip(),
+        "type": match_type.group(1) if match_type else None,
+        "title": title_tag.get_text(strip=True),
+        "id": int(id_match.group(1)) if id_match else None,
+        "url": link_url,
+    }
+
+
+def character_entry(name_tag):
+    """h3.h3_character_name di halaman /characters → {id, name, url, role}; None kalau tidak ada link."""
+    parent_a = name_tag.find_parent("a", href=True)
+    if not parent_a:
+        return None
+    char_url = parent_a["href"]
+    match_id = re.search(r"/character/(\d+)", char_url)
+    # Role (Main / Supporting) ada di div.spaceit_pad setelah div nama
+    role_div = parent_a.parent.find_next_sibling("div", class_="spaceit_pad")
+    return {
+        "id": int(match_id.group(1)) if match_id else None,
+        "name": name_tag.get_text(strip=True),
+        "url": char_url,
+        "role": role_div.get_text(strip=True) or None if role_div else None,
+    }
+
+
+# ==========================================
+# SCHEMA
+# ==========================================
+class Field:
+    """
+    Satu kolom output. Nilainya diambil dengan salah satu cara:
+      css      selector CSS (string, atau tuple yang dicoba berurutan) → transform(tag);
+               many=True mengambil semua tag yang cocok (hasil transform None dilewati)
+      sidebar  (section, keys): label dark_text di div.leftside, key pertama yang terisi
+               (singular/plural); keys None untuk seluruh section. transform(nilai) opsional
+      derive   fungsi dari konteks {"anime_id", "url"}; untuk field css dipakai kalau selector tidak ketemu
+    partial  field ada di potongan slice_anime_page; fast: bisa diambil fast path regex
+             (default: field sidebar Information/Statistics dan field konteks)
+    null     "required" (null → retry), "optional" (semi-optional, langsung null), "limited" (retry terbatas)
+    allow    placeholder yang dianggap nilai valid ("Unknown", "N/A")
+    """
+
+    def __init__(self, name, page="main", css=None, sidebar=None, derive=None, transform=None,
+                 many=False, partial=True, fast=None, null="required", allow=()):
+        self.name = name
+        self.page = page
+        self.selectors = tuple(soupsieve.compile(s) for s in ((css,) if isinstance(css, str) else css or ()))
+        self.sidebar = sidebar
+        self.derive = derive
+        self.transform = transform
+        self.many = many
+        self.partial = partial
+        if fast is None:
+            fast = sidebar[0] in ("Information", "Statistics") if sidebar else not self.selectors
+        self.fast = fast
+        self.null = null
+        self.allow = allow
+
+    def select(self, soup):
+        """Jalankan selector CSS di soup dan transform hasilnya."""
+        if self.many:
+            values = (self.transform(tag) for selector in self.selectors for tag in selector.select(soup))
+            return [value for value in values if value is not None]
+        for selector in self.selectors:
+            tag = selector.select_one(soup)
+            if tag is not None:
+                return self.transform(tag)
+        return None
+
+    def value(self, raw, ctx):
+        """Nilai kolom dari nilai mentah (read_soup / read_fast)."""
+        if self.page != "main":
+            # Diisi caller dari halaman lain
+            return [] if self.many else None
+        if self.sidebar:
+            section, keys = self.sidebar
+            values = raw["sidebar"].get(section, {})
+            if keys is None:
+                value = values
+            else:
+                value = None
+                for key in keys:
+                    value = values.get(key)
+                    if value:
+                        break
+            return self.transform(value) if self.transform else value
+        value = raw.get(self.name) if self.selectors else None
+        if value is None and self.derive:
+            value = self.derive(ctx)
+        return value
+
+
+def info(*keys):
+    return ("Information", keys)
+
+
+def stat(key):
+    return ("Statistics", (key,))
+
+
+# Urutan di sini = urutan kolom output
+FIELDS = [
+    Field("myanimelist_id", derive=lambda ctx: ctx["anime_id"]),
+    Field("title", css="h1.title-name, h1.title", transform=text, fast=True),
+    Field("alternative_titles", sidebar=("Alternative Titles", None)),
+    Field("description", css='p[itemprop="description"]', transform=text, fast=True),
+    Field("image", css="div.leftside img", transform=image_src, fast=True),
+    Field("Type", sidebar=info("Type")),
+    Field("Episodes", sidebar=info("Episodes"), allow=("Unknown",)),
+    Field("Status", sidebar=info("Status"), allow=("Unknown",)),
+    Field("Aired", sidebar=info("Aired"), null="optional", allow=("Unknown",)),
+    Field("Premiered", sidebar=info("Premiered"), null="optional", allow=("Unknown",)),
+    Field("Released_Season", sidebar=info("Premiered"), transform=released_season, null="optional", allow=("Unknown",)),
+    Field("Released_Year", sidebar=info("Premiered"), transform=released_year, null="optional", allow=("Unknown",)),
+    Field("Broadcast", sidebar=info("Broadcast"), null="optional", allow=("Unknown",)),
+    Field("Source", sidebar=info("Source")),
+    Field("Genres", sidebar=info("Genres", "Genre"), null="optional"),
+    Field("Themes", sidebar=info("Themes", "Theme"), null="optional"),
+    Field("Studios", sidebar=info("Studios", "Studio")),
+    Field("Producers", sidebar=info("Producers", "Producer")),
+    Field("Licensors", sidebar=info("Licensors", "Licensor"), null="optional"),
+    Field("Demographic", sidebar=info("Demographic"), null="optional"),
+    Field("Duration", sidebar=info("Duration"), allow=("Unknown",)),
+    Field("Rating", sidebar=info("Rating")),
+    Field("Score", sidebar=stat("Score"), allow=("N/A",)),
+    Field("Ranked", sidebar=stat("Ranked"), allow=("N/A",)),
+    Field("Popularity", sidebar=stat("Popularity")),
+    Field("Members", sidebar=stat("Members")),
+    Field("Favorites", sidebar=stat("Favorites")),
+    Field("external_links", css="div.external_links a.link", many=True, transform=external_link),
+    Field("streaming_platforms", css=".broadcast-item.available", many=True, transform=streaming_platform),
+    Field("related_entries", css="div.related-entries div.entry.borderClass", many=True,
+          transform=related_entry, partial=False),
+    Field("characters", page="characters", css="a[href*='/character/'] h3.h3_character_name", many=True,
+          transform=character_entry, null="limited"),
+    Field("source_url", css=('meta[property="og:url"]', 'link[rel="canonical"]'), transform=canonical_url,
+          derive=lambda ctx: ctx["url"], fast=True),
+]
+FIELDS_BY_NAME = {field.name: field for field in FIELDS}
+
+# Kolom CSV standar scrape_all_anime / scrape_N_M
+DEFAULT_FIELDS = (
+    "myanimelist_id", "title", "description", "image", "Type", "Episodes", "Status", "Premiered",
+    "Released_Season", "Released_Year", "Source", "Genres", "Themes", "Studios", "Producers",
+    "Demographic", "Duration", "Rating", "Score", "Ranked", "Popularity", "Members", "Favorites",
+    "characters", "source_url",
+)
+ALL_FIELDS = tuple(field.name for field in FIELDS)
+# Kolom identitas, selalu ikut
+KEY_FIELDS = ("myanimelist_id", "source_url")
+
+FIELD_PAGES = {field.name: field.page for field in FIELDS}
+# Field yang memang bisa tidak ada (semi-optional) - langsung null, tidak retry
+SEMI_OPTIONAL_FIELDS = {field.name for field in FIELDS if field.null == "optional"}
+# Field yang butuh retry terbatas
+LIMITED_RETRY_FIELDS = {field.name for field in FIELDS if field.null == "limited"}
+# Field yang boleh bernilai "Unknown" / "N/A"
+CAN_BE_UNKNOWN = [field.name for field in FIELDS if "Unknown" in field.allow]
+CAN_BE_NA = [field.name for field in FIELDS if "N/A" in field.allow]
+
+
+def resolve_fields(spec):
+    """
+    Nilai ANIME_FIELDS → tuple nama kolom: "default", "all", atau daftar nama dipisah koma.
+    Kolom identitas (KEY_FIELDS) selalu ikut. Nama yang tidak dikenal → ValueError.
+    """
+    spec = spec.strip()
+    if spec.lower() == "default":
+        return DEFAULT_FIELDS
+    if spec.lower() == "all":
+        return ALL_FIELDS
+    names = {name.strip() for name in spec.split(",") if name.strip()}
+    unknown = names - FIELDS_BY_NAME.keys()
+    if unknown:
+        raise ValueError(f"Unknown ANIME_FIELDS: {', '.join(sorted(unknown))} (pilihan: {', '.join(ALL_FIELDS)})")
+    names.update(KEY_FIELDS)
+    return tuple(name for name in ALL_FIELDS if name in names)
+
+
+class Extractor:
+    """Field yang diminta, dikelompokkan per cara ambil. Dibuat lewat compile_fields."""
+
+    def __init__(self, names):
+        unknown = set(names) - FIELDS_BY_NAME.keys()
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        self.fields = [field for field in FIELDS if field.name in names]
+        main = [field for field in self.fields if field.page == "main"]
+        self.css_fields = [field for field in main if field.selectors]
+        self.needs_sidebar = any(field.sidebar for field in main)
+        # Semua field ada di potongan halaman (partial parse / streaming sampai synopsis)
+        self.partial = all(field.partial for field in main)
+        self.fast = all(field.fast for field in main)
+        self.pages = tuple(page for page in PAGES if any(field.page == page for field in self.fields))
+
+    def read_soup(self, soup):
+        """Nilai mentah field halaman utama dari soup (halaman penuh atau hasil slice_anime_page)."""
+        raw = {field.name: field.select(soup) for field in self.css_fields}
+        if self.needs_sidebar:
+            # Setelah selector CSS, karena extract_sidebar memodifikasi tree
+            raw["sidebar"] = extract_sidebar(LEFTSIDE.select_one(soup) or soup)
+        return raw
+
+    def build(self, raw, anime_id, url):
+        """Susun dict flat (urutan kolom FIELDS) dari nilai mentah DOM atau fast path."""
+        ctx = {"anime_id": anime_id, "url": url}
+        return {field.name: field.value(raw, ctx) for field in self.fields}
+
+
+@lru_cache(maxsize=None)
+def compile_fields(names):
+    """Extractor untuk tuple nama kolom, dibuat sekali per kombinasi (juga di tiap proses parse_pool)."""
+    return Extractor(names)
+
+
+# ==========================================
+# PARSE HALAMAN
+# ==========================================
+TITLE = soupsieve.compile("h1.title-name, h1.title")
+LEFTSIDE = soupsieve.compile("div.leftside")
+
+CANONICAL_RE = re.compile(r'<meta[^>]+property="og:url"[^>]*>|<link[^>]+rel="canonical"[^>]*>')
+DESCRIPTION_RE = re.compile(r'<p\b[^>]*itemprop="description"')
+
+# Synopsis adalah bagian terakhir halaman anime yang dibaca partial parse (setelah div.leftside)
+SYNOPSIS_END_RE = re.compile(rb'<p\b[^>]*itemprop="description"[^>]*>.*?</p>', re.S)
+
+
+def anime_page_complete(body):
+    """stop_when untuk streaming: True kalau body sudah memuat div.leftside dan synopsis utuh."""
+    return b'class="leftside"' in body and SYNOPSIS_END_RE.search(body) is not None
+
+
+def slice_anime_page(html):
+    """
+    Potong HTML halaman anime menjadi dokumen kecil berisi bagian yang dibaca field partial:
+    meta og:url / canonical, h1 judul, p[itemprop=description] dan div.leftside (info + statistik).
+    Return None kalau salah satu penanda tidak ditemukan.
+    """
+    h1_start = html.find("<h1")
+    h1_end = html.find("</h1>", h1_start)
+
+    left_class = html.find('class="leftside"')
+    left_start = html.rfind("<div", 0, left_class)
+    left_end = html.find('<div class="rightside', left_class)
+
+    desc = DESCRIPTION_RE.search(html)
+    desc_end = html.find("</p>", desc.end()) if desc else -1
+
+    if min(h1_start, h1_end, left_class, left_start, left_end, desc_end) < 0:
+        return None
+
+    head = "".join(CANONICAL_RE.findall(html))
+    return (f"<html><head>{head}</head><body>"
+            f"{html[h1_start:h1_end + 5]}"
+            f"{html[desc.start():desc_end + 4]}"
+            f"{html[left_start:left_end]}"
+            f"</body></html>")
+
+
+def parse_anime_page(html, anime_id, url, fields=DEFAULT_FIELDS):
+    """
+    Parse HTML halaman /anime/{id} menjadi dict flat berisi `fields`.
+    Kolom dari halaman lain (characters) masih kosong, diisi oleh caller.
+    """
+    schema = compile_fields(tuple(fields))
+    if FAST_PARSE and schema.fast:
+        raw = read_fast(html)
+        if raw is not None:
+            flat = schema.build(raw, anime_id, url)
+            if required_fields_found(flat):
+                return flat
+    if PARTIAL_PARSE and schema.partial:
+        sliced = slice_anime_page(html)
+        if sliced is not None:
+            soup = make_soup(sliced)
+            if TITLE.select_one(soup) and LEFTSIDE.select_one(soup):
+                return schema.build(schema.read_soup(soup), anime_id, url)
+    return schema.build(schema.read_soup(make_soup(html)), anime_id, url)
+
+
+def parse_characters(html):
+    """Parse daftar karakter dari HTML halaman /characters"""
+    return FIELDS_BY_NAME["characters"].select(make_soup(html))
+
+
+def extract_sidebar(leftside):
+    """
+    Satu kali jalan di div.leftside: kumpulkan semua label dark_text di section Alternative Titles
+    dan Information (key → value) dan angka Statistics (Score, Ranked, Popularity, Members, Favorites).
+    Return {section: {key: value}}.
+    """
+    stats = {"Score": None, "Ranked": None, "Popularity": None, "Members": None, "Favorites": None}
+    sections = {"Alternative Titles": {}, "Information": {}, "Statistics": stats}
+    section = None
+
+    for tag in leftside.find_all(["h2", "span"]):
+        if tag.name == "h2":
+            section = tag.get_text(strip=True)
+            continue
+        if "dark_text" not in tag.get("class", []):
+            continue
+
+        key = tag.get_text(strip=True).replace(":", "")
+        row = tag.parent
+
+        if section in ("Information", "Alternative Titles"):
+            if row.name != "div" or "spaceit_pad" not in row.get("class", []):
+                continue
+            tag.extract()
+            anchors = [a.get_text(strip=True) for a in row.find_all("a")]
+            sections[section][key] = ", ".join(anchors) if anchors else row.get_text(strip=True)
+        elif key == "Score":
+            score_tag = row.find(itemprop="ratingValue") or row.find("span", class_="score-na")
+            if score_tag:
+                stats["Score"] = score_tag.get_text(strip=True)
+        elif key == "Ranked":
+            for sup in row.find_all("sup"):
+                sup.decompose()
+            m = re.search(r"#\s*([\d,]+)", row.get_text(" ", strip=True))
+            if m:
+                stats["Ranked"] = f"#{m.group(1)}"
+        elif key == "Popularity":
+            m = re.search(r"#([\d,]+)", row.get_text(" ", strip=True))
+            stats["Popularity"] = f"#{m.group(1)}" if m else None
+        elif key in ("Members", "Favorites"):
+            stats[key] = re.sub(r"[^0-9,]", "", row.get_text(" ", strip=True))
+
+    return sections
+
+
+# ==========================================
+# FAST PATH (regex, tanpa DOM)
+# ==========================================
+TAG_RE = re.compile(r"<[^>]*>")
+OG_URL_RE = re.compile(r'<meta property="og:url" content="([^"]*)"\s*/?>')
+TITLE_RE = re.compile(r'<h1 class="title-name[^"]*">(.*?)</h1>', re.S)
+DESCRIPTION_P_RE = re.compile(r'<p itemprop="description">(.*?)</p>', re.S)
+IMG_RE = re.compile(r"<img\b[^>]*>")
+DATA_SRC_RE = re.compile(r'\sdata-src="([^"]*)"')
+SRC_RE = re.compile(r'\ssrc="([^"]*)"')
+H2_RE = re.compile(r"<h2\b[^>]*>(.*?)</h2>", re.S)
+INFO_ROW_RE = re.compile(r'<div class="spaceit_pad">\s*<span class="dark_text">([^<]*)</span>(.*?)</div>', re.S)
+ANCHOR_RE = re.compile(r"<a\b[^>]*>(.*?)</a>", re.S)
+SCORE_RE = re.compile(r'<span class="dark_text">Score:</span>\s*<span([^>]*)>([^<]*)</span>')
+STAT_RE = re.compile(r'<span class="dark_text">(Ranked|Popularity|Members|Favorites):</span>([^<]*)(<sup>|</div>)')
+
+
+def fragment_text(fragment):
+    """Setara Tag.get_text(strip=True) untuk potongan HTML tanpa komentar/script."""
+    return "".join(part for part in (unescape(text).strip() for text in TAG_RE.split(fragment)) if part)
+
+
+def read_fast(html):
+    """
+    Versi regex read_soup untuk markup MAL yang dikenal (og:url, h1.title-name,
+    p[itemprop=description], label dark_text di div.leftside); hanya field dengan fast=True.
+    Return nilai mentah yang sama dengan versi DOM, atau None kalau ada bagian yang tidak dikenali.
+    """
+    if "<!--" in html[html.find('class="leftside"'):html.find('<div class="rightside')]:
+        return None
+    if html.count("<h1") != 1:
+        return None
+
+    og_url = OG_URL_RE.search(html)
+    title = TITLE_RE.search(html)
+    description = DESCRIPTION_P_RE.search(html)
+    left_start = html.find('class="leftside"')
+    left_end = html.find('<div class="rightside', left_start)
+    if not (og_url and title and description) or left_start < 0 or left_end < 0:
+        return None
+    leftside = html[left_start:left_end]
+
+    img = IMG_RE.search(leftside)
+    image_url = None
+    if img:
+        src = DATA_SRC_RE.search(img.group()) or SRC_RE.search(img.group())
+        image_url = unescape(src.group(1)) if src else None
+
+    # Section Information: dari h2 "Information" sampai h2 berikutnya
+    headers = list(H2_RE.finditer(leftside))
+    info_index = next((i for i, h in enumerate(headers) if fragment_text(h.group(1)) == "Information"), None)
+    if info_index is None:
+        return None
+    info_start = headers[info_index].end()
+    info_end = headers[info_index + 1].start() if info_index + 1 < len(headers) else len(leftside)
+    info_html = leftside[info_start:info_end]
+
+    rows = INFO_ROW_RE.findall(info_html)
+    if len(rows) != info_html.count('class="dark_text"') or len(rows) != info_html.count("<div"):
+        # Ada baris dengan markup lain (div bersarang, class tambahan), serahkan ke DOM
+        return None
+    info_values = {}
+    for label, value_html in rows:
+        anchors = ANCHOR_RE.findall(value_html)
+        key = fragment_text(label).replace(":", "")
+        info_values[key] = ", ".join(fragment_text(a) for a in anchors) if anchors else fragment_text(value_html)
+
+    # Statistics: label di luar section Information
+    rest = leftside[:info_start] + leftside[info_end:]
+    stats = {"Score": None, "Ranked": None, "Popularity": None, "Members": None, "Favorites": None}
+    if rest.count('class="dark_text">Score:') > (1 if SCORE_RE.search(rest) else 0):
+        return None
+    score = SCORE_RE.search(rest)
+    if score:
+        attrs, value = score.groups()
+        if 'itemprop="ratingValue"' not in attrs and "score-na" not in attrs:
+            return None
+        stats["Score"] = unescape(value).strip()
+
+    found = STAT_RE.findall(rest)
+    if len(found) != sum(rest.count(f'class="dark_text">{key}:') for key in ("Ranked", "Popularity", "Members", "Favorites")):
+        return None
+    for key, value, end in found:
+        value = unescape(value)
+        if key == "Ranked":
+            m = re.search(r"#\s*([\d,]+)", value)
+            if m:
+                stats["Ranked"] = f"#{m.group(1)}"
+        elif key == "Popularity":
+            m = re.search(r"#([\d,]+)", value)
+            stats["Popularity"] = f"#{m.group(1)}" if m else None
+        else:
+            if end != "</div>":
+                return None
+            stats[key] = re.sub(r"[^0-9,]", "", value)
+
+    return {
+        "source_url": unescape(og_url.group(1)),
+        "title": fragment_text(title.group(1)),
+        "description": fragment_text(description.group(1)),
+        "image": image_url,
+        "sidebar": {"Information": info_values, "Statistics": stats},
+    }
+
+
+def fast_parse_anime_page(html, anime_id, url, fields=DEFAULT_FIELDS):
+    """Fast path saja (tanpa validasi / fallback DOM); None kalau markup tidak dikenali."""
+    raw = read_fast(html)
+    if raw is None:
+        return None
+    return compile_fields(tuple(fields)).build(raw, anime_id, url)
+
+
+# ==========================================
+# VALIDASI
+# ==========================================
+def check_null_values(data):
+    """
+    Cek apakah ada nilai null/None/empty pada kolom penting.
+    Return list of kolom yang null.
+    """
+    # Kolom yang BENAR-BENAR boleh null (karena tidak semua anime punya)
+    # End_year: untuk anime ongoing yang belum selesai
+    optional_fields = ['End_year']
+
+    null_fields = []
+    for key, value in data.items():
+        # Skip kolom opsional
+        if key in optional_fields:
+            continue
+
+        # Cek null/None/empty
+        if value is None or value == '':
+            null_fields.append(key)
+        elif value == 'Unknown':
+            # Untuk field tertentu, "Unknown" itu valid
+            if key not in CAN_BE_UNKNOWN:
+                null_fields.append(key)
+        elif value == 'N/A':
+            # Untuk field tertentu, "N/A" itu valid
+            if key not in CAN_BE_NA:
+                null_fields.append(key)
+
+        # Cek untuk list kosong termasuk characters
+        if isinstance(value, list) and len(value) == 0:
+            if key == 'characters':
+                # Characters kosong juga dianggap null, perlu retry
+                null_fields.append(key)
+
+    return null_fields
+
+
+def required_fields_found(flat):
+    """
+    Validasi hasil parse dengan check_null_values. Field semi-optional dan characters memang
+    bisa kosong; kalau ada field lain yang null, hasil fast path di-parse ulang dengan DOM.
+    """
+    null_fields = check_null_values(flat)
+    return not [f for f in null_fields if f not in SEMI_OPTIONAL_FIELDS and f not in LIMITED_RETRY_FIELDS]
@@ -0,0 +1,268 @@
+"""
+Engine asyncio (httpx) untuk pipeline detail anime di scrape_all_anime.py.
+
+Alur sama dengan mode thread: fetch → parse (process pool) → append_to_csv (retry lewat retry queue),
+tapi semua request berjalan di satu event loop dengan concurrency dibatasi oleh jumlah worker di queue.
+Dipilih lewat ENGINE=async di .env.
+
+Engine ini tidak mengimpor scrape_all_anime: modul scraper yang sedang jalan (saat dijalankan
+sebagai script, itu __main__) diberikan lewat argumen `saa`. Import ulang akan membuat salinan
+kedua modul dengan writers / checkpoint / seen_characters sendiri yang kosong.
+
+    async_engine.run(sys.modules[__name__], jobs, ASYNC_CONCURRENCY)
+"""
+import asyncio
+import contextlib
+import random
+import time
+import httpx
+from collections import deque
+
+import rate_limiter
+import page_cache
+import proxy_pool
+import circuit_breaker
+import http_session
+import parse_pool
+import anime_schema
+from retry_queue import RetryQueue
+
+
+async def acquire_proxy(pool):
+    """Ambil proxy dari pool tanpa memblokir event loop."""
+    proxy = pool.try_acquire()
+    while proxy is None:
+        await asyncio.sleep(min(max(pool.next_available_in(), 0.05), 1.0))
+        proxy = pool.try_acquire()
+    return proxy
+
+
+async def stream_get(client, url, headers, stop_when=None, on_status=None, fallback=False):
+    """
+    GET url. Return (status_code, body, cut). on_status(status_code) dipanggil setelah header
+    diterima, sebelum body dibaca. Dengan stop_when, body berhenti dibaca setelah stop_when(body)
+    True (cut True). fallback=True: download ulang penuh, byte di wire dicatat di statistik streaming.
+    """
+    async with client.stream("GET", url, headers=headers) as res:
+        if on_status is not None:
+            on_status(res.status_code)
+        if stop_when is None or res.status_code != 200:
+            content = await res.aread()
+            if fallback and res.status_code == 200:
+                http_session.record_stream_fallback(res.num_bytes_downloaded)
+            return res.status_code, content, False
+        body = bytearray()
+        cut = False
+        async for chunk in res.aiter_bytes(http_session.STREAM_CHUNK_SIZE):
+            body += chunk
+            if stop_when(body):
+                cut = True
+                break
+        http_session.record_stream(res.headers.get("Content-Length"), res.num_bytes_downloaded, cut)
+        return 200, bytes(body), cut
+
+
+async def fetch(clients, url, headers, stop_when=None, on_status=None, fallback=False):
+    """
+    GET url. Return (text, status_code); text None kalau gagal.
+    `clients` berisi satu AsyncClient per proxy (key None untuk koneksi langsung).
+    Dengan stop_when dan STREAM_PAGES aktif, body berhenti dibaca setelah stop_when(body) True;
+    kalau body habis sebelum stop_when True, halaman di-download ulang penuh.
+    on_status(status_code) dipanggil begitu header response diterima, sebelum body dibaca.
+    fallback diteruskan ke stream_get.
+    Mode offline tanpa halaman di cache: return (None, page_cache.CACHE_MISS).
+    """
+    cache = page_cache.cache
+    if cache.reads:
+        content = cache.get(url)
+        if content is not None:
+            if on_status is not None:
+                on_status(200)
+            return page_cache.CachedResponse(url, content).text, 200
+        if cache.offline:
+            return None, page_cache.CACHE_MISS
+
+    breaker = circuit_breaker.breaker_for(url)
+    is_probe = await breaker.acquire_async()
+    stream = stop_when is not None and http_session.should_stream()
+    status_code = 0  # status 0 = gagal, juga untuk exception di luar httpx.HTTPError
+    try:
+        status_code, content, cut = await send(clients, url, headers, stop_when if stream else None, on_status, fallback)
+    except httpx.HTTPError:
+        # Connection error, timeout, proxy error
+        return None, 0
+    finally:
+        # Selalu dicatat (decode error, CancelledError, ...): probe HALF-OPEN yang tidak
+        # pernah dicatat membuat circuit tertahan di HALF-OPEN dan semua worker menunggu selamanya
+        breaker.record(status_code, is_probe)
+    if status_code != 200:
+        return None, status_code
+    if stream and not cut:
+        # Body habis sebelum stop_when terpenuhi (potongan tidak memuat bagian yang dibutuhkan):
+        # download ulang penuh. Field yang memang kosong (Ranked N/A, dll) tidak memicu ini.
+        return await fetch(clients, url, headers, fallback=True)
+
+    if cache.writes:
+        cache.put(url, content)
+    return content.decode("utf-8", errors="replace"), 200
+
+
+async def send(clients, url, headers, stop_when, on_status, fallback=False):
+    """Satu GET lewat proxy pool dan rate limiter (circuit breaker diurus fetch). Return (status_code, body, cut)."""
+    pool = proxy_pool.pool
+    proxy = None
+    limiter = rate_limiter.limiter
+    client = clients.get(None)
+    if pool is not None:
+        proxy = await acquire_proxy(pool)
+        limiter = proxy.limiter
+        client = clients[proxy.url]
+
+    try:
+        await limiter.acquire_async()
+        start = time.monotonic()
+        status_code, content, cut = await stream_get(client, url, headers, stop_when, on_status, fallback)
+    except BaseException:
+        # Connection error, timeout, proxy error, atau exception lain (cancel): slot proxy tetap dilepas
+        limiter.record(0)
+        if proxy is not None:
+            pool.release(proxy, 0)
+        raise
+    latency = time.monotonic() - start
+    limiter.record(status_code, latency)
+    if proxy is not None:
+        pool.release(proxy, status_code, latency)
+    return status_code, content, cut
+
+
+async def get_characters(clients, anime_url, headers):
+    characters_url = anime_url.rstrip("/") + "/characters"
+    html, _ = await fetch(clients, characters_url, headers)
+    if html is None:
+        return []
+    return await parse_pool.parse_async(anime_schema.parse_characters, html)
+
+
+async def fetch_anime_page(saa, clients, anime_id, url, headers, on_status=None):
+    """
+    Fetch + parse halaman /anime/{id}. Return (flat, status_code).
+    Dengan STREAM_PAGES halaman hanya dibaca sampai synopsis (lihat fetch).
+    """
+    stream = http_session.should_stream() and anime_schema.compile_fields(saa.ANIME_FIELDS).partial
+    html, status_code = await fetch(clients, url, headers, stop_when=anime_schema.anime_page_complete if stream else None,
+                                    on_status=on_status)
+    if html is None:
+        return None, status_code
+    # Parsing di process pool supaya event loop tidak tertahan oleh BeautifulSoup
+    return await parse_pool.parse_async(anime_schema.parse_anime_page, html, anime_id, url, saa.ANIME_FIELDS), 200
+
+
+async def scrape_myanimelist(saa, clients, anime_id, headers, anime_url=None, pages=None):
+    """
+    Fetch halaman anime dan /characters bersamaan, lalu gabungkan hasilnya.
+    /characters dimulai begitu halaman utama menjawab 200, sama seperti saa.scrape_myanimelist.
+    `pages` membatasi halaman yang di-fetch (default saa.ALL_PAGES), sama seperti saa.scrape_myanimelist.
+    """
+    if pages is None:
+        pages = saa.ALL_PAGES
+    url = saa.ANIME_URL.format(anime_id)
+    characters_url = saa.characters_base_url(anime_id, anime_url)
+    if "main" not in pages:
+        return {"characters": await get_characters(clients, characters_url, headers)}, 200
+
+    characters_task = None
+
+    def start_characters(status_code):
+        nonlocal characters_task
+        if status_code == 200 and characters_task is None and "characters" in pages:
+            characters_task = asyncio.ensure_future(get_characters(clients, characters_url, headers))
+
+    flat = None
+    try:
+        flat, status_code = await fetch_anime_page(saa, clients, anime_id, url, headers, on_status=start_characters)
+    finally:
+        # Halaman utama gagal: /characters yang sudah jalan tidak dipakai
+        if flat is None and characters_task is not None:
+            characters_task.cancel()
+    if flat is None:
+        return None, status_code
+
+    if characters_task is not None:
+        flat["characters"] = await characters_task
+    else:
+        flat.pop("characters", None)
+    return flat, 200
+
+
+async def process_anime(saa, clients, job):
+    """Versi async dari saa.process_anime. Return: (outcome, status_code, failure_class)"""
+    saa.announce_job(job)
+
+    pages = saa.ALL_PAGES if job["data"] is None else saa.pages_for_retry(job["null_fields"])
+
+    headers = {"User-Agent": random.choice(saa.USER_AGENTS)}
+    data, status_code = await scrape_myanimelist(saa, clients, job["anime_id"], headers, job["url"], pages)
+    return saa.handle_fetch(job, data, status_code)
+
+
+async def run_async(saa, jobs, concurrency):
+    """
+    Jalankan semua jobs dengan `concurrency` worker (saa: modul scrape_all_anime yang sedang jalan). Worker mengambil retry yang sudah
+    jatuh tempo dulu, lalu anime baru; job yang perlu retry masuk retry queue.
+    Return: (success_count, failed_count)
+    """
+    pending = deque(jobs)
+    retries = RetryQueue()
+    counts = {"saved": 0, "failed": 0}
+    active = {"jobs": 0}
+
+    pool = proxy_pool.pool
+    proxy_urls = [p.url for p in pool.proxies] if pool else [None]
+    # 2 koneksi per worker: halaman anime dan /characters di-fetch bersamaan
+    limits = httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency * 2)
+
+    # Satu AsyncClient per proxy, karena httpx mengatur proxy per client
+    async with contextlib.AsyncExitStack() as stack:
+        clients = {}
+        for proxy_url in proxy_urls:
+            clients[proxy_url] = await stack.enter_async_context(httpx.AsyncClient(
+                proxy=proxy_url,
+                limits=limits,
+                timeout=30,
+                follow_redirects=True,
+            ))
+
+        async def worker():
+            while True:
+                job = retries.pop_due()
+                if job is None and pending:
+                    job = pending.popleft()
+                if job is None:
+                    if not len(retries) and not active["jobs"]:
+                        return
+                    # Tunggu retry jatuh tempo atau job lain yang masih jalan
+                    due_in = retries.next_due_in()
+                    await asyncio.sleep(min(due_in, 0.5) if due_in is not None else 0.5)
+                    continue
+
+                active["jobs"] += 1
+                try:
+                    outcome, _, failure_class = await process_anime(saa, clients, job)
+                except Exception as e:
+                    print(f"[Index {job['idx']}] ✗ Exception: {e}")
+                    outcome, failure_class = "failed", None
+                finally:
+                    active["jobs"] -= 1
+
+                if outcome == "retry":
+                    saa.schedule_retry(retries, job, failure_class)
+                else:
+                    counts[outcome] += 1
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(jobs)))))
+
+    return counts["saved"], counts["failed"]
+
+
+def run(saa, jobs, concurrency):
+    return asyncio.run(run_async(saa, jobs, concurrency))
@@ -0,0 +1,102 @@
+"""
+Benchmark output anime: append_to_csv lama (lock → buka file → DictWriter → tutup per baris)
+vs BackgroundWriter (satu handle, thread writer menguras queue, flush per batch).
+
+    python benchmarks/bench_anime_writer.py [NUM_ROWS] [NUM_WORKERS]
+
+NUM_WORKERS thread menulis baris bersamaan. Dicetak waktu yang dihabiskan worker di
+append_to_csv (p50/p99/max) dan total waktu sampai semua baris ada di disk. Isi file
+kedua cara harus sama (dibaca pandas, diurutkan per csv_index).
+"""
+import csv
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+import local_server  # noqa: F401  (menambahkan root repo ke sys.path)
+import scrape_all_anime as saa
+
+
+def make_data(i):
+    data = {field: f"{field} {i}" for field in saa.ANIME_FIELDS}
+    data.update({
+        "myanimelist_id": i,
+        "alternative_titles": {"Japanese": "カウボーイビバップ", "English": f"Cowboy Bebop {i}"},
+        "characters": [{"name": "Spiegel, Spike", "role": "Main"}, {"name": "Valentine, Faye", "role": "Main"}],
+        "description": "In the year 2071, humanity has colonized several of the planets. " * 10,
+        "csv_index": i,
+    })
+    return data
+
+
+legacy_lock = threading.Lock()
+
+
+def legacy_append(data, filename):
+    """Salinan append_to_csv lama di scrape_all_anime.py."""
+    row = {k: json.dumps(v, ensure_ascii=False) if isinstance(v, (list, dict)) else v for k, v in data.items()}
+    fieldnames = list(row.keys())
+    fieldnames.remove('csv_index')
+    fieldnames.insert(0, 'csv_index')
+    with legacy_lock:
+        write_header = not os.path.exists(filename)
+        with open(filename, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            if write_header:
+                writer.writeheader()
+            writer.writerow(row)
+
+
+def run(append, num_rows, num_workers, close=None):
+    """Tulis num_rows baris dari num_workers thread; return (latensi per baris, total detik)."""
+    rows = [make_data(i) for i in range(num_rows)]
+    latencies = []
+
+    def work(data):
+        start = time.perf_counter()
+        append(data)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        list(executor.map(work, rows))
+    if close:
+        close()
+    return latencies, time.perf_counter() - start
+
+
+def print_result(label, latencies, total):
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{label:<22} worker p50 {statistics.median(latencies) * 1e6:7.1f}µs  p99 {p99 * 1e6:8.1f}µs  "
+          f"max {latencies[-1] * 1e3:7.2f}ms  | total {total:.2f}s ({len(latencies) / total:,.0f} baris/s)")
+
+
+if __name__ == "__main__":
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    num_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_file = os.path.join(tmp, "legacy.csv")
+        legacy = run(lambda data: legacy_append(data, legacy_file), num_rows, num_workers)
+
+        queued_file = os.path.join(tmp, "queued.csv")
+        queued = run(lambda data: saa.append_to_csv(data, queued_file), num_rows, num_workers, saa.close_writers)
+
+        df_legacy = pd.read_csv(legacy_file).sort_values("csv_index", ignore_index=True)
+        df_queued = pd.read_csv(queued_file).sort_values("csv_index", ignore_index=True)
+        same = df_legacy[df_queued.columns].equals(df_queued)
+
+    print(f"{num_rows} baris, {num_workers} worker, batch {saa.writers[queued_file].writer.batch_size}\n")
+    print_result("append_to_csv lama", *legacy)
+    print_result("BackgroundWriter", *queued)
+    print(f"\nParity isi file: {'OK' if same else 'BEDA'}")
+    if not same:
+        sys.exit(1)
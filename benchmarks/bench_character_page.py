@@ -0,0 +1,103 @@
+"""
+Benchmark extractor halaman character: cara lama (str(parent) → regex cutoff → <br> di-replace
+→ BeautifulSoup kedua) vs text_after_header (jalan di sibling h2 pada tree pertama).
+
+    python benchmarks/bench_character_page.py [ROUNDS]
+
+parse_character_page dijalankan dengan kedua versi; dict hasilnya (attributes, description,
+spoiler) harus identik. Exit 1 kalau ada yang beda.
+"""
+import os
+import re
+import sys
+import time
+
+import local_server  # noqa: F401  (menambahkan root repo ke sys.path)
+from html_parser import make_soup
+import scrape_characters
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURES = {
+    "character_spike_spiegel.html": (1, "https://myanimelist.net/character/1/Spike_Spiegel"),
+    "character_faye_valentine.html": (2, "https://myanimelist.net/character/2/Faye_Valentine"),
+}
+
+# Varian tambahan dari fixture Spike: <br> di tengah spoiler, spoiler tanpa isi, komentar HTML
+VARIANTS = {
+    "spoiler multi-baris": lambda html: html.replace("&amp; left after", "&amp; left<br>\n<i>after</i>"),
+    "spoiler kosong": lambda html: html.replace('<span class="spoiler_content"', '<span class="spoiler_hidden"'),
+    "komentar html": lambda html: html.replace("Blood type: O<br />", "Blood type: O<!-- x: y --><br />"),
+}
+
+
+def legacy_text_after_header(header):
+    """Salinan jalur utama parse_character_page versi lama (sebelum text_after_header)."""
+    parent_html = str(header.parent)
+    h2_html = str(header)
+    h2_start = parent_html.find(h2_html)
+    remaining_html = parent_html[h2_start + len(h2_html):]
+
+    matches = []
+    for pattern in (r'<div[^>]*sUaidzctQfngSNMH[^>]*>', r'<table', r'<h[23]', r'<div[^>]*normal_header[^>]*>'):
+        match = re.search(pattern, remaining_html, re.IGNORECASE)
+        if match:
+            matches.append(match.start())
+    content_after_h2 = remaining_html[:min(matches)] if matches else remaining_html
+
+    content_after_h2 = re.sub(r'<br\s*/?>', '\n', content_after_h2, flags=re.IGNORECASE)
+    temp_soup = make_soup(content_after_h2)
+    for spoiler_div in temp_soup.find_all('div', class_='spoiler'):
+        spoiler_content = spoiler_div.find('span', class_='spoiler_content')
+        if spoiler_content:
+            for button in spoiler_content.find_all('input'):
+                button.decompose()
+            spoiler_text = spoiler_content.get_text(separator=' ').strip()
+            spoiler_div.replace_with(f' {spoiler_text}')
+        else:
+            spoiler_div.decompose()
+    return temp_soup.get_text()
+
+
+def parse(html, character_id, url, extractor):
+    scrape_characters.text_after_header = extractor
+    return scrape_characters.parse_character_page(html, character_id, url)
+
+
+def measure(html, character_id, url, extractor, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parse(html, character_id, url, extractor)
+    return (time.perf_counter() - start) / rounds
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    new_extractor = scrape_characters.text_after_header
+    mismatches = 0
+
+    cases = []
+    for fixture, (character_id, url) in FIXTURES.items():
+        with open(os.path.join(FIXTURES_DIR, fixture), encoding="utf-8") as f:
+            html = f.read()
+        cases.append((fixture, html, character_id, url))
+        if fixture == "character_spike_spiegel.html":
+            cases += [(f"  {name}", mutate(html), character_id, url) for name, mutate in VARIANTS.items()]
+
+    print(f"Rounds: {rounds}\n")
+    print(f"{'fixture':<34} {'lama':>9} {'tree-walk':>10} {'speedup':>8}   parity")
+    for name, html, character_id, url in cases:
+        old = parse(html, character_id, url, legacy_text_after_header)
+        new = parse(html, character_id, url, new_extractor)
+        same = old == new
+        mismatches += not same
+        old_time = measure(html, character_id, url, legacy_text_after_header, rounds)
+        new_time = measure(html, character_id, url, new_extractor, rounds)
+        print(f"{name:<34} {old_time * 1000:7.2f}ms {new_time * 1000:8.2f}ms {old_time / new_time:7.2f}x"
+              f"   {'OK' if same else 'BEDA'}")
+        if not same:
+            print(f"    lama     : {old}")
+            print(f"    tree-walk: {new}")
+
+    scrape_characters.text_after_header = new_extractor
+    if mismatches:
+        sys.exit(1)
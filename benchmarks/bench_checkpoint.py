@@ -0,0 +1,83 @@
+"""
+Benchmark resume: membaca seluruh output CSV (cara lama) vs checkpoint sidecar (checkpoint.py).
+
+    python benchmarks/bench_checkpoint.py [NUM_ROWS]
+
+Output berisi NUM_ROWS baris anime (dari fixture) ditulis lewat BackgroundWriter yang mencatat
+myanimelist_id ke checkpoint. Lalu diukur waktu mendapatkan set id yang sudah selesai dengan:
+    pd.read_csv seluruh file (scrape_all_anime.py lama)
+    pd.read_csv hanya kolom myanimelist_id (dipakai untuk membangun ulang checkpoint yang hilang)
+    Checkpoint (load file sidecar)
+Ketiganya harus menghasilkan set yang sama.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+import local_server  # noqa: F401  (menambahkan root repo ke sys.path)
+import anime_schema
+from checkpoint import Checkpoint, COMPLETED
+from csv_writer import BackgroundWriter, CsvAppendWriter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+COLUMNS = ["csv_index"] + list(anime_schema.DEFAULT_FIELDS)
+
+
+def write_output(path, checkpoint, num_rows):
+    with open(os.path.join(FIXTURES_DIR, "anime_cowboy_bebop.html"), encoding="utf-8") as f:
+        page = anime_schema.parse_anime_page(f.read(), 1, "https://myanimelist.net/anime/1", anime_schema.DEFAULT_FIELDS)
+    row = {k: json.dumps(v, ensure_ascii=False) if isinstance(v, (list, dict)) else v for k, v in page.items()}
+    with BackgroundWriter(CsvAppendWriter(path, COLUMNS, batch_size=1000), checkpoint, "myanimelist_id") as writer:
+        for i in range(num_rows):
+            writer.write(dict(row, csv_index=i, myanimelist_id=i + 1))
+
+
+def full_read(path):
+    return set(pd.read_csv(path)["myanimelist_id"].dropna().astype(int).tolist())
+
+
+def column_read(path):
+    return set(pd.read_csv(path, usecols=["myanimelist_id"])["myanimelist_id"].dropna().astype(int).tolist())
+
+
+def checkpoint_read(path):
+    checkpoint = Checkpoint(path)
+    ids = checkpoint.ids(COMPLETED)
+    checkpoint.close()
+    return ids
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "mal_anime_scraped.csv")
+        checkpoint_path = output + ".checkpoint"
+        checkpoint = Checkpoint(checkpoint_path)
+        write_output(output, checkpoint, num_rows)
+        checkpoint.close()
+
+        full, full_time = timed(full_read, output)
+        column, column_time = timed(column_read, output)
+        ids, checkpoint_time = timed(checkpoint_read, checkpoint_path)
+        output_size, checkpoint_size = os.path.getsize(output), os.path.getsize(checkpoint_path)
+
+    print(f"{num_rows} baris, output {output_size / 1e6:.1f} MB, checkpoint {checkpoint_size / 1e3:.0f} KB\n")
+    print(f"{'read_csv seluruh file':<30} {full_time * 1000:9.1f} ms")
+    print(f"{'read_csv kolom myanimelist_id':<30} {column_time * 1000:9.1f} ms")
+    print(f"{'checkpoint':<30} {checkpoint_time * 1000:9.1f} ms  ({full_time / checkpoint_time:.0f}x lebih cepat)")
+
+    same = full == column == ids and len(ids) == num_rows
+    print(f"\nParity: {'OK' if same else 'BEDA'}")
+    if not same:
+        sys.exit(1)
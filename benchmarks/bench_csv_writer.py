@@ -0,0 +1,96 @@
+"""
+Benchmark writer output character: cara lama (read_csv → concat → to_csv per baris)
+vs CsvAppendWriter (append-only, flush per batch).
+
+    python benchmarks/bench_csv_writer.py [LEGACY_ROWS] [APPEND_ROWS]
+
+Biaya per baris dicetak per blok baris seiring file membesar: cara lama naik linear
+(seluruh file dibaca dan ditulis ulang tiap baris), writer append-only tetap konstan.
+Isi file kedua cara untuk LEGACY_ROWS baris pertama harus sama persis (dibaca pandas).
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+import local_server  # noqa: F401  (menambahkan root repo ke sys.path)
+from csv_writer import CsvAppendWriter
+from scrape_characters import CSV_COLUMNS
+
+
+def make_row(i):
+    attributes = [{"name": "Birthdate", "value": "June 26, 2044"}, {"name": "Height", "value": "185 cm"}]
+    return {
+        "character_id": i,
+        "full_name": f"Spiegel, Spike {i}",
+        "alternate_name": "スパイク・スピーゲル",
+        "name": f"Spiegel, Spike {i}",
+        "url": f"https://myanimelist.net/character/{i}/Spike_Spiegel",
+        "attributes": json.dumps(attributes, ensure_ascii=False),
+        "description": "Spike is a bounty hunter, \"cool\", and laid-back, with a past. " * 8,
+    }
+
+
+def legacy_append(data, filename):
+    """Salinan append_to_csv lama di scrape_characters.py."""
+    data_clean = {col: data.get(col) for col in CSV_COLUMNS}
+    if os.path.exists(filename):
+        df_existing = pd.read_csv(filename)
+        df_new = pd.DataFrame([data_clean])
+        df_combined = pd.concat([df_existing, df_new], ignore_index=True)
+        df_combined.to_csv(filename, index=False)
+    else:
+        pd.DataFrame([data_clean], columns=CSV_COLUMNS).to_csv(filename, index=False)
+
+
+def run(write, num_rows, block):
+    """Tulis num_rows baris; return list (baris ke-, µs per baris di blok itu)."""
+    costs = []
+    start = time.perf_counter()
+    for i in range(1, num_rows + 1):
+        write(make_row(i))
+        if i % block == 0:
+            now = time.perf_counter()
+            costs.append((i, (now - start) / block * 1e6))
+            start = now
+    return costs
+
+
+def print_costs(label, costs, stride=1):
+    print(f"\n{label}")
+    for rows, cost in costs[::stride]:
+        print(f"    {rows:>8} baris: {cost:10.1f} µs/baris")
+
+
+if __name__ == "__main__":
+    legacy_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    append_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_file = os.path.join(tmp, "legacy.csv")
+        legacy = run(lambda row: legacy_append(row, legacy_file), legacy_rows, max(1, legacy_rows // 10))
+
+        parity_file = os.path.join(tmp, "parity.csv")
+        with CsvAppendWriter(parity_file, CSV_COLUMNS, lineterminator="\n") as writer:
+            for i in range(1, legacy_rows + 1):
+                writer.write(make_row(i))
+        same = pd.read_csv(legacy_file).equals(pd.read_csv(parity_file))
+
+        append_file = os.path.join(tmp, "append.csv")
+        with CsvAppendWriter(append_file, CSV_COLUMNS, lineterminator="\n") as writer:
+            appended = run(writer.write, append_rows, max(1, append_rows // 20))
+        size_mb = os.path.getsize(append_file) / 1e6
+
+    print_costs(f"Cara lama (read_csv → concat → to_csv), {legacy_rows} baris:", legacy)
+    print_costs(f"CsvAppendWriter (batch {writer.batch_size}), {append_rows} baris ({size_mb:.0f} MB):", appended, stride=2)
+
+    first, last = appended[0][1], appended[-1][1]
+    print(f"\nCara lama: baris terakhir {legacy[-1][1] / legacy[0][1]:.1f}x lebih mahal dari baris awal")
+    print(f"Append-only: baris terakhir {last / first:.2f}x dari baris awal, "
+          f"{legacy[-1][1] / last:.0f}x lebih murah dari cara lama di {legacy_rows} baris")
+    print(f"Parity isi file: {'OK' if same else 'BEDA'}")
+    if not same:
+        sys.exit(1)
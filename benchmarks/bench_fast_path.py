@@ -0,0 +1,113 @@
+"""
+Differential harness + benchmark fast path regex (fast_parse_anime_page) vs extractor DOM.
+
+    python benchmarks/bench_fast_path.py [PATH ...]
+
+Tanpa argumen: fixture anime di benchmarks/fixtures plus varian markup yang dibuat dari fixture.
+PATH bisa file .html / .html.gz atau folder (mis. page_cache/objects) untuk menguji semua halaman tersimpan.
+
+Untuk setiap halaman yang dikenali fast path, hasilnya harus identik dengan full parse DOM.
+Halaman yang tidak dikenali (None) atau gagal validasi memang jatuh ke DOM; hanya dihitung.
+Exit 1 kalau ada hasil yang berbeda.
+"""
+import gzip
+import os
+import sys
+import time
+
+import local_server  # noqa: F401  (menambahkan root repo ke sys.path)
+import anime_schema
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURES = ["anime_cowboy_bebop.html", "anime_na_score_singular.html"]
+
+# Varian markup dari fixture Cowboy Bebop
+VARIANTS = {
+    "entity di judul": lambda html: html.replace("<strong>Cowboy Bebop</strong>", "<strong>Cowboy &amp; Bebop&#039;s</strong>"),
+    "synopsis dengan <br> dan <i>": lambda html: html.replace("Enter Spike Spiegel", "<br />\n<br />\n<i>Enter</i> Spike Spiegel"),
+    "Studio singular": lambda html: html.replace("Studios:</span>", "Studio:</span>"),
+    "Members tanpa koma": lambda html: html.replace("1,912,345", "912"),
+    "tanpa gambar": lambda html: html.replace('data-src="https://cdn.myanimelist.net/images/anime/4/19644.jpg"', ""),
+    "div bersarang di Information": lambda html: html.replace("Original </div>", "<div>Original</div> </div>"),
+    "komentar di leftside": lambda html: html.replace("<h2>Information</h2>", "<!-- info --><h2>Information</h2>"),
+    "og:url atribut terbalik": lambda html: html.replace(
+        '<meta property="og:url" content="https://myanimelist.net/anime/1/Cowboy_Bebop">',
+        '<meta content="https://myanimelist.net/anime/1/Cowboy_Bebop" property="og:url">'),
+}
+
+
+def read_page(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        return f.read().decode("utf-8", errors="replace")
+
+
+def collect_pages(paths):
+    pages = []
+    if not paths:
+        for fixture in FIXTURES:
+            html = read_page(os.path.join(FIXTURES_DIR, fixture))
+            pages.append((fixture, html))
+            if fixture == "anime_cowboy_bebop.html":
+                pages += [(f"  {name}", mutate(html)) for name, mutate in VARIANTS.items()]
+        return pages
+
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.endswith((".html", ".html.gz")):
+                        pages.append((os.path.join(root, name), read_page(os.path.join(root, name))))
+        else:
+            pages.append((path, read_page(path)))
+    return pages
+
+
+def dom_parse(html):
+    anime_schema.FAST_PARSE, anime_schema.PARTIAL_PARSE = False, False
+    return anime_schema.parse_anime_page(html, 1, "https://myanimelist.net/anime/1")
+
+
+def throughput(pages, fast, partial, rounds=5):
+    anime_schema.FAST_PARSE, anime_schema.PARTIAL_PARSE = fast, partial
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _, html in pages:
+            anime_schema.parse_anime_page(html, 1, "https://myanimelist.net/anime/1")
+    return rounds * len(pages) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    pages = collect_pages(sys.argv[1:])
+    counts = {"fast path": 0, "gagal validasi → DOM": 0, "tidak dikenali → DOM": 0, "BEDA": 0}
+
+    for name, html in pages:
+        fast = anime_schema.fast_parse_anime_page(html, 1, "https://myanimelist.net/anime/1")
+        if fast is None:
+            status = "tidak dikenali → DOM"
+        else:
+            dom = dom_parse(html)
+            if fast != dom:
+                status = "BEDA"
+                print(f"{name}: BEDA")
+                for key in dom:
+                    if fast.get(key) != dom[key]:
+                        print(f"    {key}: fast={fast.get(key)!r} dom={dom[key]!r}")
+                counts[status] += 1
+                continue
+            status = "fast path" if anime_schema.required_fields_found(fast) else "gagal validasi → DOM"
+        counts[status] += 1
+        if len(pages) <= 50:
+            print(f"{name:<40} {status}")
+
+    print("\n" + " | ".join(f"{k}: {v}" for k, v in counts.items()))
+
+    full = throughput(pages, fast=False, partial=False)
+    partial = throughput(pages, fast=False, partial=True)
+    fast = throughput(pages, fast=True, partial=True)
+    print(f"\nFull parse DOM        : {full:8.1f} halaman/s")
+    print(f"Partial parse DOM     : {partial:8.1f} halaman/s")
+    print(f"Fast path + fallback  : {fast:8.1f} halaman/s ({fast / full:.1f}x vs full, {fast / partial:.1f}x vs partial)")
+
+    if counts["BEDA"]:
+        sys.exit(1)
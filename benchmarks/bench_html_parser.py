@@ -0,0 +1,63 @@
+"""
+Benchmark + cek parity backend HTML_PARSER (html.parser vs lxml) di halaman fixture.
+
+    python benchmarks/bench_html_parser.py [ROUNDS]
+
+Setiap extractor dijalankan di setiap fixture dengan setiap backend. Output semua backend
+harus identik dengan html.parser (baseline lama); kalau ada yang beda, script exit 1.
+"""
+import json
+import sys
+import time
+
+import local_server  # noqa: F401  (menambahkan root repo ke sys.path)
+from bench_parsers import CASES, load_fixture
+import html_parser
+
+
+def run_case(backend, func, html, rounds):
+    html_parser.parser = backend
+    result = func(html)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(html)
+    elapsed = (time.perf_counter() - start) / rounds
+    return json.dumps(result, ensure_ascii=False, sort_keys=True), elapsed
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    backends = html_parser.available_backends()
+    baseline = "html.parser"
+    mismatches = 0
+
+    print(f"Backends: {', '.join(backends)} | Rounds: {rounds}\n")
+    print(f"{'extractor':<22} {'fixture':<38} " + " ".join(f"{b:>12}" for b in backends) + "   parity")
+
+    totals = {b: 0.0 for b in backends}
+    for name, fixture, func in CASES:
+        html = load_fixture(fixture)
+        outputs, timings = {}, {}
+        for backend in backends:
+            outputs[backend], timings[backend] = run_case(backend, func, html, rounds)
+            totals[backend] += timings[backend]
+        same = all(outputs[b] == outputs[baseline] for b in backends)
+        mismatches += not same
+        print(f"{name:<22} {fixture:<38} "
+              + " ".join(f"{timings[b] * 1000:10.2f}ms" for b in backends)
+              + ("   OK" if same else "   BEDA"))
+        if not same:
+            for b in backends:
+                if outputs[b] != outputs[baseline]:
+                    print(f"    {baseline}: {outputs[baseline][:300]}")
+                    print(f"    {b}: {outputs[b][:300]}")
+
+    print("\nTotal per backend: " + ", ".join(f"{b} {totals[b] * 1000:.1f}ms" for b in backends))
+    for b in backends:
+        if b != baseline:
+            print(f"Speedup {b} vs {baseline}: {totals[baseline] / totals[b]:.2f}x")
+
+    if mismatches:
+        print(f"\n✗ {mismatches} extractor/fixture menghasilkan output berbeda")
+        sys.exit(1)
+    print("\n✓ Semua backend menghasilkan output identik")
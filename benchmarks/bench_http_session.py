@@ -0,0 +1,52 @@
+"""
+Benchmark: requests.get biasa vs keep-alive session dari http_session.
+
+    python benchmarks/bench_http_session.py [NUM_WORKERS] [NUM_REQUESTS]
+
+Catatan: server lokal hanya HTTP, jadi yang diukur hanya biaya handshake TCP.
+Ke myanimelist.net (HTTPS) selisihnya lebih besar karena ada handshake TLS juga.
+"""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from local_server import start_server
+import http_session
+import rate_limiter
+
+
+def run(fetch, url, num_workers, num_requests):
+    def task(_):
+        res = fetch(url, timeout=30)
+        return res.status_code
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        codes = list(executor.map(task, range(num_requests)))
+    elapsed = time.perf_counter() - start
+    assert all(code == 200 for code in codes)
+    return num_requests / elapsed
+
+
+if __name__ == "__main__":
+    num_workers = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    num_requests = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    server, base_url = start_server()
+    url = base_url + "/anime/1"
+    http_session.init_pool(num_workers)
+    # Rate limiter dimatikan supaya yang terukur hanya biaya koneksi
+    rate_limiter.limiter = rate_limiter.RateLimiter(rate=1e9, max_rate=1e9, burst=1e9)
+
+    try:
+        before = run(requests.get, url, num_workers, num_requests)
+        after = run(http_session.fetch, url, num_workers, num_requests)
+    finally:
+        server.shutdown()
+
+    print(f"Workers: {num_workers} | Requests: {num_requests}")
+    print(f"requests.get (tanpa session) : {before:8.1f} req/s")
+    print(f"http_session.fetch (keep-alive): {after:8.1f} req/s")
+    print(f"Speedup: {after / before:.2f}x")
@@ -0,0 +1,120 @@
+"""
+Benchmark format output anime: CSV (semua kolom string) vs dataset Parquet bertipe (parquet_writer).
+
+    python benchmarks/bench_output_formats.py [NUM_ROWS]
+
+Baris dibuat dari hasil parse fixture (ANIME_FIELDS=all + characters) dengan angka divariasikan.
+Dicetak ukuran file, waktu tulis, dan waktu load + konversi tipe yang biasa dilakukan konsumen
+(Score/Members/Ranked ke angka, Genres ke list, characters dari JSON) untuk kedua format.
+Hasil load kedua format harus sama.
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+import local_server  # noqa: F401  (menambahkan root repo ke sys.path)
+import anime_schema
+import parquet_writer
+from csv_writer import CsvAppendWriter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+COLUMNS = ["csv_index"] + list(anime_schema.ALL_FIELDS)
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def make_rows(num_rows):
+    characters = anime_schema.parse_characters(load_fixture("anime_cowboy_bebop_characters.html"))
+    pages = [anime_schema.parse_anime_page(load_fixture(name), 1, "https://myanimelist.net/anime/1", anime_schema.ALL_FIELDS)
+             for name in ("anime_cowboy_bebop.html", "anime_na_score_singular.html")]
+    rng = random.Random(0)
+    rows = []
+    for i in range(num_rows):
+        row = dict(pages[i % 2], csv_index=i, myanimelist_id=i + 1, characters=characters[:rng.randint(0, len(characters))])
+        if row["Score"] != "N/A":
+            row["Score"] = f"{rng.uniform(5, 9.5):.2f}"
+            row["Ranked"] = f"#{rng.randint(1, 20000):,}"
+        row["Popularity"] = f"#{rng.randint(1, 20000):,}"
+        row["Members"] = f"{rng.randint(100, 4_000_000):,}"
+        row["Favorites"] = f"{rng.randint(0, 200_000):,}"
+        rows.append(row)
+    return rows
+
+
+def write_csv(rows, path):
+    with CsvAppendWriter(path, COLUMNS, batch_size=1000) as writer:
+        for data in rows:
+            writer.write({k: json.dumps(v, ensure_ascii=False) if isinstance(v, (list, dict)) else v
+                          for k, v in data.items()})
+
+
+def write_parquet(rows, path):
+    with parquet_writer.ParquetPartWriter(path, COLUMNS) as writer:
+        for data in rows:
+            writer.write(data)
+
+
+def load_csv(path):
+    """Load CSV + konversi tipe per baris seperti yang selama ini dilakukan konsumen."""
+    df = pd.read_csv(path)
+    for column in ("Score",):
+        df[column] = pd.to_numeric(df[column], errors="coerce")
+    for column in ("Episodes", "Ranked", "Popularity", "Members", "Favorites"):
+        df[column] = pd.to_numeric(df[column].astype(str).str.lstrip("#").str.replace(",", ""),
+                                   errors="coerce").astype("Int64")
+    df["Genres"] = df["Genres"].map(parquet_writer.parse_list)
+    df["characters"] = df["characters"].map(parquet_writer.parse_json)
+    return df
+
+
+def load_parquet(path):
+    return pd.read_parquet(path)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def dir_size(path):
+    return sum(os.path.getsize(f) for f in parquet_writer.part_files(path))
+
+
+if __name__ == "__main__":
+    parquet_writer.require_pyarrow()
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rows = make_rows(num_rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "anime.csv")
+        parquet_path = os.path.join(tmp, "anime.parquet")
+        _, csv_write = timed(write_csv, rows, csv_path)
+        _, parquet_write = timed(write_parquet, rows, parquet_path)
+        df_csv, csv_load = timed(load_csv, csv_path)
+        df_parquet, parquet_load = timed(load_parquet, parquet_path)
+        csv_size, parquet_size = os.path.getsize(csv_path), dir_size(parquet_path)
+
+    print(f"{num_rows} baris, kolom: {len(COLUMNS)}\n")
+    print(f"{'format':<10} {'ukuran':>10} {'tulis':>9} {'load+tipe':>10}")
+    print(f"{'csv':<10} {csv_size / 1e6:8.2f}MB {csv_write:8.2f}s {csv_load:9.2f}s")
+    print(f"{'parquet':<10} {parquet_size / 1e6:8.2f}MB {parquet_write:8.2f}s {parquet_load:9.2f}s")
+    print(f"\nParquet {csv_size / parquet_size:.1f}x lebih kecil, load {csv_load / parquet_load:.1f}x lebih cepat")
+
+    same = True
+    for column in ("Score", "Ranked", "Members", "Favorites"):
+        same &= df_csv[column].astype("Float64").equals(df_parquet[column].astype("Float64"))
+    same &= [list(g) if g is not None else None for g in df_parquet["Genres"]] == df_csv["Genres"].tolist()
+    same &= [[c["id"] for c in chars] for chars in df_parquet["characters"]] == \
+            [[c["id"] for c in chars] for chars in df_csv["characters"]]
+    print(f"Parity nilai bertipe: {'OK' if same else 'BEDA'}")
+    if not same:
+        sys.exit(1)
@@ -0,0 +1,79 @@
+"""
+Benchmark: parsing di thread I/O (inline) vs process pool parse_pool, end-to-end run_threads
+ke server lokal yang menyajikan halaman fixture (anime + /characters).
+
+    python benchmarks/bench_parse_pool.py [NUM_JOBS] [NUM_WORKERS]
+
+Dengan parsing inline throughput mentok di sekitar satu core; dengan process pool
+naik sesuai jumlah core (PARSE_WORKERS, default semua core).
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+from local_server import StandInHandler, start_server
+import parse_pool
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+
+class FixtureHandler(StandInHandler):
+    anime = read_fixture("anime_cowboy_bebop.html")
+    characters = read_fixture("anime_cowboy_bebop_characters.html")
+
+    def do_GET(self):
+        body = self.characters if self.path.endswith("/characters") else self.anime
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def run(saa, base_url, num_jobs, num_workers):
+    saa.OUTPUT_FILE = saa.OUTPUT_CHARACTERS = saa.OUTPUT_ANIME_CHARACTERS = os.devnull
+    jobs = [saa.new_job(i, f"{base_url}/anime/{i}/Cowboy_Bebop") for i in range(1, num_jobs + 1)]
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        saved, failed = saa.run_threads(jobs, num_workers)
+    elapsed = time.perf_counter() - start
+    assert saved == num_jobs, (saved, failed)
+    return num_jobs / elapsed
+
+
+if __name__ == "__main__":
+    num_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    num_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+    # Pool dibuat sebelum thread apa pun (server, worker I/O)
+    processes = parse_pool.start() or 1
+
+    server, base_url = start_server(FixtureHandler)
+    import http_session
+    import rate_limiter
+    import scrape_all_anime as saa
+
+    saa.ANIME_URL = base_url + "/anime/{}"
+    http_session.init_pool(num_workers)
+    # Rate limiter dimatikan supaya yang terukur hanya fetch + parse
+    rate_limiter.limiter = rate_limiter.RateLimiter(rate=1e9, max_rate=1e9, burst=1e9)
+
+    try:
+        executor, parse_pool.executor = parse_pool.executor, None
+        inline = run(saa, base_url, num_jobs, num_workers)
+        parse_pool.executor = executor
+        pooled = run(saa, base_url, num_jobs, num_workers)
+    finally:
+        server.shutdown()
+
+    print(f"Jobs: {num_jobs} | I/O workers: {num_workers} | CPU cores: {os.cpu_count()} | Parser processes: {processes}")
+    print(f"Parsing inline di thread I/O : {inline:8.1f} anime/s")
+    print(f"Parsing di process pool     : {pooled:8.1f} anime/s")
+    print(f"Speedup: {pooled / inline:.2f}x")
@@ -0,0 +1,167 @@
+"""
+Benchmark throughput semua extractor di halaman fixture (benchmarks/fixtures), dibandingkan
+dengan baseline tersimpan.
+
+    python benchmarks/bench_parsers.py [ROUNDS] [--save-baseline]
+
+Per extractor/fixture dicetak halaman/s, p50/p99 waktu parse, dan peak memori (tracemalloc).
+Fixture mencakup edge case: score N/A + Genre/Producer singular, spoiler di halaman
+character, daftar character kosong, halaman musim tanpa judul.
+
+--save-baseline menulis hasil ke benchmarks/baseline_parsers.json. Tanpa flag itu, hasil
+dibandingkan dengan baseline: exit 1 kalau output extractor berubah (hash hasil beda) atau
+p50 lebih lambat dari REGRESSION_THRESHOLD x baseline (longgar karena noise antar run).
+Waktu hanya sebanding di mesin yang sama, jadi simpan ulang baseline kalau pindah mesin.
+"""
+import gc
+import hashlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import local_server  # noqa: F401  (menambahkan root repo ke sys.path)
+import html_parser
+import anime_schema
+import scrape_characters
+import get_all_anime_seasonal
+import get_season
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline_parsers.json")
+REGRESSION_THRESHOLD = 1.5
+
+
+def parse_anime(anime_id, fast=True, partial=True, fields=anime_schema.DEFAULT_FIELDS):
+    def run(html):
+        # Mode parser global di-set hanya selama panggilan ini, supaya case lain tetap memakai setting .env
+        saved = anime_schema.FAST_PARSE, anime_schema.PARTIAL_PARSE
+        anime_schema.FAST_PARSE, anime_schema.PARTIAL_PARSE = fast, partial
+        try:
+            return anime_schema.parse_anime_page(html, anime_id, f"https://myanimelist.net/anime/{anime_id}", fields)
+        finally:
+            anime_schema.FAST_PARSE, anime_schema.PARTIAL_PARSE = saved
+    return run
+
+
+# (nama extractor, fixture, fungsi(html) -> hasil)
+CASES = [
+    ("parse_anime_page", "anime_cowboy_bebop.html", parse_anime(1)),
+    ("parse_anime_page", "anime_na_score_singular.html", parse_anime(59999)),
+    ("parse_anime_page[dom]", "anime_cowboy_bebop.html", parse_anime(1, fast=False, partial=False)),
+    ("parse_anime_page[dom]", "anime_na_score_singular.html", parse_anime(59999, fast=False, partial=False)),
+    ("parse_anime_page[all]", "anime_cowboy_bebop.html", parse_anime(1, fields=anime_schema.ALL_FIELDS)),
+    ("parse_characters", "anime_cowboy_bebop_characters.html", anime_schema.parse_characters),
+    ("parse_characters", "anime_empty_characters.html", anime_schema.parse_characters),
+    ("parse_character_page", "character_spike_spiegel.html",
+     lambda html: scrape_characters.parse_character_page(html, 1, "https://myanimelist.net/character/1/Spike_Spiegel")),
+    ("parse_character_page", "character_faye_valentine.html",
+     lambda html: scrape_characters.parse_character_page(html, 2, "https://myanimelist.net/character/2/Faye_Valentine")),
+    ("parse_season_page", "season_1998_spring.html",
+     lambda html: get_all_anime_seasonal.parse_season_page(html, "Spring 1998")),
+    ("parse_season_page", "season_2030_winter_empty.html",
+     lambda html: get_all_anime_seasonal.parse_season_page(html, "Winter 2030")),
+    ("parse_season_links", "season_archive.html", get_season.parse_season_links),
+]
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def output_hash(result):
+    dumped = json.dumps(result, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(dumped.encode("utf-8")).hexdigest()[:16]
+
+
+def measure(func, html, rounds):
+    result = func(html)  # warm-up (import lazy, cache regex)
+    gc.collect()  # sampah dari case sebelumnya jangan ikut terukur di sini
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(html)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "pages_per_sec": round(len(timings) / sum(timings), 1),
+        "p50_ms": round(statistics.median(timings) * 1000, 3),
+        "p99_ms": round(statistics.quantiles(timings, n=100, method="inclusive")[98] * 1000, 3),
+        "peak_kb": round(peak / 1024),
+        "output": output_hash(result),
+    }
+
+
+def current_config():
+    return {
+        "html_parser": html_parser.parser,
+        "python": platform.python_version(),
+        "machine": f"{platform.machine()} x{os.cpu_count()}",
+    }
+
+
+def load_baseline():
+    if not os.path.exists(BASELINE_FILE):
+        return None
+    with open(BASELINE_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(result, base):
+    """Status satu case terhadap baseline: OK / OUTPUT BERUBAH / LEBIH LAMBAT / baru."""
+    if base is None:
+        return "baru", False
+    if result["output"] != base["output"]:
+        return "OUTPUT BERUBAH", True
+    ratio = result["p50_ms"] / base["p50_ms"]
+    if ratio > REGRESSION_THRESHOLD:
+        return f"LEBIH LAMBAT {ratio:.2f}x", True
+    return f"OK {ratio:.2f}x", False
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    rounds = int(args[0]) if args else 50
+    save = "--save-baseline" in sys.argv
+
+    baseline = None if save else load_baseline()
+    config = current_config()
+    print(f"Rounds: {rounds} | " + " | ".join(f"{k}: {v}" for k, v in config.items()))
+    if baseline is not None and baseline["config"] != config:
+        print(f"! Baseline dibuat dengan config berbeda: {baseline['config']}")
+    print()
+    print(f"{'extractor':<22} {'fixture':<34} {'hal/s':>8} {'p50':>9} {'p99':>9} {'peak':>8}   vs baseline")
+
+    results = {}
+    failed = 0
+    for name, fixture, func in CASES:
+        key = f"{name} {fixture}"
+        results[key] = result = measure(func, load_fixture(fixture), rounds)
+        base = baseline["cases"].get(key) if baseline else None
+        status, bad = compare(result, base) if baseline else ("-", False)
+        failed += bad
+        print(f"{name:<22} {fixture:<34} {result['pages_per_sec']:8.1f} {result['p50_ms']:7.2f}ms "
+              f"{result['p99_ms']:7.2f}ms {result['peak_kb']:6d}KB   {status}")
+
+    if save:
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"config": config, "rounds": rounds, "cases": results}, f, indent=2)
+            f.write("\n")
+        print(f"\nBaseline disimpan ke {os.path.relpath(BASELINE_FILE)}")
+    elif baseline is None:
+        print("\nBelum ada baseline; jalankan dengan --save-baseline")
+    elif failed:
+        print(f"\n✗ {failed} case berubah output atau lebih lambat dari {REGRESSION_THRESHOLD}x baseline")
+        sys.exit(1)
+    else:
+        print("\n✓ Semua case sesuai baseline")
@@ -0,0 +1,76 @@
+"""
+Parity + waktu + memori: full parse vs partial parse (slice_anime_page) halaman anime.
+
+    python benchmarks/bench_partial_parse.py [ROUNDS]
+
+Untuk setiap fixture: hasil parse_anime_page dengan PARTIAL_PARSE harus sama persis dengan
+full parse. Varian rusak (leftside/h1/synopsis hilang) harus jatuh ke full parse
+dan tetap menghasilkan dict yang sama. Exit 1 kalau ada yang beda.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+import local_server  # noqa: F401  (menambahkan root repo ke sys.path)
+import anime_schema
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURES = ["anime_cowboy_bebop.html", "anime_na_score_singular.html"]
+
+# Varian struktur yang tidak dikenali slice_anime_page → harus fallback ke full parse
+BROKEN_VARIANTS = {
+    "tanpa div.leftside": lambda html: html.replace('class="leftside"', 'class="left-column"'),
+    "tanpa rightside": lambda html: html.replace('<div class="rightside', '<div class="right-column'),
+    "h1 tanpa class": lambda html: html.replace('<h1 class="title-name h1_bold_none">', "<h1>"),
+    "tanpa synopsis": lambda html: html.replace('itemprop="description"', 'class="synopsis"'),
+}
+
+
+def parse(html, partial):
+    # Fast path regex dimatikan supaya yang dibandingkan hanya DOM full vs partial
+    anime_schema.FAST_PARSE = False
+    anime_schema.PARTIAL_PARSE = partial
+    return anime_schema.parse_anime_page(html, 1, "https://myanimelist.net/anime/1")
+
+
+def measure(html, partial, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parse(html, partial)
+    elapsed = (time.perf_counter() - start) / rounds
+
+    tracemalloc.start()
+    parse(html, partial)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    mismatches = 0
+
+    print(f"Rounds: {rounds}\n")
+    print(f"{'fixture':<30} {'full':>9} {'partial':>9} {'speedup':>8} {'mem full':>10} {'mem partial':>12}   parity")
+    for fixture in FIXTURES:
+        with open(os.path.join(FIXTURES_DIR, fixture), encoding="utf-8") as f:
+            html = f.read()
+
+        same = parse(html, False) == parse(html, True)
+        mismatches += not same
+        full_time, full_mem = measure(html, False, rounds)
+        partial_time, partial_mem = measure(html, True, rounds)
+        print(f"{fixture:<30} {full_time * 1000:7.2f}ms {partial_time * 1000:7.2f}ms {full_time / partial_time:7.1f}x "
+              f"{full_mem / 1024:8.0f}KB {partial_mem / 1024:10.0f}KB   {'OK' if same else 'BEDA'}")
+
+        for name, mutate in BROKEN_VARIANTS.items():
+            broken = mutate(html)
+            same = parse(broken, False) == parse(broken, True)
+            mismatches += not same
+            print(f"    fallback {name:<24} {'OK' if same else 'BEDA'}")
+
+    if mismatches:
+        print(f"\n✗ {mismatches} hasil berbeda dari full parse")
+        sys.exit(1)
+    print("\n✓ Partial parse identik dengan full parse")
@@ -0,0 +1,81 @@
+"""
+Benchmark proxy pool dengan stand-in proxy lokal.
+
+    python benchmarks/bench_proxy_pool.py [NUM_REQUESTS]
+
+Setiap stand-in proxy menjawab request sendiri (seolah-olah origin dilihat dari IP proxy itu)
+dengan latency tertentu. Satu proxy selalu membalas 429 untuk mensimulasikan IP yang diblock.
+Hasil yang diharapkan: req/s naik sebanding jumlah proxy sehat, dan proxy yang diblock
+masuk cooldown sehingga hampir tidak dipakai.
+"""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from local_server import StandInHandler, start_server
+import http_session
+import proxy_pool
+import rate_limiter
+
+# Rate per proxy (req/s), dikunci supaya hasil bisa dibandingkan
+PER_PROXY_RATE = 20
+
+
+def make_proxy_handler(latency, status=200):
+    class ProxyHandler(StandInHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            body = self.body if status == 200 else b"blocked"
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+    return ProxyHandler
+
+
+def run(proxy_specs, num_requests, num_workers=16):
+    servers = []
+    urls = []
+    for latency, status in proxy_specs:
+        server, base_url = start_server(make_proxy_handler(latency, status))
+        servers.append(server)
+        urls.append(base_url)
+
+    pool = proxy_pool.ProxyPool(urls, max_concurrency=4, cooldown=5)
+    for proxy in pool.proxies:
+        proxy.limiter = rate_limiter.RateLimiter(
+            rate=PER_PROXY_RATE, min_rate=PER_PROXY_RATE, max_rate=PER_PROXY_RATE
+        )
+    proxy_pool.pool = pool
+
+    def task(_):
+        try:
+            return http_session.fetch("http://myanimelist.invalid/anime/1", timeout=10).status_code
+        except Exception:
+            return 0
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        codes = list(executor.map(task, range(num_requests)))
+    elapsed = time.perf_counter() - start
+
+    for server in servers:
+        server.shutdown()
+    ok = sum(1 for code in codes if code == 200)
+    return ok / elapsed, pool.stats()
+
+
+if __name__ == "__main__":
+    num_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    http_session.init_pool(16)
+
+    scenarios = {
+        "1 proxy": [(0.02, 200)],
+        "4 proxy": [(0.02, 200), (0.02, 200), (0.05, 200), (0.02, 200)],
+        "4 proxy + 1 diblock": [(0.02, 200), (0.02, 200), (0.05, 200), (0.02, 200), (0.02, 429)],
+    }
+    for name, specs in scenarios.items():
+        throughput, stats = run(specs, num_requests)
+        print(f"{name:22s}: {throughput:7.1f} sukses/s")
+        for row in stats:
+            print(f"    {row}")
@@ -0,0 +1,118 @@
+"""
+Micro-benchmark extractor sidebar halaman anime: versi lama (find_all_next + scan
+seluruh dokumen untuk rank/popularity/members) vs extract_sidebar (satu kali jalan di div.leftside).
+
+    python benchmarks/bench_sidebar.py [ROUNDS]
+
+Soup dibuat ulang tiap round di luar timer (kedua versi memodifikasi tree),
+jadi yang terukur hanya waktu ekstraksi. Hasil kedua versi harus identik.
+"""
+import os
+import re
+import sys
+import time
+
+import local_server  # noqa: F401  (menambahkan root repo ke sys.path)
+from html_parser import make_soup
+from anime_schema import extract_sidebar
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURES = ["anime_cowboy_bebop.html", "anime_na_score_singular.html"]
+
+
+def legacy_sidebar(soup):
+    """Salinan logika lama parse_anime_page, dikembalikan dalam bentuk (info, stats)."""
+    def extract_section_between(start_text, end_text=None):
+        data = {}
+        start = soup.find("h2", string=start_text)
+        if not start:
+            return data
+        for sib in start.find_all_next():
+            if sib.name == "h2" and (end_text is None or sib.get_text(strip=True) == end_text):
+                break
+            if sib.name == "div" and "spaceit_pad" in sib.get("class", []):
+                label = sib.find("span", class_="dark_text")
+                if not label:
+                    continue
+                key = label.get_text(strip=True).replace(":", "")
+                label.extract()
+                anchors = [a.get_text(strip=True) for a in sib.find_all("a")]
+                val = ", ".join(anchors) if anchors else sib.get_text(strip=True)
+                data[key] = val
+        return data
+
+    info = extract_section_between("Information", "Statistics")
+
+    score_tag = soup.select_one('[itemprop="aggregateRating"] [itemprop="ratingValue"]')
+    if score_tag:
+        score = score_tag.get_text(strip=True)
+    else:
+        score_na_tag = soup.select_one('span.score-label.score-na')
+        score = score_na_tag.get_text(strip=True) if score_na_tag else None
+
+    ranked_div = soup.find("div", {"data-id": "info2"})
+    rank = None
+    if ranked_div:
+        for sup in ranked_div.find_all("sup"):
+            sup.decompose()
+        text = ranked_div.get_text(" ", strip=True)
+        m = re.search(r"#\s*([\d,]+)", text)
+        if m:
+            rank = f"#{m.group(1)}"
+
+    pop_tag = soup.find("span", string=re.compile("Popularity:"))
+    popularity, members, favorites = None, None, None
+    if pop_tag:
+        text = pop_tag.find_parent("div").get_text(" ", strip=True)
+        m = re.search(r"#([\d,]+)", text)
+        popularity = f"#{m.group(1)}" if m else None
+
+    for div in soup.select("div.spaceit_pad"):
+        txt = div.get_text(" ", strip=True)
+        if txt.startswith("Members:"):
+            members = re.sub(r"[^0-9,]", "", txt)
+        elif txt.startswith("Favorites:"):
+            favorites = re.sub(r"[^0-9,]", "", txt)
+
+    stats = {"Score": score, "Ranked": rank, "Popularity": popularity,
+             "Members": members, "Favorites": favorites}
+    return info, stats
+
+
+def single_pass(soup):
+    sections = extract_sidebar(soup.select_one("div.leftside") or soup)
+    return sections["Information"], sections["Statistics"]
+
+
+def measure(func, html, rounds):
+    total = 0.0
+    result = None
+    for _ in range(rounds):
+        soup = make_soup(html)
+        start = time.perf_counter()
+        result = func(soup)
+        total += time.perf_counter() - start
+    return result, total / rounds
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    mismatches = 0
+
+    print(f"Rounds: {rounds}\n")
+    print(f"{'fixture':<32} {'lama':>10} {'single-pass':>12} {'speedup':>8}   parity")
+    for fixture in FIXTURES:
+        with open(os.path.join(FIXTURES_DIR, fixture), encoding="utf-8") as f:
+            html = f.read()
+        old_result, old_time = measure(legacy_sidebar, html, rounds)
+        new_result, new_time = measure(single_pass, html, rounds)
+        same = old_result == new_result
+        mismatches += not same
+        print(f"{fixture:<32} {old_time * 1000:8.2f}ms {new_time * 1000:10.2f}ms {old_time / new_time:7.1f}x"
+              f"   {'OK' if same else 'BEDA'}")
+        if not same:
+            print(f"    lama       : {old_result}")
+            print(f"    single-pass: {new_result}")
+
+    if mismatches:
+        sys.exit(1)
@@ -0,0 +1,117 @@
+"""
+Benchmark SQLite store (sqlite_store.py) vs alur CSV + pandas untuk pertanyaan resume/dedup.
+
+    python benchmarks/bench_sqlite_store.py [NUM_ROWS]
+
+NUM_ROWS hasil scrape (dari fixture, dengan 10% id dobel karena scrape ulang) ditulis ke CSV
+(CsvAppendWriter) dan ke SQLite (SqliteWriter, upsert). Lalu diukur:
+    already scraped   pd.read_csv seluruh file → set(myanimelist_id)   vs  sqlite_store.scraped_anime_ids
+    missing           read_csv input + output → isin (extract_missing_dedup.py)  vs  missing_anime_ids
+Hasil kedua cara harus sama.
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+import local_server  # noqa: F401  (menambahkan root repo ke sys.path)
+import anime_schema
+import sqlite_store
+from csv_writer import CsvAppendWriter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+COLUMNS = ["csv_index"] + list(anime_schema.DEFAULT_FIELDS)
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def make_rows(num_rows):
+    characters = anime_schema.parse_characters(load_fixture("anime_cowboy_bebop_characters.html"))
+    page = anime_schema.parse_anime_page(load_fixture("anime_cowboy_bebop.html"), 1,
+                                         "https://myanimelist.net/anime/1", anime_schema.DEFAULT_FIELDS)
+    rng = random.Random(0)
+    rows = []
+    for i in range(num_rows):
+        # 10% baris adalah scrape ulang id yang sudah ada
+        anime_id = rng.randint(1, max(1, i)) if i and rng.random() < 0.1 else i + 1
+        rows.append(dict(page, csv_index=i, myanimelist_id=anime_id, characters=characters))
+    return rows
+
+
+def write_csv(rows, path):
+    with CsvAppendWriter(path, COLUMNS, batch_size=1000) as writer:
+        for data in rows:
+            writer.write({k: json.dumps(v, ensure_ascii=False) if isinstance(v, (list, dict)) else v
+                          for k, v in data.items()})
+
+
+def write_db(rows, path):
+    with sqlite_store.SqliteWriter(path, COLUMNS, batch_size=1000) as writer:
+        for data in rows:
+            writer.write(data)
+
+
+def csv_scraped_ids(path):
+    return set(pd.read_csv(path)["myanimelist_id"].dropna().astype(int).tolist())
+
+
+def csv_missing(input_path, scraped_path):
+    df_input = pd.read_csv(input_path)
+    df_input["anime_id"] = df_input["url"].map(sqlite_store.extract_anime_id)
+    scraped_ids = set(pd.read_csv(scraped_path)["myanimelist_id"].dropna().astype(int).tolist())
+    return df_input[~df_input["anime_id"].isin(scraped_ids)]["anime_id"].tolist()
+
+
+def db_missing(input_path, db_path):
+    df_input = pd.read_csv(input_path)
+    conn = sqlite_store.connect(db_path)
+    missing = sqlite_store.missing_anime_ids(conn, df_input["url"].map(sqlite_store.extract_anime_id).tolist())
+    conn.close()
+    return missing
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rows = make_rows(num_rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "scraped.csv")
+        db_path = os.path.join(tmp, "anime.db")
+        input_path = os.path.join(tmp, "input.csv")
+        pd.DataFrame({"title": "x", "url": [f"https://myanimelist.net/anime/{i}/x" for i in range(1, num_rows * 2)]}) \
+            .to_csv(input_path, index=False)
+
+        _, csv_write = timed(write_csv, rows, csv_path)
+        _, db_write = timed(write_db, rows, db_path)
+        csv_ids, csv_resume = timed(csv_scraped_ids, csv_path)
+        db_ids, db_resume = timed(sqlite_store.scraped_anime_ids, db_path)
+        csv_todo, csv_missing_time = timed(csv_missing, input_path, csv_path)
+        db_todo, db_missing_time = timed(db_missing, input_path, db_path)
+        csv_size, db_size = os.path.getsize(csv_path), os.path.getsize(db_path)
+        unique = sqlite_store.connect(db_path).execute("SELECT COUNT(*) FROM anime").fetchone()[0]
+
+    print(f"{num_rows} baris ({unique} anime unik), input {num_rows * 2 - 1} URL\n")
+    print(f"{'':<18} {'CSV + pandas':>13} {'SQLite':>10}")
+    print(f"{'tulis':<18} {csv_write:12.2f}s {db_write:9.2f}s")
+    print(f"{'already scraped':<18} {csv_resume:12.3f}s {db_resume:9.3f}s")
+    print(f"{'missing':<18} {csv_missing_time:12.3f}s {db_missing_time:9.3f}s")
+    print(f"{'ukuran':<18} {csv_size / 1e6:11.1f}MB {db_size / 1e6:8.1f}MB")
+
+    # CSV menyimpan semua baris (termasuk scrape ulang), SQLite satu baris per id
+    same = csv_ids == db_ids and len(db_ids) == unique and csv_todo == db_todo
+    print(f"\nParity: {'OK' if same else 'BEDA'}")
+    if not same:
+        sys.exit(1)
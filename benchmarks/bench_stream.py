@@ -0,0 +1,119 @@
+"""
+Benchmark streaming halaman anime (STREAM_PAGES): download penuh vs berhenti setelah synopsis.
+
+    python benchmarks/bench_stream.py [NUM_PAGES]
+
+Server lokal menyajikan fixture anime. Untuk engine thread dan async, hasil parse dengan
+streaming harus identik dengan download penuh. Halaman yang field-nya memang kosong (fixture
+N/A, Ranked kosong) tetap dipotong; hanya halaman tanpa synopsis (body habis sebelum
+anime_page_complete) yang di-download ulang penuh. Dicetak juga byte yang dihemat.
+
+Dijalankan tanpa kompresi dan dengan gzip (seperti myanimelist.net). Semua byte dihitung di
+wire, jadi byte download ulang harus sama dengan ukuran halaman tersebut di wire (terkompresi).
+"""
+import asyncio
+import gzip
+import os
+import sys
+
+from local_server import StandInHandler, start_server
+import http_session
+import rate_limiter
+import scrape_all_anime as saa
+import async_engine
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+
+class FixtureHandler(StandInHandler):
+    # id % 3: 0 Cowboy Bebop, 1 fixture N/A (field kosong, tetap dipotong), 2 tanpa synopsis (download ulang)
+    pages = {
+        0: read_fixture("anime_cowboy_bebop.html"),
+        1: read_fixture("anime_na_score_singular.html"),
+        2: read_fixture("anime_cowboy_bebop.html").replace(b'itemprop="description"', b'data-x="description"'),
+    }
+    gzip_pages = {key: gzip.compress(body) for key, body in pages.items()}
+    use_gzip = False
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionResetError:
+            # Klien menutup koneksi yang di-stream sebelum body selesai
+            pass
+
+    def do_GET(self):
+        anime_id = int(self.path.split("/")[2])
+        body = (self.gzip_pages if self.use_gzip else self.pages)[anime_id % 3]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if self.use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # Klien berhenti membaca setelah synopsis
+            pass
+
+
+def reset_stats():
+    for key in http_session.stream_stats:
+        http_session.stream_stats[key] = 0
+
+
+def scrape_thread(ids):
+    return [saa.scrape_myanimelist(i, {}, pages=("main",)) for i in ids]
+
+
+def scrape_async(ids):
+    async def run():
+        async with async_engine.httpx.AsyncClient() as client:
+            clients = {None: client}
+            return [await async_engine.scrape_myanimelist(saa, clients, i, {}, pages=("main",)) for i in ids]
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    num_pages = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    server, base_url = start_server(FixtureHandler)
+    saa.ANIME_URL = base_url + "/anime/{}"
+    rate_limiter.limiter = rate_limiter.RateLimiter(rate=1e9, max_rate=1e9, burst=1e9)
+    ids = list(range(num_pages))
+    expected_fallbacks = sum(i % 3 == 2 for i in ids)
+    failed = False
+
+    try:
+        for use_gzip in (False, True):
+            FixtureHandler.use_gzip = use_gzip
+            pages = FixtureHandler.gzip_pages if use_gzip else FixtureHandler.pages
+            full_bytes = sum(len(pages[i % 3]) for i in ids)
+            fallback_bytes = sum(len(pages[i % 3]) for i in ids if i % 3 == 2)
+            for engine, scrape in (("thread", scrape_thread), ("async", scrape_async)):
+                http_session.STREAM_PAGES = False
+                expected = scrape(ids)
+                http_session.STREAM_PAGES = True
+                reset_stats()
+                streamed = scrape(ids)
+
+                stats = http_session.stream_stats
+                same = streamed == expected
+                fallbacks = stats["fallbacks"]
+                wire_ok = stats["fallback_bytes"] == fallback_bytes
+                failed |= not same or fallbacks != expected_fallbacks or not wire_ok
+                print(f"[{engine}{' gzip' if use_gzip else ''}] parity: {'OK' if same else 'BEDA'}, "
+                      f"download ulang {fallbacks} (harus {expected_fallbacks}), "
+                      f"byte download ulang {stats['fallback_bytes']} (harus {fallback_bytes})")
+                print(f"    Download penuh {num_pages} halaman: {full_bytes / 1e6:.2f} MB")
+                print(f"    {http_session.stream_summary()}")
+    finally:
+        server.shutdown()
+
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,48 @@
+"""
+Stand-in server lokal untuk benchmark, supaya tidak perlu menembak myanimelist.net.
+
+Pemakaian:
+    server, base_url = start_server()
+    ...
+    server.shutdown()
+"""
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+DEFAULT_BODY = b"<html><head><title>stand-in</title></head><body>" + b"x" * 4096 + b"</body></html>"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 supaya klien bisa keep-alive
+    protocol_version = "HTTP/1.1"
+    # Header dan body ditulis terpisah: tanpa TCP_NODELAY, request kedua di koneksi keep-alive
+    # tertahan delayed ACK (~40 ms) dan session pooling terlihat lebih lambat dari requests.get
+    disable_nagle_algorithm = True
+    body = DEFAULT_BODY
+    routes = {}
+
+    def do_GET(self):
+        status, body = self.routes.get(self.path, (200, self.body))
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(handler=StandInHandler, host="127.0.0.1", port=0):
+    """Jalankan server di background thread. Return (server, base_url)."""
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
@@ -0,0 +1,145 @@
+"""
+Checkpoint resume: file sidecar kecil berisi id yang sudah selesai / gagal / tidak ada (404),
+supaya resume tidak perlu membaca seluruh file output.
+
+Format: log append-only record 8 byte (status uint32, id uint32, little-endian); record terakhir
+per id yang berlaku. Saat dibuka, log yang sudah banyak record dobel ditulis ulang jadi satu
+record per id (urut status, id). 100k id = 800 KB, dimuat dalam hitungan milidetik.
+
+Record COMPLETED ditambahkan writer output setelah barisnya, dan baris id itu di writer lain
+(character / relasi), di-flush (lihat csv_writer.BackgroundWriter depends_on), jadi checkpoint
+tidak pernah mendahului output. Kalau file
+checkpoint hilang, bangun ulang dari kolom id di output (caller, lihat rebuild()); id
+FAILED / ABSENT tidak ada di output, jadi ikut hilang. Kalau output yang hilang, hanya id
+COMPLETED yang dibuang: run yang semua fetch-nya 404 / gagal tidak menulis output, tapi id
+ABSENT-nya tetap dilewati di run berikutnya. open_checkpoint() mengurus ini.
+
+    checkpoint = Checkpoint("out.csv.checkpoint")
+    checkpoint.add(COMPLETED, [1, 2, 3])
+    checkpoint.ids(COMPLETED)  # {1, 2, 3}
+"""
+import atexit
+import os
+import sys
+import threading
+from array import array
+
+COMPLETED, FAILED, ABSENT = 1, 2, 3
+STATUS_NAMES = {COMPLETED: "completed", FAILED: "failed", ABSENT: "absent"}
+
+RECORD_SIZE = 8
+
+
+def pack(records):
+    """[(status, id), ...] → bytes."""
+    data = array("I")
+    for status, key in records:
+        data.append(status)
+        data.append(key)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data.tobytes()
+
+
+def unpack(raw):
+    """bytes → array [status, id, status, id, ...] (record terpotong di akhir file diabaikan)."""
+    data = array("I")
+    data.frombytes(raw[:len(raw) - len(raw) % RECORD_SIZE])
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data
+
+
+class Checkpoint:
+    """Status per id, thread-safe. add() langsung di-append ke file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.status = {}
+        self.records = 0
+        self.existed = os.path.exists(path)
+        if self.existed:
+            self._load()
+        self.file = open(path, "ab")
+        atexit.register(self.close)
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            data = unpack(f.read())
+        status = self.status
+        for i in range(0, len(data), 2):
+            status[data[i + 1]] = data[i]
+        self.records = len(data) // 2
+        if self.records > 2 * len(status) + 1000:
+            self._compact()
+
+    def _compact(self):
+        """Tulis ulang file jadi satu record per id (ke file sementara lalu rename)."""
+        tmp_path = self.path + ".tmp"
+        records = sorted((status, key) for key, status in self.status.items())
+        with open(tmp_path, "wb") as f:
+            f.write(pack(records))
+        os.replace(tmp_path, self.path)
+        self.records = len(records)
+
+    def add(self, status, ids):
+        """Catat status untuk ids (None dilewati)."""
+        records = [(status, int(key)) for key in ids if key is not None]
+        if not records:
+            return
+        with self.lock:
+            self.file.write(pack(records))
+            self.file.flush()
+            for _, key in records:
+                self.status[key] = status
+            self.records += len(records)
+
+    def discard(self, status):
+        """Buang semua id dengan status ini (file ditulis ulang). Return jumlah id yang dibuang."""
+        with self.lock:
+            removed = [key for key, value in self.status.items() if value == status]
+            if removed:
+                for key in removed:
+                    del self.status[key]
+                self.file.close()
+                self._compact()
+                self.file = open(self.path, "ab")
+            return len(removed)
+
+    def rebuild(self, ids):
+        """Isi checkpoint baru dari id yang ada di output (COMPLETED)."""
+        self.add(COMPLETED, ids)
+
+    def ids(self, status):
+        with self.lock:
+            return {key for key, value in self.status.items() if value == status}
+
+    def counts(self):
+        with self.lock:
+            counts = dict.fromkeys(STATUS_NAMES.values(), 0)
+            for value in self.status.values():
+                if value in STATUS_NAMES:
+                    counts[STATUS_NAMES[value]] += 1
+            return counts
+
+    def close(self):
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+
+
+def open_checkpoint(path, output, output_exists, read_ids):
+    """
+    Buka checkpoint untuk output. Kalau checkpoint hilang, dibangun ulang dari read_ids()
+    (id di output); kalau output tidak ada, id COMPLETED di checkpoint dibuang (FAILED / ABSENT tetap).
+    """
+    checkpoint = Checkpoint(path)
+    if not output_exists:
+        removed = checkpoint.discard(COMPLETED)
+        if removed:
+            print(f"Output {output} tidak ada, {removed} id completed di checkpoint {path} direset")
+    elif not checkpoint.existed:
+        print(f"Checkpoint {path} tidak ada, dibangun ulang dari {output}...")
+        checkpoint.rebuild(read_ids())
+    return checkpoint
@@ -0,0 +1,131 @@
+"""
+Circuit breaker per host yang dipakai bersama oleh semua worker dan semua scraper.
+
+    CLOSED     normal, semua request jalan. Hasil request dicatat di sliding window.
+    OPEN       terlalu banyak gagal di window: semua worker berhenti selama open_seconds.
+    HALF_OPEN  setelah open_seconds lewat, hanya satu request probe yang boleh jalan.
+               Probe sukses → CLOSED. Probe gagal → OPEN lagi dengan durasi dua kali lipat.
+
+Berbeda dengan FailureCounter lama, satu sukses tidak langsung me-reset hitungan
+(window tetap mengingat kegagalan lain), jadi tidak flapping saat block sebagian.
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+from dotenv import load_dotenv
+
+from rate_limiter import is_throttle_status
+
+load_dotenv()
+
+# ==========================================
+# KONFIGURASI
+# ==========================================
+BREAKER_WINDOW = int(os.getenv("BREAKER_WINDOW", "20"))                        # jumlah request terakhir yang dilihat
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "10"))  # gagal di window → OPEN
+BREAKER_OPEN_SECONDS = float(os.getenv("BREAKER_OPEN_SECONDS", "10"))
+BREAKER_MAX_OPEN_SECONDS = float(os.getenv("BREAKER_MAX_OPEN_SECONDS", "300"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(self, host, window=BREAKER_WINDOW, failure_threshold=BREAKER_FAILURE_THRESHOLD,
+                 open_seconds=BREAKER_OPEN_SECONDS, max_open_seconds=BREAKER_MAX_OPEN_SECONDS):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.base_open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+
+        self.state = CLOSED
+        self.results = deque(maxlen=window)   # True = gagal
+        self.open_seconds = open_seconds
+        self.open_until = 0.0
+        self.probe_in_flight = False
+        self.condition = threading.Condition()
+
+    def _try_enter(self, now):
+        """Return (boleh_jalan, is_probe, detik_tunggu). Dipanggil dengan condition dipegang."""
+        if self.state == CLOSED:
+            return True, False, 0.0
+        if self.state == OPEN:
+            if now < self.open_until:
+                return False, False, self.open_until - now
+            self.state = HALF_OPEN
+            print(f"\n⚠ Circuit {self.host}: HALF-OPEN, mengirim probe request...")
+        # HALF_OPEN: hanya satu probe sekaligus
+        if self.probe_in_flight:
+            return False, False, 0.5
+        self.probe_in_flight = True
+        return True, True, 0.0
+
+    def acquire(self):
+        """Tunggu sampai request boleh jalan. Return True kalau request ini adalah probe."""
+        with self.condition:
+            while True:
+                allowed, is_probe, wait = self._try_enter(time.monotonic())
+                if allowed:
+                    return is_probe
+                self.condition.wait(timeout=min(wait, 1.0))
+
+    async def acquire_async(self):
+        while True:
+            with self.condition:
+                allowed, is_probe, wait = self._try_enter(time.monotonic())
+            if allowed:
+                return is_probe
+            await asyncio.sleep(min(wait, 1.0))
+
+    def _open(self, now):
+        self.state = OPEN
+        self.open_until = now + self.open_seconds
+        print(f"\n⚠ Circuit {self.host}: OPEN. Possible IP block. "
+              f"Pausing all workers for {self.open_seconds:.0f} seconds...")
+
+    def record(self, status_code, is_probe=False):
+        """Catat hasil request (status 0 = connection error / timeout)."""
+        failed = is_throttle_status(status_code)
+        with self.condition:
+            now = time.monotonic()
+            if is_probe:
+                self.probe_in_flight = False
+                if failed:
+                    self.open_seconds = min(self.max_open_seconds, self.open_seconds * 2)
+                    self._open(now)
+                else:
+                    self.state = CLOSED
+                    self.results.clear()
+                    self.open_seconds = self.base_open_seconds
+                    print(f"\n✓ Circuit {self.host}: CLOSED, resuming scraping...\n")
+                self.condition.notify_all()
+                return
+
+            if self.state != CLOSED:
+                # Hasil request yang sudah jalan sebelum circuit terbuka, abaikan
+                return
+            self.results.append(failed)
+            if failed and sum(self.results) >= self.failure_threshold:
+                self._open(now)
+
+    def get_state(self):
+        with self.condition:
+            return self.state
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(url):
+    """Circuit breaker global untuk host dari url."""
+    host = urlsplit(url).netloc
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(host)
+        return breaker
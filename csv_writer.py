@@ -0,0 +1,228 @@
+"""
+Writer CSV append-only untuk output scraper.
+
+File dibuka sekali; setiap baris hanya di-append di akhir file dengan urutan kolom tetap,
+dan buffer di-flush per batch (WRITE_BATCH_SIZE baris atau WRITE_FLUSH_INTERVAL detik,
+mana yang duluan). Biaya per baris konstan berapa pun ukuran file, beda dengan pola
+read_csv → concat → to_csv yang menulis ulang seluruh file untuk setiap baris.
+
+Baris yang belum di-flush hilang kalau proses mati mendadak (maksimal satu batch);
+close() / atexit menulis sisanya. Header hanya ditulis untuk file baru. Kalau file
+sudah ada dengan header berbeda → ValueError, supaya kolom tidak bergeser.
+
+    writer = CsvAppendWriter("out.csv", ["id", "name"])
+    writer.write({"id": 1, "name": "Spike"})
+    writer.close()
+
+BackgroundWriter membungkus writer seperti ini (CsvAppendWriter, parquet_writer.ParquetPartWriter):
+disk I/O dikerjakan satu thread writer yang menguras queue; write() di thread worker /
+event loop hanya memasukkan baris ke queue.
+
+    writer = BackgroundWriter(CsvAppendWriter("out.csv", ["id", "name"]))
+"""
+import atexit
+import csv
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dotenv import load_dotenv
+
+from checkpoint import COMPLETED
+
+load_dotenv()
+
+# ==========================================
+# KONFIGURASI
+# ==========================================
+WRITE_BATCH_SIZE = int(os.getenv("WRITE_BATCH_SIZE", "50"))
+WRITE_FLUSH_INTERVAL = float(os.getenv("WRITE_FLUSH_INTERVAL", "5"))
+
+
+def read_header(filename):
+    """Header CSV yang sudah ada, atau None kalau file belum ada / kosong."""
+    if not os.path.exists(filename) or os.path.getsize(filename) == 0:
+        return None
+    with open(filename, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), None)
+
+
+class CsvAppendWriter:
+    """Writer thread-safe: write() hanya menambah baris ke buffer, flush per batch."""
+
+    def __init__(self, filename, columns, batch_size=WRITE_BATCH_SIZE,
+                 flush_interval=WRITE_FLUSH_INTERVAL, lineterminator="\r\n"):
+        self.filename = filename
+        self.columns = list(columns)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self.lock = threading.Lock()
+        self.pending = []
+        self.last_flush = time.monotonic()
+
+        header = read_header(filename)
+        if header is not None and header != self.columns:
+            raise ValueError(f"{filename}: kolom file ({', '.join(header)}) "
+                             f"beda dengan kolom writer ({', '.join(self.columns)})")
+
+        self.file = open(filename, "a", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file, lineterminator=lineterminator)
+        if header is None:
+            self.writer.writerow(self.columns)
+            self.file.flush()
+        atexit.register(self.close)
+
+    def write(self, row):
+        """Tambah satu baris (dict; kolom yang tidak ada → kosong, kolom lain diabaikan)."""
+        values = [row.get(column) for column in self.columns]
+        with self.lock:
+            if self.file.closed:
+                raise ValueError(f"{self.filename}: writer sudah ditutup")
+            self.pending.append(values)
+            if len(self.pending) >= self.batch_size or time.monotonic() - self.last_flush >= self.flush_interval:
+                self._flush()
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        if self.file.closed:
+            return
+        if self.pending:
+            self.writer.writerows(self.pending)
+            self.rows_written += len(self.pending)
+            self.pending.clear()
+        self.file.flush()
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        with self.lock:
+            self._flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BackgroundWriter:
+    """
+    Writer (write/flush/close, last_flush, flush_interval) yang dimiliki satu thread writer.
+    write() tidak pernah menunggu disk: baris masuk queue, thread writer menulis dan flush
+    per batch (jumlah baris / waktu). close() (juga lewat atexit) menunggu queue habis dan
+    flush terakhir.
+
+    Kalau checkpoint (checkpoint.Checkpoint) diisi, row[key] setiap baris dicatat COMPLETED
+    setelah barisnya benar-benar di-flush oleh writer. Kalau satu id punya baris di writer lain
+    (character / relasi anime_character), writer itu masuk depends_on dan baris-barisnya
+    di-write() sebelum baris id ini: sebelum mencatat COMPLETED, semua BackgroundWriter di
+    depends_on di-sync() dulu, jadi checkpoint tidak pernah mendahului baris di file mana pun.
+    """
+    STOP = object()
+
+    def __init__(self, writer, checkpoint=None, key=None, depends_on=()):
+        # Writer dibuat (dan header dicek) di thread pemanggil, jadi file dengan kolom berbeda langsung gagal
+        self.writer = writer
+        self.filename = writer.filename
+        self.checkpoint = checkpoint
+        self.key = key
+        self.depends_on = depends_on  # list boleh ditambah setelah writer dibuat
+        self.unflushed = deque()  # key baris yang sudah diberikan ke writer tapi belum di-flush
+        self.reported = 0
+        self.queue = queue.Queue()
+        self.closed = False
+        self.error = None
+        self.thread = threading.Thread(target=self._run, name="csv-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    @property
+    def rows_written(self):
+        return self.writer.rows_written
+
+    def write(self, row):
+        """Masukkan satu baris (dict) ke queue. Baris di-copy, jadi caller boleh mengubah dict-nya."""
+        if self.error is not None:
+            raise RuntimeError(f"{self.filename}: writer berhenti karena error: {self.error!r}")
+        if self.closed:
+            raise ValueError(f"{self.filename}: writer sudah ditutup")
+        self.queue.put(dict(row))
+
+    def _run(self):
+        writer = self.writer
+        while True:
+            # Tunggu baris baru paling lama sampai flush berikutnya jatuh tempo
+            timeout = max(0.0, writer.last_flush + writer.flush_interval - time.monotonic())
+            try:
+                row = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                row = None
+            try:
+                if row is self.STOP:
+                    writer.close()
+                    self._mark_flushed()
+                    return
+                if isinstance(row, threading.Event):
+                    # sync(): semua baris sebelum penanda ini sudah di-write(), flush sekarang
+                    writer.flush()
+                    self._mark_flushed()
+                    row.set()
+                    continue
+                if row is None:
+                    writer.flush()
+                else:
+                    if self.checkpoint is not None:
+                        self.unflushed.append(row.get(self.key))
+                    writer.write(row)
+                self._mark_flushed()
+            except Exception as e:
+                # Disk penuh, file dihapus, dll: hentikan writer, write() berikutnya akan raise
+                self.error = e
+                print(f"✗ Writer {self.filename} error: {e!r}")
+                return
+
+    def _mark_flushed(self):
+        """Baris di-flush berurutan, jadi kenaikan rows_written = key terdepan di unflushed."""
+        flushed = self.writer.rows_written - self.reported
+        if not flushed:
+            return
+        self.reported += flushed
+        if self.checkpoint is not None:
+            keys = [self.unflushed.popleft() for _ in range(flushed)]
+            # Baris writer lain untuk id ini sudah masuk queue-nya lebih dulu: tunggu sampai di-flush
+            if all([writer.sync() for writer in list(self.depends_on)]):
+                self.checkpoint.add(COMPLETED, keys)
+
+    def sync(self):
+        """
+        Tunggu sampai semua baris yang masuk queue sebelum panggilan ini di-flush.
+        Return False kalau writer berhenti karena error (baris mungkin tidak tertulis).
+        """
+        done = threading.Event()
+        self.queue.put(done)
+        # Thread writer sudah selesai (close() / error) sebelum sampai ke penanda: close() sudah
+        # mem-flush semua baris, kecuali kalau berhenti karena error
+        while not done.wait(0.05) and self.thread.is_alive():
+            pass
+        return self.error is None
+
+    def close(self):
+        """Tunggu semua baris di queue tertulis, flush, dan tutup file."""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(self.STOP)
+        self.thread.join()
+        if self.error is not None:
+            print(f"✗ Writer {self.filename}: {self.queue.qsize()} baris tidak tertulis")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,9 +1,9 @@
-import requests
-from bs4 import BeautifulSoup
 import csv
 import os
-import time
 import random
+import http_session
+import page_cache
+from html_parser import make_soup
 
 # ==========================================
 # KONFIGURASI
@@ -34,39 +34,45 @@ def read_season_links(filename):
     return seasons
 
 
+def parse_season_page(html, season_name):
+    """Daftar anime (season, title, url) dari HTML halaman musim"""
+    soup = make_soup(html)
+    return [
+        {
+            "season": season_name,
+            "title": h2.get_text(strip=True),
+            "url": h2["href"].strip()
+        }
+        for h2 in soup.select("h2.h2_anime_title a[href*='/anime/']")
+    ]
+
+
 def scrape_anime_from_season(season_name, url):
     """Ambil daftar anime dari halaman musim dengan retry jika hasil kosong"""
     for attempt in range(1, MAX_RETRIES + 1):
         headers = {"User-Agent": random.choice(USER_AGENTS)}
         try:
-            res = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            res = http_session.fetch(url, headers=headers, timeout=REQUEST_TIMEOUT)
 
             if res.status_code == 200:
-                soup = BeautifulSoup(res.text, "html.parser")
-                results = [
-                    {
-                        "season": season_name,
-                        "title": h2.get_text(strip=True),
-                        "url": h2["href"].strip()
-                    }
-                    for h2 in soup.select("h2.h2_anime_title a[href*='/anime/']")
-                ]
+                results = parse_season_page(res.text, season_name)
 
                 if results:
                     print(f"[{season_name}] Percobaan {attempt}: {len(results)} judul ditemukan.")
                     return results
                 else:
                     print(f"[{season_name}] Percobaan {attempt}: hasil kosong, retry...")
-                    time.sleep(random.uniform(1, 3))
                     continue  # ulangi attempt
 
+            elif res.status_code == page_cache.CACHE_MISS:
+                print(f"[{season_name}] Tidak ada di cache (PAGE_CACHE=offline), dilewati.")
+                return []
+
             else:
                 print(f"[{season_name}] Status {res.status_code}, retry...")
-                time.sleep(random.uniform(1, 3))
 
         except Exception as e:
             print(f"[{season_name}] Error ({type(e).__name__}), retry...")
-            time.sleep(random.uniform(2, 5))
 
     print(f"[{season_name}] Gagal setelah {MAX_RETRIES} percobaan (hasil tetap kosong).")
     return []  # tetap kembalikan kosong setelah limit
@@ -104,6 +110,4 @@ if __name__ == "__main__":
         append_to_csv(anime_list, OUTPUT_FILE)
         print(f"[{season_name}] {len(anime_list)} judul disimpan.\n")
 
-        time.sleep(random.uniform(0.5, 2.0))
-
     print("Selesai.")
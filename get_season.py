@@ -1,10 +1,9 @@
-import requests
-from bs4 import BeautifulSoup
 import csv
 import os
 import random
-import time
 import pandas as pd
+import http_session
+from html_parser import make_soup
 
 # ==========================================
 # KONFIGURASI
@@ -25,11 +24,19 @@ USER_AGENTS = [
 def scrape_season_links():
     """Ambil semua link musim dari halaman archive"""
     headers = {"User-Agent": random.choice(USER_AGENTS)}
-    res = requests.get(ARCHIVE_URL, headers=headers)
+    # Lewat http_session: rate limiter, circuit breaker, proxy pool, dan PAGE_CACHE sama dengan scraper lain
+    res = http_session.fetch(ARCHIVE_URL, headers=headers, timeout=30)
     if res.status_code != 200:
         raise Exception(f"Gagal mengambil halaman archive: {res.status_code}")
 
-    soup = BeautifulSoup(res.text, "html.parser")
+    links = parse_season_links(res.text)
+    print(f"Total ditemukan {len(links)} season (termasuk kemungkinan duplikat).")
+    return links
+
+
+def parse_season_links(html):
+    """Link musim (name, url) dari HTML halaman archive"""
+    soup = make_soup(html)
     links = []
 
     # Cari semua <a> yang mengarah ke /anime/season/<tahun>/<musim>
@@ -38,8 +45,6 @@ def scrape_season_links():
         name = a.get_text(strip=True)
         if href and name and "/anime/season/" in href:
             links.append({"name": name, "url": href})
-
-    print(f"Total ditemukan {len(links)} season (termasuk kemungkinan duplikat).")
     return links
 
 
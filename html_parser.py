@@ -0,0 +1,54 @@
+"""
+Backend parser HTML yang dipakai semua scraper.
+
+Semua extractor ditulis dengan API BeautifulSoup; yang bisa diganti hanya tree builder-nya:
+    HTML_PARSER=lxml          parser C (libxml2), jauh lebih cepat (default kalau lxml terpasang)
+    HTML_PARSER=html.parser   parser bawaan Python, tanpa dependency tambahan
+
+Kalau lxml tidak terpasang, otomatis kembali ke html.parser.
+Cek hasil kedua backend identik dengan: python benchmarks/bench_html_parser.py
+"""
+import os
+from bs4 import BeautifulSoup
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# ==========================================
+# KONFIGURASI
+# ==========================================
+HTML_PARSER = os.getenv("HTML_PARSER", "lxml").strip().lower()
+
+BACKENDS = ("lxml", "html.parser")
+
+
+def backend_available(name):
+    if name == "html.parser":
+        return True
+    if name == "lxml":
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            return False
+        return True
+    return False
+
+
+def available_backends():
+    return [name for name in BACKENDS if backend_available(name)]
+
+
+def resolve_backend(name=None):
+    name = (name or HTML_PARSER).strip().lower()
+    if name not in BACKENDS:
+        raise ValueError(f"HTML_PARSER tidak dikenal: {name!r} (pilihan: {', '.join(BACKENDS)})")
+    return name if backend_available(name) else "html.parser"
+
+
+# Backend aktif untuk proses ini
+parser = resolve_backend()
+
+
+def make_soup(html, backend=None):
+    """BeautifulSoup dengan backend dari HTML_PARSER (atau `backend` kalau diisi)."""
+    return BeautifulSoup(html, resolve_backend(backend) if backend else parser)
@@ -0,0 +1,216 @@
+import os
+import threading
+import time
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+import rate_limiter
+import page_cache
+import proxy_pool
+import circuit_breaker
+
+load_dotenv()
+
+# ==========================================
+# KONFIGURASI
+# ==========================================
+# Ukuran connection pool per host. Di-set ulang lewat init_pool(NUM_WORKERS)
+# oleh masing-masing scraper sebelum worker dijalankan.
+POOL_SIZE = 10
+
+# Streaming: fetch(stop_when=...) berhenti membaca body setelah bagian yang dibutuhkan didapat.
+# Koneksi yang dipotong tidak bisa dipakai ulang (keep-alive hilang), jadi default mati;
+# berguna kalau bandwidth / proxy dibayar per GB. Tidak dipakai kalau PAGE_CACHE aktif.
+STREAM_PAGES = os.getenv("STREAM_PAGES", "False").strip().lower() in ("1", "true", "yes")
+STREAM_CHUNK_SIZE = 16 * 1024
+
+_local = threading.local()
+_config_lock = threading.Lock()
+_generation = 0
+
+
+def init_pool(pool_size):
+    """Set ukuran connection pool. Session lama dibuat ulang saat dipakai lagi."""
+    global POOL_SIZE, _generation
+    with _config_lock:
+        POOL_SIZE = max(1, int(pool_size))
+        _generation += 1
+
+
+def _new_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    """
+    Keep-alive session milik thread ini.
+    Satu session per thread, jadi koneksi TCP/TLS ke myanimelist.net dipakai ulang
+    antar request tanpa perlu lock.
+    """
+    session = getattr(_local, "session", None)
+    if session is None or _local.generation != _generation:
+        if session is not None:
+            session.close()
+        session = _new_session()
+        _local.session = session
+        _local.generation = _generation
+    return session
+
+
+# Statistik streaming untuk ringkasan run
+stream_stats = {"pages": 0, "cut": 0, "bytes_read": 0, "bytes_saved": 0, "fallbacks": 0, "fallback_bytes": 0}
+_stats_lock = threading.Lock()
+
+
+def should_stream():
+    return STREAM_PAGES and page_cache.cache.mode == "off"
+
+
+def record_stream(content_length, bytes_read, cut):
+    """Catat satu fetch streaming. bytes_saved hanya bisa dihitung kalau server mengirim Content-Length."""
+    with _stats_lock:
+        stream_stats["pages"] += 1
+        stream_stats["bytes_read"] += bytes_read
+        if cut:
+            stream_stats["cut"] += 1
+            if content_length:
+                stream_stats["bytes_saved"] += max(int(content_length) - bytes_read, 0)
+
+
+def record_stream_fallback(nbytes):
+    """
+    Body streaming habis sebelum stop_when terpenuhi dan halaman di-download ulang penuh.
+    nbytes dihitung di wire (res.raw.tell() / num_bytes_downloaded), sama seperti record_stream.
+    """
+    with _stats_lock:
+        stream_stats["fallbacks"] += 1
+        stream_stats["fallback_bytes"] += nbytes
+
+
+def stream_summary():
+    """Ringkasan untuk akhir run. Byte yang dihemat sudah dikurangi download ulang."""
+    with _stats_lock:
+        stats = dict(stream_stats)
+    saved = stats["bytes_saved"] - stats["fallback_bytes"]
+    return (f"Streaming: {stats['cut']}/{stats['pages']} pages cut early, "
+            f"{(stats['bytes_read'] + stats['fallback_bytes']) / 1e6:.1f} MB downloaded, "
+            f"{saved / 1e6:.1f} MB saved, {stats['fallbacks']} full re-downloads")
+
+
+class StreamedResponse:
+    """Response dari fetch(stop_when=...): body berhenti dibaca setelah stop_when(body) True"""
+    from_cache = False
+
+    def __init__(self, url, status_code, content, cut):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.cut = cut
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+
+def read_until(res, stop_when):
+    """Baca body res (stream=True) per chunk sampai stop_when(body) True. Return StreamedResponse."""
+    body = bytearray()
+    cut = False
+    try:
+        for chunk in res.iter_content(STREAM_CHUNK_SIZE):
+            body += chunk
+            if stop_when(body):
+                cut = True
+                break
+        record_stream(res.headers.get("Content-Length"), res.raw.tell(), cut)
+    finally:
+        res.close()
+    return StreamedResponse(res.url, res.status_code, bytes(body), cut)
+
+
+def fetch(url, headers=None, proxies=None, timeout=30, stop_when=None, on_status=None):
+    """
+    Pengganti requests.get yang memakai session thread ini.
+    Setiap request menunggu token dari rate limiter dan melaporkan hasilnya.
+    Kalau PAGE_CACHE aktif, halaman diambil dari / disimpan ke page_cache.
+    Dengan stop_when(body) dan STREAM_PAGES aktif, body dibaca per chunk dan berhenti
+    setelah stop_when True (return StreamedResponse dengan body terpotong); kalau body habis
+    sebelum stop_when True, halaman di-download ulang penuh.
+    on_status(status_code) dipanggil begitu header response diterima, sebelum body di-download.
+    Mode offline tanpa halaman di cache: return CachedResponse kosong dengan status page_cache.CACHE_MISS.
+    """
+    cache = page_cache.cache
+    if cache.reads:
+        content = cache.get(url)
+        if content is not None:
+            if on_status is not None:
+                on_status(200)
+            return page_cache.CachedResponse(url, content)
+        if cache.offline:
+            return page_cache.CachedResponse(url, b"", status_code=page_cache.CACHE_MISS)
+
+    # Kalau circuit host ini sedang OPEN, tunggu (atau jadi probe saat HALF-OPEN)
+    breaker = circuit_breaker.breaker_for(url)
+    is_probe = breaker.acquire()
+    stream = stop_when is not None and should_stream()
+    status_code = 0  # status 0 = gagal, juga untuk exception di luar RequestException
+    try:
+        res = send(url, headers, proxies, timeout, stream, on_status)
+        status_code = res.status_code
+    finally:
+        # Selalu dicatat (decode error, KeyboardInterrupt, ...): probe HALF-OPEN yang tidak
+        # pernah dicatat membuat circuit tertahan di HALF-OPEN dan semua worker menunggu selamanya
+        breaker.record(status_code, is_probe)
+
+    if stream and res.status_code == 200:
+        streamed = read_until(res, stop_when)
+        if streamed.cut:
+            return streamed
+        # Body habis sebelum stop_when terpenuhi (potongan tidak memuat bagian yang dibutuhkan):
+        # download ulang penuh. Field yang memang kosong (Ranked N/A, dll) tidak memicu ini.
+        res = fetch(url, headers=headers, proxies=proxies, timeout=timeout)
+        if res.status_code == 200:
+            # Byte di wire (sebelum gzip di-decode), satuan yang sama dengan record_stream
+            record_stream_fallback(res.raw.tell())
+        return res
+    if cache.writes and res.status_code == 200:
+        cache.put(url, res.content)
+    return res
+
+
+def send(url, headers, proxies, timeout, stream, on_status):
+    """Satu GET lewat proxy pool dan rate limiter (circuit breaker diurus fetch). Return Response."""
+    # Pakai proxy dari pool kalau caller tidak memberi proxies sendiri.
+    # Setiap proxy punya rate limiter sendiri; tanpa proxy pakai limiter global.
+    pool = proxy_pool.pool
+    proxy = None
+    limiter = rate_limiter.limiter
+    if proxies is None and pool is not None:
+        proxy = pool.acquire()
+        proxies = proxy.as_requests()
+        limiter = proxy.limiter
+
+    limiter.acquire()
+    start = time.monotonic()
+    try:
+        res = get_session().get(url, headers=headers, proxies=proxies, timeout=timeout,
+                                stream=stream or on_status is not None)
+        if on_status is not None:
+            on_status(res.status_code)
+            if not stream:
+                res.content  # download body di sini, setelah on_status
+    except BaseException:
+        # Connection error, timeout, proxy error, atau exception lain: slot proxy tetap dilepas
+        limiter.record(0)
+        if proxy is not None:
+            pool.release(proxy, 0)
+        raise
+    latency = time.monotonic() - start
+    limiter.record(res.status_code, latency)
+    if proxy is not None:
+        pool.release(proxy, res.status_code, latency)
+    return res
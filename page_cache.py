@@ -0,0 +1,127 @@
+"""
+Cache HTML mentah di disk supaya CSV bisa di-derive ulang tanpa crawl ulang.
+
+Layout (content-addressed, sharded 2 karakter pertama hash):
+    {PAGE_CACHE_DIR}/objects/ab/abcdef....html.gz   body gzip, nama = sha256(body)
+    {PAGE_CACHE_DIR}/refs/12/1234....jsonl          satu baris per fetch: url, fetched_at, sha256
+
+refs di-key oleh sha1(url); setiap fetch menambah satu baris, jadi riwayat
+per waktu fetch tetap ada dan get() mengambil versi terbaru. Body yang sama
+persis hanya disimpan sekali.
+
+Mode (PAGE_CACHE di .env):
+    off      tidak pakai cache (default)
+    write    selalu fetch dari network, simpan hasil 200 ke cache
+    read     pakai cache kalau ada, kalau tidak fetch lalu simpan
+    offline  hanya dari cache, tidak pernah menembak network
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# ==========================================
+# KONFIGURASI
+# ==========================================
+PAGE_CACHE = os.getenv("PAGE_CACHE", "off").lower()
+PAGE_CACHE_DIR = os.getenv("PAGE_CACHE_DIR", "page_cache")
+
+# Status untuk halaman yang tidak ada di cache pada mode offline. Bukan 0 (timeout):
+# network tidak pernah dicoba, jadi retry tidak akan mengubah hasilnya.
+CACHE_MISS = -1
+
+
+class CachedResponse:
+    """Pengganti requests.Response minimal untuk halaman yang diambil dari cache"""
+    from_cache = True
+
+    def __init__(self, url, content, status_code=200):
+        self.url = url
+        self.content = content
+        self.status_code = status_code
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+
+class PageCache:
+    def __init__(self, root=PAGE_CACHE_DIR, mode=PAGE_CACHE):
+        self.root = root
+        self.mode = mode
+        self.lock = threading.Lock()
+
+    @property
+    def reads(self):
+        return self.mode in ("read", "offline")
+
+    @property
+    def writes(self):
+        return self.mode in ("write", "read")
+
+    @property
+    def offline(self):
+        return self.mode == "offline"
+
+    def _ref_path(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, "refs", key[:2], key + ".jsonl")
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest + ".html.gz")
+
+    def latest(self, url):
+        """Entry fetch terbaru untuk url (dict url/fetched_at/sha256), atau None."""
+        path = self._ref_path(url)
+        try:
+            with open(path, "rb") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return None
+        for line in reversed(lines):
+            if line.strip():
+                return json.loads(line)
+        return None
+
+    def get(self, url):
+        """Body (bytes) versi terbaru untuk url, atau None kalau tidak ada di cache."""
+        entry = self.latest(url)
+        if entry is None:
+            return None
+        try:
+            with gzip.open(self._object_path(entry["sha256"]), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, url, content, fetched_at=None):
+        """Simpan body hasil fetch. Return sha256 body."""
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            tmp_path = f"{object_path}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+                f.write(content)
+            os.replace(tmp_path, object_path)
+
+        entry = {
+            "url": url,
+            "fetched_at": fetched_at if fetched_at is not None else time.time(),
+            "sha256": digest,
+        }
+        ref_path = self._ref_path(url)
+        with self.lock:
+            os.makedirs(os.path.dirname(ref_path), exist_ok=True)
+            with open(ref_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        return digest
+
+
+# Instance global yang dipakai semua scraper
+cache = PageCache()
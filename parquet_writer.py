@@ -0,0 +1,272 @@
+"""
+Output Parquet bertipe untuk scrape_all_anime.py (OUTPUT_FORMAT=parquet, butuh pyarrow).
+
+Di CSV semua kolom berupa string ("8.75", "#1,234", "1,234,567", JSON untuk characters).
+Di sini nilai dikonversi sekali saat ditulis (di thread writer, bukan di worker):
+    Score                                   float64, "N/A" → null
+    Episodes/Ranked/Popularity/Members/...  int64, "Unknown" / "N/A" / kosong → null
+    Genres/Themes/Studios/Producers/...     list<string>
+    alternative_titles                      map<string, string>
+    characters, external_links, ...         list<struct<...>>
+    Type/Status/Source/Rating/...           dictionary (jadi category di pandas)
+
+Output berupa dataset direktori (OUTPUT_PARQUET): setiap flush menulis satu file part lengkap
+(ditulis ke file sementara lalu di-rename), jadi kalau proses mati hanya batch terakhir yang hilang,
+dan run berikutnya menambah part baru. Baca dengan pd.read_parquet(OUTPUT_PARQUET).
+
+Konversi CSV yang sudah ada:
+    python parquet_writer.py mal_anime_scraped.csv [mal_anime_scraped.parquet]
+"""
+import json
+import os
+import sys
+import threading
+import time
+from dotenv import load_dotenv
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+load_dotenv()
+
+# ==========================================
+# KONFIGURASI
+# ==========================================
+PARQUET_BATCH_SIZE = int(os.getenv("PARQUET_BATCH_SIZE", "1000"))
+PARQUET_FLUSH_INTERVAL = float(os.getenv("PARQUET_FLUSH_INTERVAL", "300"))
+PARQUET_COMPRESSION = os.getenv("PARQUET_COMPRESSION", "zstd")
+
+INT_FIELDS = ("csv_index", "myanimelist_id", "Episodes", "Released_Year",
+              "Ranked", "Popularity", "Members", "Favorites", "anime_id", "character_id")
+FLOAT_FIELDS = ("Score",)
+LIST_FIELDS = ("Genres", "Themes", "Studios", "Producers", "Licensors")
+CATEGORY_FIELDS = ("Type", "Status", "Source", "Rating", "Demographic", "Released_Season", "Premiered", "role")
+MAP_FIELDS = ("alternative_titles",)
+# Kolom nested: nama → daftar (key, tipe) di struct tiap elemen
+STRUCT_LIST_FIELDS = {
+    "characters": (("id", "int"), ("name", "string"), ("url", "string"), ("role", "string")),
+    "external_links": (("name", "string"), ("url", "string")),
+    "streaming_platforms": (("platform", "string"), ("url", "string")),
+    "related_entries": (("relation", "string"), ("type", "string"), ("title", "string"),
+                        ("id", "int"), ("url", "string")),
+}
+
+# Placeholder MAL untuk daftar kosong ("None found, add some")
+EMPTY_LIST_MARKERS = ("add some", "None found", "None found, add some")
+
+
+def require_pyarrow():
+    if pa is None:
+        raise ImportError("OUTPUT_FORMAT=parquet butuh pyarrow (pip install pyarrow)")
+
+
+# ==========================================
+# KONVERSI NILAI
+# ==========================================
+def parse_int(value):
+    """'#1,234' / '1,234,567' / '26' → int; 'N/A', 'Unknown', kosong → None."""
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return None if value != value else int(value)  # NaN dari pandas
+    digits = str(value).strip().lstrip("#").replace(",", "")
+    if digits.isdigit():
+        return int(digits)
+    # CSV lama yang pernah lewat pandas bisa berisi "1998.0"
+    number = parse_float(digits)
+    return int(number) if number is not None and number.is_integer() else None
+
+
+def parse_float(value):
+    """'8.75' → 8.75; 'N/A', kosong → None."""
+    if value is None or isinstance(value, float) and value != value:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_list(value):
+    """'Action, Sci-Fi' → ['Action', 'Sci-Fi']; placeholder MAL → []; None tetap None."""
+    if value is None or isinstance(value, float):
+        return None
+    if isinstance(value, list):
+        return value
+    value = value.strip()
+    if not value or value in EMPTY_LIST_MARKERS:
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def parse_json(value):
+    """Kolom nested dari CSV tersimpan sebagai JSON string; hasil scrape langsung sudah list/dict."""
+    if isinstance(value, str):
+        return json.loads(value) if value else None
+    if isinstance(value, float):
+        return None
+    return value
+
+
+def to_typed(data, columns):
+    """Satu hasil scrape (atau baris CSV) → dict bertipe sesuai arrow_schema(columns)."""
+    row = {}
+    for column in columns:
+        value = data.get(column)
+        if column in INT_FIELDS:
+            value = parse_int(value)
+        elif column in FLOAT_FIELDS:
+            value = parse_float(value)
+        elif column in LIST_FIELDS:
+            value = parse_list(value)
+        elif column in MAP_FIELDS:
+            value = parse_json(value)
+            value = list(value.items()) if value is not None else None
+        elif column in STRUCT_LIST_FIELDS:
+            value = parse_json(value)
+            if value is not None:
+                value = [{key: parse_int(item.get(key)) if kind == "int" else item.get(key)
+                          for key, kind in STRUCT_LIST_FIELDS[column]} for item in value]
+        elif value is not None and not isinstance(value, str):
+            value = None if isinstance(value, float) and value != value else str(value)
+        row[column] = value
+    return row
+
+
+def arrow_type(column):
+    if column in INT_FIELDS:
+        return pa.int64()
+    if column in FLOAT_FIELDS:
+        return pa.float64()
+    if column in LIST_FIELDS:
+        return pa.list_(pa.string())
+    if column in CATEGORY_FIELDS:
+        return pa.dictionary(pa.int32(), pa.string())
+    if column in MAP_FIELDS:
+        return pa.map_(pa.string(), pa.string())
+    if column in STRUCT_LIST_FIELDS:
+        return pa.list_(pa.struct([(key, pa.int64() if kind == "int" else pa.string())
+                                   for key, kind in STRUCT_LIST_FIELDS[column]]))
+    return pa.string()
+
+
+def arrow_schema(columns):
+    require_pyarrow()
+    return pa.schema([(column, arrow_type(column)) for column in columns])
+
+
+# ==========================================
+# WRITER
+# ==========================================
+def part_files(path):
+    """File part di dataset (file sementara diawali '.' diabaikan, sama seperti pyarrow)."""
+    if not os.path.isdir(path):
+        return []
+    return sorted(os.path.join(path, name) for name in os.listdir(path)
+                  if name.endswith(".parquet") and not name.startswith((".", "_")))
+
+
+def read_column(path, column):
+    """Satu kolom dari seluruh dataset (hanya kolom itu yang dibaca dari disk)."""
+    require_pyarrow()
+    files = part_files(path)
+    if not files:
+        return []
+    return pq.ParquetDataset(files).read(columns=[column]).column(column).to_pylist()
+
+
+class ParquetPartWriter:
+    """
+    Writer thread-safe dengan antarmuka sama seperti csv_writer.CsvAppendWriter:
+    baris dikumpulkan, setiap flush menjadi satu file part di direktori dataset.
+    """
+
+    def __init__(self, path, columns, batch_size=PARQUET_BATCH_SIZE,
+                 flush_interval=PARQUET_FLUSH_INTERVAL, compression=PARQUET_COMPRESSION):
+        require_pyarrow()
+        self.filename = path
+        self.columns = list(columns)
+        self.schema = arrow_schema(self.columns)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.compression = compression
+        self.rows_written = 0
+        self.parts_written = 0
+        self.lock = threading.Lock()
+        self.pending = []
+        self.closed = False
+        self.last_flush = time.monotonic()
+        self.prefix = f"part-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+        files = part_files(path)
+        if files:
+            existing = pq.read_schema(files[0])
+            if existing.names != self.columns:
+                raise ValueError(f"{path}: kolom dataset ({', '.join(existing.names)}) "
+                                 f"beda dengan kolom writer ({', '.join(self.columns)})")
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, row):
+        """Tambah satu hasil scrape (dict; kolom yang tidak ada → null, kolom lain diabaikan)."""
+        values = to_typed(row, self.columns)
+        with self.lock:
+            if self.closed:
+                raise ValueError(f"{self.filename}: writer sudah ditutup")
+            self.pending.append(values)
+            if len(self.pending) >= self.batch_size or time.monotonic() - self.last_flush >= self.flush_interval:
+                self._flush()
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        self.last_flush = time.monotonic()
+        if self.closed or not self.pending:
+            return
+        table = pa.Table.from_pylist(self.pending, schema=self.schema)
+        name = f"{self.prefix}-{self.parts_written:05d}.parquet"
+        tmp_path = os.path.join(self.filename, "." + name)
+        pq.write_table(table, tmp_path, compression=self.compression)
+        os.replace(tmp_path, os.path.join(self.filename, name))
+        self.parts_written += 1
+        self.rows_written += len(self.pending)
+        self.pending.clear()
+
+    def close(self):
+        with self.lock:
+            self._flush()
+            self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def convert_csv(csv_path, parquet_path, chunk_size=PARQUET_BATCH_SIZE):
+    """Konversi output CSV scrape_all_anime.py ke dataset Parquet. Return jumlah baris."""
+    import pandas as pd
+
+    columns = list(pd.read_csv(csv_path, nrows=0).columns)
+    with ParquetPartWriter(parquet_path, columns, batch_size=chunk_size, flush_interval=float("inf")) as writer:
+        for chunk in pd.read_csv(csv_path, dtype=str, keep_default_na=False, na_values=[""],
+                                 chunksize=chunk_size):
+            for row in chunk.to_dict("records"):
+                writer.write(row)
+    return writer.rows_written
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python parquet_writer.py INPUT.csv [OUTPUT.parquet]")
+        sys.exit(1)
+    csv_path = sys.argv[1]
+    parquet_path = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(csv_path)[0] + ".parquet"
+    rows = convert_csv(csv_path, parquet_path)
+    size = sum(os.path.getsize(f) for f in part_files(parquet_path))
+    print(f"✓ {rows} baris → {parquet_path} ({size / 1e6:.1f} MB, CSV {os.path.getsize(csv_path) / 1e6:.1f} MB)")
@@ -0,0 +1,80 @@
+"""
+Process pool untuk tahap parsing HTML, terpisah dari thread/event loop yang melakukan I/O.
+
+Parsing BeautifulSoup itu CPU-bound, jadi di thread I/O semuanya antri di GIL dan
+throughput mentok di sekitar satu core berapa pun NUM_WORKERS-nya. Worker I/O cukup
+fetch HTML lalu menyerahkan parsing ke sini; pool berjalan di semua core.
+
+    PARSE_WORKERS=0        jumlah process = jumlah core (default)
+    PARSE_WORKERS=N        N process
+    PARSE_WORKERS=inline   parse di thread pemanggil (tanpa process pool)
+
+Fungsi yang diparse harus fungsi level modul (bisa di-pickle), mis. parse_anime_page.
+Panggil start() sebelum thread I/O dibuat supaya fork terjadi saat proses masih satu thread.
+"""
+import asyncio
+import atexit
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# ==========================================
+# KONFIGURASI
+# ==========================================
+PARSE_WORKERS = os.getenv("PARSE_WORKERS", "0").strip().lower()
+
+executor = None
+_lock = threading.Lock()
+
+
+def _ping(_):
+    return os.getpid()
+
+
+def pool_size():
+    """Jumlah process parser, 0 kalau parsing inline."""
+    if PARSE_WORKERS == "inline":
+        return 0
+    return int(PARSE_WORKERS) or os.cpu_count() or 1
+
+
+def start():
+    """Buat process pool dan nyalakan semua worker-nya sekarang. Return jumlah process."""
+    global executor
+    size = pool_size()
+    with _lock:
+        if executor is None and size:
+            executor = ProcessPoolExecutor(max_workers=size)
+            # Paksa semua process dibuat sekarang, bukan saat parse pertama
+            list(executor.map(_ping, range(size)))
+    return size
+
+
+def shutdown():
+    global executor
+    with _lock:
+        if executor is not None:
+            executor.shutdown()
+            executor = None
+
+
+atexit.register(shutdown)
+
+
+def parse(func, *args):
+    """Jalankan func(*args) di process pool dan tunggu hasilnya (inline kalau pool belum di-start)."""
+    if executor is None:
+        return func(*args)
+    return executor.submit(func, *args).result()
+
+
+async def parse_async(func, *args):
+    """Versi async dari parse(): event loop tetap jalan selama parsing."""
+    if executor is None:
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(func, *args))
@@ -0,0 +1,102 @@
+import asyncio
+import os
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# ==========================================
+# KONFIGURASI
+# ==========================================
+RATE_LIMIT = float(os.getenv("RATE_LIMIT", "5"))            # rate awal (request/detik)
+RATE_LIMIT_MIN = float(os.getenv("RATE_LIMIT_MIN", "0.5"))
+RATE_LIMIT_MAX = float(os.getenv("RATE_LIMIT_MAX", "50"))
+
+# Status yang dianggap tanda site kewalahan / kita di-throttle.
+# 0 = connection error / timeout (tidak ada response).
+THROTTLE_STATUSES = {0, 403, 429}
+
+
+def is_throttle_status(status_code):
+    return status_code in THROTTLE_STATUSES or status_code >= 500
+
+
+class RateLimiter:
+    """
+    Token bucket global dengan rate adaptif (AIMD), dipakai bersama oleh semua worker.
+
+    - Tiap request mengambil satu token lewat acquire() / acquire_async().
+    - Response sukses menaikkan rate sedikit demi sedikit (additive increase).
+    - 429/403/5xx/timeout atau latency di atas target menurunkan rate
+      (multiplicative decrease), paling sering sekali per `cooldown` detik supaya
+      satu gelombang error dari request yang sedang jalan tidak menurunkan rate berkali-kali.
+    """
+
+    def __init__(self, rate=RATE_LIMIT, min_rate=RATE_LIMIT_MIN, max_rate=RATE_LIMIT_MAX,
+                 burst=1.0, increase_step=0.05, decrease_factor=0.5,
+                 latency_target=5.0, cooldown=2.0):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.capacity = burst
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.last_decrease = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self):
+        """Ambil satu token. Return berapa detik caller harus menunggu sebelum request."""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _decrease(self, now, factor):
+        if now - self.last_decrease < self.cooldown:
+            return
+        self.rate = max(self.min_rate, self.rate * factor)
+        self.tokens = min(self.tokens, 0.0)
+        self.last_decrease = now
+
+    def record(self, status_code, latency=None):
+        """Laporkan hasil satu request supaya rate bisa menyesuaikan."""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            if is_throttle_status(status_code):
+                self._decrease(now, self.decrease_factor)
+            elif latency is not None and latency > self.latency_target:
+                # Site melambat: turunkan pelan-pelan
+                self._decrease(now, 0.9)
+            elif status_code < 400:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def get_rate(self):
+        with self.lock:
+            return self.rate
+
+
+# Instance global yang dipakai semua scraper
+limiter = RateLimiter()
@@ -0,0 +1,76 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+
+from page_cache import CACHE_MISS
+
+# ==========================================
+# KONFIGURASI
+# ==========================================
+# Backoff per kelas kegagalan: (delay dasar, delay maksimum) dalam detik.
+# Delay = min(maks, dasar * 2^(attempt-1)) dengan full jitter.
+BACKOFF = {
+    "timeout": (2, 60),          # connection error / timeout (status 0)
+    "server_error": (5, 120),    # 5xx
+    "throttled": (15, 300),      # 429 / 403
+    "missing_fields": (1, 30),   # halaman 200 tapi ada field penting yang null
+}
+
+
+def classify_failure(status_code, null_fields=None):
+    """Kelas kegagalan untuk status/null fields, atau None kalau tidak perlu retry (mis. 404, cache miss offline)."""
+    if status_code == CACHE_MISS:
+        return None
+    if status_code == 200:
+        return "missing_fields" if null_fields else None
+    if status_code == 0:
+        return "timeout"
+    if status_code in (403, 429):
+        return "throttled"
+    if status_code >= 500:
+        return "server_error"
+    return None
+
+
+def backoff_delay(failure_class, attempt):
+    base, cap = BACKOFF[failure_class]
+    return random.uniform(0, min(cap, base * 2 ** max(attempt - 1, 0)))
+
+
+class RetryQueue:
+    """
+    Antrian retry tertunda (thread-safe). Item baru bisa diambil setelah delay-nya lewat,
+    jadi worker tidak perlu tidur di dalam loop retry.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+
+    def push(self, item, failure_class, attempt):
+        """Jadwalkan item. Return delay (detik) sebelum item bisa diambil."""
+        delay = backoff_delay(failure_class, attempt)
+        with self.lock:
+            heapq.heappush(self.heap, (time.monotonic() + delay, next(self.counter), item))
+        return delay
+
+    def pop_due(self):
+        """Ambil item yang sudah jatuh tempo, atau None."""
+        with self.lock:
+            if self.heap and self.heap[0][0] <= time.monotonic():
+                return heapq.heappop(self.heap)[2]
+            return None
+
+    def next_due_in(self):
+        """Detik sampai item berikutnya jatuh tempo (0 kalau sudah), None kalau kosong."""
+        with self.lock:
+            if not self.heap:
+                return None
+            return max(self.heap[0][0] - time.monotonic(), 0.0)
+
+    def __len__(self):
+        with self.lock:
+            return len(self.heap)
@@ -1,12 +1,13 @@
 import requests
-from bs4 import BeautifulSoup
 import json
 import csv
 import os
-import re
 import random
 import time
 
+import anime_schema
+from csv_writer import read_header
+
 # ==========================================
 # KONFIGURASI
 # ==========================================
@@ -22,6 +23,9 @@ USER_AGENTS = [
     "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
 ]
 
+# Urutan kolom tetap dari anime_schema, bukan dari urutan key dict hasil parse
+CSV_COLUMNS = list(anime_schema.DEFAULT_FIELDS)
+
 
 # ==========================================
 # SCRAPER FUNGSI
@@ -34,25 +38,7 @@ def get_characters(anime_url: str, headers):
     if res.status_code != 200:
         print(f"Gagal mengambil karakter ({res.status_code})")
         return []
-
-    soup = BeautifulSoup(res.text, "html.parser")
-    characters = []
-
-    for char_link in soup.select("a[href*='/character/'] h3.h3_character_name"):
-        parent_a = char_link.find_parent("a", href=True)
-        if not parent_a:
-            continue
-        char_url = parent_a["href"]
-        char_name = char_link.get_text(strip=True)
-        match_id = re.search(r"/character/(\d+)", char_url)
-        char_id = int(match_id.group(1)) if match_id else None
-
-        characters.append({
-            "id": char_id,
-            "name": char_name,
-            "url": char_url
-        })
-    return characters
+    return anime_schema.parse_characters(res.text)
 
 
 def scrape_myanimelist(anime_id: int, headers):
@@ -65,112 +51,17 @@ def scrape_myanimelist(anime_id: int, headers):
         print(f"Gagal ambil ID {anime_id} ({res.status_code})")
         return None
 
-    soup = BeautifulSoup(res.text, "html.parser")
-
-    canonical_tag = soup.find("meta", property="og:url") or soup.find("link", rel="canonical")
-    canonical_url = canonical_tag.get("content") if canonical_tag else url
-
-    title_tag = soup.select_one("h1.title-name, h1.title")
-    title = title_tag.get_text(strip=True) if title_tag else None
-    description_tag = soup.find("p", itemprop="description")
-    description = description_tag.get_text(strip=True) if description_tag else None
-
-    img = soup.select_one("div.leftside img")
-    image_url = img.get("data-src") or img.get("src") if img else None
-
-    def extract_section_between(start_text, end_text=None):
-        data = {}
-        start = soup.find("h2", string=start_text)
-        if not start:
-            return data
-        for sib in start.find_all_next():
-            if sib.name == "h2" and (end_text is None or sib.get_text(strip=True) == end_text):
-                break
-            if sib.name == "div" and "spaceit_pad" in sib.get("class", []):
-                label = sib.find("span", class_="dark_text")
-                if not label:
-                    continue
-                key = label.get_text(strip=True).replace(":", "")
-                label.extract()
-                anchors = [a.get_text(strip=True) for a in sib.find_all("a")]
-                val = ", ".join(anchors) if anchors else sib.get_text(strip=True)
-                data[key] = val
-        return data
-
-    info = extract_section_between("Information", "Statistics")
-
-    score_tag = soup.select_one('[itemprop="aggregateRating"] [itemprop="ratingValue"]')
-    score = score_tag.get_text(strip=True) if score_tag else None
-
-    ranked_div = soup.find("div", {"data-id": "info2"})
-    rank = None
-    if ranked_div:
-        for sup in ranked_div.find_all("sup"):
-            sup.decompose()
-        text = ranked_div.get_text(" ", strip=True)
-        m = re.search(r"#\s*([\d,]+)", text)
-        if m:
-            rank = f"#{m.group(1)}"
-
-    pop_tag = soup.find("span", string=re.compile("Popularity:"))
-    popularity, members, favorites = None, None, None
-    if pop_tag:
-        text = pop_tag.find_parent("div").get_text(" ", strip=True)
-        m = re.search(r"#([\d,]+)", text)
-        popularity = f"#{m.group(1)}" if m else None
-
-    for div in soup.select("div.spaceit_pad"):
-        txt = div.get_text(" ", strip=True)
-        if txt.startswith("Members:"):
-            members = re.sub(r"[^0-9,]", "", txt)
-        elif txt.startswith("Favorites:"):
-            favorites = re.sub(r"[^0-9,]", "", txt)
-
-    premiered = info.get("Premiered")
-    released_season, released_year = None, None
-    if premiered:
-        s = re.search(r"(Winter|Spring|Summer|Fall)", premiered, re.IGNORECASE)
-        y = re.search(r"(\d{4})", premiered)
-        if s:
-            released_season = s.group(1).capitalize()
-        if y:
-            released_year = int(y.group(1))
-
-    characters = get_characters(canonical_url, headers)
-
-    flat = {
-        "myanimelist_id": anime_id,
-        "title": title,
-        "description": description,
-        "image": image_url,
-        "Type": info.get("Type"),
-        "Episodes": info.get("Episodes"),
-        "Status": info.get("Status"),
-        "Premiered": premiered,
-        "Released_Season": released_season,
-        "Released_Year": released_year,
-        "Source": info.get("Source"),
-        "Genres": info.get("Genres"),
-        "Themes": info.get("Themes"),
-        "Demographic": info.get("Demographic"),
-        "Duration": info.get("Duration"),
-        "Rating": info.get("Rating"),
-        "Score": score,
-        "Ranked": rank,
-        "Popularity": popularity,
-        "Members": members,
-        "Favorites": favorites,
-        "characters": characters,
-        "source_url": canonical_url,
-    }
+    # Field dan extractor yang sama dengan scrape_all_anime (anime_schema.DEFAULT_FIELDS)
+    flat = anime_schema.parse_anime_page(res.text, anime_id, url)
+    flat["characters"] = get_characters(flat["source_url"], headers)
     return flat
 
 
 def append_to_csv(data, filename):
     row = {k: json.dumps(v, ensure_ascii=False) if isinstance(v, (list, dict)) else v for k, v in data.items()}
-    write_header = not os.path.exists(filename)
+    write_header = not os.path.exists(filename) or os.path.getsize(filename) == 0
     with open(filename, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=row.keys())
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
         if write_header:
             writer.writeheader()
         writer.writerow(row)
@@ -182,6 +73,12 @@ def append_to_csv(data, filename):
 if __name__ == "__main__":
     consecutive_404 = 0
 
+    # Kolom file output lama harus sama dengan CSV_COLUMNS (cek sebelum scraping, bukan per baris)
+    header = read_header(OUTPUT_FILE)
+    if header is not None and header != CSV_COLUMNS:
+        print(f"✗ Kolom {OUTPUT_FILE} beda dengan anime_schema.DEFAULT_FIELDS")
+        exit(1)
+
     print(f"Memulai scraping dari ID={START_ID} sampai {END_ID} ...")
     for anime_id in range(START_ID, END_ID + 1):
         headers = {"User-Agent": random.choice(USER_AGENTS)}
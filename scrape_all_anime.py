@@ -1,15 +1,28 @@
 import requests
-from bs4 import BeautifulSoup
 import json
-import csv
 import os
 import re
+import sys
 import random
 import time
 import pandas as pd
 from dotenv import load_dotenv
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import deque
 import threading
+import http_session
+import proxy_pool
+import parse_pool
+import parquet_writer
+import sqlite_store
+import anime_schema
+from anime_schema import (check_null_values, SEMI_OPTIONAL_FIELDS, LIMITED_RETRY_FIELDS,
+                          CAN_BE_UNKNOWN, CAN_BE_NA)
+from csv_writer import BackgroundWriter, CsvAppendWriter, read_header
+import checkpoint as checkpoint_module
+from checkpoint import COMPLETED, FAILED, ABSENT
+from rate_limiter import limiter
+from retry_queue import RetryQueue, classify_failure
 
 # Load environment variables from .env file
 load_dotenv()
@@ -19,17 +32,38 @@ load_dotenv()
 # ==========================================
 INPUT_CSV = "mal_anime_to_scrape.csv"  # CSV file dengan kolom 'url'
 OUTPUT_FILE = "mal_anime_scraped.csv"
+OUTPUT_PARQUET = "mal_anime_scraped.parquet"  # direktori dataset untuk OUTPUT_FORMAT=parquet
+OUTPUT_DB = sqlite_store.OUTPUT_DB             # database untuk OUTPUT_FORMAT=sqlite
+# Character dari halaman /characters (csv / parquet): satu baris per character_id (input
+# scrape_characters.py) + relasi anime ↔ character. Di sqlite masuk tabel character / anime_character.
+OUTPUT_CHARACTERS = "mal_characters.csv"
+OUTPUT_ANIME_CHARACTERS = "mal_anime_characters.csv"
 
 # Configuration from .env file
 START_INDEX = int(os.getenv("START_INDEX", "0"))
 END_INDEX = int(os.getenv("END_INDEX", "-1"))
 NUM_WORKERS = int(os.getenv("NUM_WORKERS", "1"))
 
-# Proxy configuration (loaded from .env file)
-USE_PROXY = False
-PROXY_HOST = os.getenv("PROXY_HOST", "")
-PROXY_USER = os.getenv("PROXY_USER", "")
-PROXY_PASS = os.getenv("PROXY_PASS", "")
+# Engine: "thread" (ThreadPoolExecutor) atau "async" (asyncio + httpx, lihat async_engine.py)
+ENGINE = os.getenv("ENGINE", "thread").lower()
+ASYNC_CONCURRENCY = int(os.getenv("ASYNC_CONCURRENCY", "100"))
+
+# Output: "csv" (OUTPUT_FILE), "parquet" (OUTPUT_PARQUET, kolom bertipe, lihat parquet_writer.py)
+# atau "sqlite" (OUTPUT_DB, upsert per myanimelist_id, lihat sqlite_store.py)
+OUTPUT_FORMAT = os.getenv("OUTPUT_FORMAT", "csv").lower()
+
+# Proxy configuration: lihat proxy_pool.py (USE_PROXY, PROXY_LIST, PROXY_FILE, ...)
+# Parser: lihat anime_schema.py (PARTIAL_PARSE, FAST_PARSE)
+
+ANIME_URL = "https://myanimelist.net/anime/{}"
+
+# Kolom output (lihat anime_schema.FIELDS): "default" (kolom CSV standar), "all",
+# atau daftar nama dipisah koma. Halaman yang tidak dibutuhkan kolom mana pun tidak di-fetch.
+ANIME_FIELDS = anime_schema.resolve_fields(os.getenv("ANIME_FIELDS", "default"))
+ALL_PAGES = anime_schema.compile_fields(ANIME_FIELDS).pages
+
+# True: daftar character juga disimpan sebagai JSON di kolom characters (format lama)
+EMBED_CHARACTERS = os.getenv("EMBED_CHARACTERS", "False").lower() == "true"
 
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
@@ -43,29 +77,31 @@ csv_lock = threading.Lock()
 counter_lock = threading.Lock()
 print_lock = threading.Lock()
 
+# Pool untuk request /characters yang jalan paralel dengan request halaman utama
+characters_executor = ThreadPoolExecutor(max_workers=max(1, NUM_WORKERS), thread_name_prefix="characters")
+
 
 # ==========================================
 # SCRAPER FUNGSI
 # ==========================================
-def get_proxies():
-    """Generate proxy configuration for requests"""
-    if not USE_PROXY:
-        return None
-
-    proxy_url = f"http://{PROXY_USER}:{PROXY_PASS}@{PROXY_HOST}"
-    return {
-        'http': proxy_url,
-        'https': proxy_url
-    }
+def characters_base_url(anime_id, anime_url=None):
+    """
+    URL anime (dengan slug) untuk membentuk URL /characters tanpa menunggu halaman utama.
+    Pakai slug dari CSV input kalau ada, kalau tidak pakai bentuk /anime/{id}/x.
+    """
+    if anime_url:
+        match = re.search(r'/anime/(\d+)/([^/?#]+)', anime_url)
+        if match and int(match.group(1)) == anime_id:
+            return ANIME_URL.format(anime_id) + "/" + match.group(2)
+    return ANIME_URL.format(anime_id) + "/x"
 
 
 def get_characters(anime_url: str, headers):
     characters_url = anime_url.rstrip("/") + "/characters"
     # Removed verbose print - only print on error
 
-    proxies = get_proxies()
     try:
-        res = requests.get(characters_url, headers=headers, proxies=proxies, timeout=30)
+        res = http_session.fetch(characters_url, headers=headers, timeout=30)
     except requests.exceptions.RequestException:
         # Connection error, timeout, proxy error
         return []
@@ -74,32 +110,58 @@ def get_characters(anime_url: str, headers):
         # Hanya print kalau error
         return []
 
-    soup = BeautifulSoup(res.text, "html.parser")
-    characters = []
+    return parse_pool.parse(anime_schema.parse_characters, res.text)
 
-    for char_link in soup.select("a[href*='/character/'] h3.h3_character_name"):
-        parent_a = char_link.find_parent("a", href=True)
-        if not parent_a:
-            continue
-        char_url = parent_a["href"]
-        char_name = char_link.get_text(strip=True)
-        match_id = re.search(r"/character/(\d+)", char_url)
-        char_id = int(match_id.group(1)) if match_id else None
 
-        characters.append({
-            "id": char_id,
-            "name": char_name,
-            "url": char_url
-        })
-    return characters
+def scrape_myanimelist(anime_id: int, headers, anime_url=None, pages=ALL_PAGES):
+    """
+    Scrape halaman anime dan halaman /characters secara bersamaan.
+    Request /characters dimulai di characters_executor begitu halaman utama menjawab 200
+    (body halaman utama di-download dan di-parse sementara /characters jalan); id 404 atau
+    yang sedang di-block tidak memakan request /characters.
+    `pages` membatasi halaman yang di-fetch (untuk retry); dict hasil hanya berisi
+    field dari halaman tersebut.
+    """
+    url = ANIME_URL.format(anime_id)
+
+    characters_url = characters_base_url(anime_id, anime_url)
+    if "main" not in pages:
+        return {"characters": get_characters(characters_url, headers)}, 200
+
+    characters_future = None
+
+    def start_characters(status_code):
+        nonlocal characters_future
+        if status_code == 200 and characters_future is None and "characters" in pages:
+            characters_future = characters_executor.submit(get_characters, characters_url, headers)
+
+    flat = None
+    try:
+        # Dengan STREAM_PAGES halaman hanya dibaca sampai synopsis (lihat http_session.fetch)
+        stream = http_session.should_stream() and anime_schema.compile_fields(ANIME_FIELDS).partial
+        flat, status_code = fetch_anime_page(anime_id, url, headers, on_status=start_characters,
+                                             stop_when=anime_schema.anime_page_complete if stream else None)
+    finally:
+        # Halaman utama gagal: /characters yang belum jalan dibatalkan, hasilnya tidak dipakai
+        if flat is None and characters_future is not None:
+            characters_future.cancel()
+    if flat is None:
+        return None, status_code
 
+    if characters_future is not None:
+        flat["characters"] = characters_future.result()
+    else:
+        flat.pop("characters", None)
+    return flat, 200
 
-def scrape_myanimelist(anime_id: int, headers):
-    url = f"https://myanimelist.net/anime/{anime_id}"
-    proxies = get_proxies()
 
+def fetch_anime_page(anime_id, url, headers, stop_when=None, on_status=None):
+    """
+    Fetch dan parse halaman /anime/{id}. Return (flat, status_code); flat None kalau gagal.
+    stop_when dan on_status diteruskan ke http_session.fetch.
+    """
     try:
-        res = requests.get(url, headers=headers, proxies=proxies, timeout=30)
+        res = http_session.fetch(url, headers=headers, timeout=30, stop_when=stop_when, on_status=on_status)
     except requests.exceptions.RequestException as e:
         # Connection error, timeout, proxy error, etc.
         return None, 0
@@ -111,137 +173,137 @@ def scrape_myanimelist(anime_id: int, headers):
         # Hanya print kalau error bukan 404
         return None, res.status_code
 
-    soup = BeautifulSoup(res.text, "html.parser")
-
-    canonical_tag = soup.find("meta", property="og:url") or soup.find("link", rel="canonical")
-    canonical_url = canonical_tag.get("content") if canonical_tag else url
-
-    title_tag = soup.select_one("h1.title-name, h1.title")
-    title = title_tag.get_text(strip=True) if title_tag else None
-    description_tag = soup.find("p", itemprop="description")
-    description = description_tag.get_text(strip=True) if description_tag else None
-
-    img = soup.select_one("div.leftside img")
-    image_url = img.get("data-src") or img.get("src") if img else None
-
-    def extract_section_between(start_text, end_text=None):
-        data = {}
-        start = soup.find("h2", string=start_text)
-        if not start:
-            return data
-        for sib in start.find_all_next():
-            if sib.name == "h2" and (end_text is None or sib.get_text(strip=True) == end_text):
-                break
-            if sib.name == "div" and "spaceit_pad" in sib.get("class", []):
-                label = sib.find("span", class_="dark_text")
-                if not label:
-                    continue
-                key = label.get_text(strip=True).replace(":", "")
-                label.extract()
-                anchors = [a.get_text(strip=True) for a in sib.find_all("a")]
-                val = ", ".join(anchors) if anchors else sib.get_text(strip=True)
-                data[key] = val
-        return data
-
-    info = extract_section_between("Information", "Statistics")
-
-    score_tag = soup.select_one('[itemprop="aggregateRating"] [itemprop="ratingValue"]')
-    if score_tag:
-        score = score_tag.get_text(strip=True)
-    else:
-        # Cek apakah Score adalah N/A
-        score_na_tag = soup.select_one('span.score-label.score-na')
-        score = score_na_tag.get_text(strip=True) if score_na_tag else None
-
-    ranked_div = soup.find("div", {"data-id": "info2"})
-    rank = None
-    if ranked_div:
-        for sup in ranked_div.find_all("sup"):
-            sup.decompose()
-        text = ranked_div.get_text(" ", strip=True)
-        m = re.search(r"#\s*([\d,]+)", text)
-        if m:
-            rank = f"#{m.group(1)}"
-
-    pop_tag = soup.find("span", string=re.compile("Popularity:"))
-    popularity, members, favorites = None, None, None
-    if pop_tag:
-        text = pop_tag.find_parent("div").get_text(" ", strip=True)
-        m = re.search(r"#([\d,]+)", text)
-        popularity = f"#{m.group(1)}" if m else None
-
-    for div in soup.select("div.spaceit_pad"):
-        txt = div.get_text(" ", strip=True)
-        if txt.startswith("Members:"):
-            members = re.sub(r"[^0-9,]", "", txt)
-        elif txt.startswith("Favorites:"):
-            favorites = re.sub(r"[^0-9,]", "", txt)
-
-    premiered = info.get("Premiered")
-    released_season, released_year = None, None
-    if premiered:
-        s = re.search(r"(Winter|Spring|Summer|Fall)", premiered, re.IGNORECASE)
-        y = re.search(r"(\d{4})", premiered)
-        if s:
-            released_season = s.group(1).capitalize()
-        if y:
-            released_year = int(y.group(1))
-
-    characters = get_characters(canonical_url, headers)
-
-    # Cek singular/plural untuk field yang bisa berbeda
-    genres = info.get("Genres") or info.get("Genre")
-    themes = info.get("Themes") or info.get("Theme")
-    studios = info.get("Studios") or info.get("Studio")
-    producers = info.get("Producers") or info.get("Producer")
-
-    flat = {
-        "myanimelist_id": anime_id,
-        "title": title,
-        "description": description,
-        "image": image_url,
-        "Type": info.get("Type"),
-        "Episodes": info.get("Episodes"),
-        "Status": info.get("Status"),
-        "Premiered": premiered,
-        "Released_Season": released_season,
-        "Released_Year": released_year,
-        "Source": info.get("Source"),
-        "Genres": genres,
-        "Themes": themes,
-        "Studios": studios,
-        "Producers": producers,
-        "Demographic": info.get("Demographic"),
-        "Duration": info.get("Duration"),
-        "Rating": info.get("Rating"),
-        "Score": score,
-        "Ranked": rank,
-        "Popularity": popularity,
-        "Members": members,
-        "Favorites": favorites,
-        "characters": characters,
-        "source_url": canonical_url,
-    }
-    return flat, 200
+    # Parsing jalan di process pool, thread ini hanya menunggu hasilnya
+    return parse_pool.parse(anime_schema.parse_anime_page, res.text, anime_id, url, ANIME_FIELDS), 200
+
+
+# Kolom output tetap (bukan dari key tiap baris), jadi urutan kolom tidak bergantung hasil scrape
+CSV_COLUMNS = ["csv_index"] + [f for f in ANIME_FIELDS if EMBED_CHARACTERS or f != "characters"]
+CHARACTER_COLUMNS = ["character_id", "name", "url"]
+ANIME_CHARACTER_COLUMNS = ["anime_id", "character_id", "role"]
+
+# Satu BackgroundWriter per file output, dibuat saat baris pertama ditulis
+writers = {}
+# Writer character / anime_character: anime baru dicatat COMPLETED setelah barisnya di sini juga di-flush
+character_writers = []
+
+# Checkpoint resume (checkpoint.py) untuk output utama, dibuka di main: id selesai / gagal / 404.
+# Key myanimelist_id (bukan csv_index / posisi baris), jadi mal_anime_to_scrape.csv boleh dibuat ulang.
+checkpoint = None
+CHECKPOINT_KEY = "myanimelist_id"
+
+# character_id yang sudah ada di OUTPUT_CHARACTERS (diisi load_seen_characters, lalu per baris baru)
+seen_characters = set()
+characters_lock = threading.Lock()
+
+
+def output_target():
+    """File / direktori dataset / database output utama untuk OUTPUT_FORMAT."""
+    return {"parquet": OUTPUT_PARQUET, "sqlite": OUTPUT_DB}.get(OUTPUT_FORMAT, OUTPUT_FILE)
+
+
+def get_writer(path, make_writer, columns=CSV_COLUMNS):
+    """BackgroundWriter untuk path (make_writer(path, columns) dipanggil sekali per path)."""
+    writer = writers.get(path)
+    if writer is None:
+        with csv_lock:
+            writer = writers.get(path)
+            if writer is None:
+                # Checkpoint hanya untuk output utama: baris anime yang sudah di-flush (bersama baris
+                # character dan relasinya, lihat save_result) = selesai
+                if path == output_target():
+                    writer = BackgroundWriter(make_writer(path, columns), checkpoint, CHECKPOINT_KEY,
+                                              depends_on=character_writers)
+                else:
+                    writer = BackgroundWriter(make_writer(path, columns))
+                    character_writers.append(writer)
+                writers[path] = writer
+    return writer
 
 
 def append_to_csv(data, filename):
+    """Masukkan baris ke queue writer output; disk I/O dikerjakan thread writer, bukan worker."""
     row = {k: json.dumps(v, ensure_ascii=False) if isinstance(v, (list, dict)) else v for k, v in data.items()}
+    get_writer(filename, CsvAppendWriter).write(row)
+
 
-    # Reorder kolom agar csv_index di awal
-    fieldnames = list(row.keys())
-    if 'csv_index' in fieldnames:
-        fieldnames.remove('csv_index')
-        fieldnames.insert(0, 'csv_index')
+def output_path(filename):
+    """Path output untuk OUTPUT_FORMAT: file CSV, atau direktori dataset .parquet."""
+    return os.path.splitext(filename)[0] + ".parquet" if OUTPUT_FORMAT == "parquet" else filename
 
-    # Thread-safe CSV writing
-    with csv_lock:
-        write_header = not os.path.exists(filename)
-        with open(filename, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            if write_header:
-                writer.writeheader()
-            writer.writerow(row)
+
+def output_columns_match():
+    """
+    Cek header semua file CSV output yang sudah ada (anime, character, relasi) terhadap kolom run ini.
+    Dicek sebelum scraping: kalau baru ketahuan di writer, anime sebelumnya sudah tertulis separuh.
+    """
+    if OUTPUT_FORMAT in ("parquet", "sqlite"):
+        return True
+    for path, columns in ((OUTPUT_FILE, CSV_COLUMNS), (OUTPUT_CHARACTERS, CHARACTER_COLUMNS),
+                          (OUTPUT_ANIME_CHARACTERS, ANIME_CHARACTER_COLUMNS)):
+        header = read_header(path)
+        if header is not None and header != columns:
+            hint = " (file lama dengan kolom characters: set EMBED_CHARACTERS=True)" if "characters" in header else ""
+            print(f"✗ Kolom {path} beda dengan kolom run ini ({', '.join(columns)}){hint}")
+            return False
+    return True
+
+
+def append_characters(data, make_writer):
+    """Character baru → OUTPUT_CHARACTERS, semua pasangan (anime, character, role) → OUTPUT_ANIME_CHARACTERS."""
+    entries = data.get("characters")
+    if entries is None:
+        return
+    characters = get_writer(output_path(OUTPUT_CHARACTERS), make_writer, CHARACTER_COLUMNS)
+    edges = get_writer(output_path(OUTPUT_ANIME_CHARACTERS), make_writer, ANIME_CHARACTER_COLUMNS)
+    for entry in entries:
+        character_id = entry.get("id")
+        if character_id is None:
+            continue
+        with characters_lock:
+            # Masuk queue di dalam lock: anime lain yang melihat id ini di seen_characters menulis
+            # barisnya setelah baris character ini, jadi tidak bisa COMPLETED sebelum baris ini di-flush
+            if character_id not in seen_characters:
+                seen_characters.add(character_id)
+                characters.write({"character_id": character_id, "name": entry.get("name"), "url": entry.get("url")})
+        edges.write({"anime_id": data.get("myanimelist_id"), "character_id": character_id, "role": entry.get("role")})
+
+
+def load_seen_characters():
+    """Isi seen_characters dari OUTPUT_CHARACTERS yang sudah ada (hanya kolom character_id yang dibaca)."""
+    path = output_path(OUTPUT_CHARACTERS)
+    if OUTPUT_FORMAT == "parquet":
+        ids = parquet_writer.read_column(path, "character_id") if parquet_writer.part_files(path) else []
+    elif os.path.exists(path):
+        ids = pd.read_csv(path, usecols=["character_id"])["character_id"].tolist()
+    else:
+        ids = []
+    seen_characters.update(ids)
+    return len(seen_characters)
+
+
+def save_result(data):
+    """
+    Tulis hasil scrape ke output sesuai OUTPUT_FORMAT (konversi tipe dikerjakan thread writer).
+    Baris character / relasi masuk queue sebelum baris anime: checkpoint COMPLETED dicatat writer
+    anime, setelah writer character ikut di-flush (BackgroundWriter depends_on).
+    """
+    if OUTPUT_FORMAT == "sqlite":
+        # Tabel character / anime_character diisi SqliteWriter dari kolom characters
+        get_writer(OUTPUT_DB, sqlite_store.SqliteWriter, ["csv_index", *ANIME_FIELDS]).write(data)
+        return
+    if OUTPUT_FORMAT == "parquet":
+        append_characters(data, parquet_writer.ParquetPartWriter)
+        get_writer(OUTPUT_PARQUET, parquet_writer.ParquetPartWriter).write(data)
+    else:
+        append_characters(data, CsvAppendWriter)
+        append_to_csv(data, OUTPUT_FILE)
+
+
+def close_writers():
+    """Tunggu queue semua writer output habis dan flush ke disk."""
+    for writer in writers.values():
+        writer.close()
 
 
 # ==========================================
@@ -260,48 +322,6 @@ FIELD_VARIANTS = {
     'Producers': 'Producer',
 }
 
-def check_null_values(data):
-    """
-    Cek apakah ada nilai null/None/empty pada kolom penting.
-    Return list of kolom yang null.
-    """
-    # Kolom yang BENAR-BENAR boleh null (karena tidak semua anime punya)
-    # End_year: untuk anime ongoing yang belum selesai
-    optional_fields = ['End_year']
-
-    # Kolom yang boleh bernilai "Unknown" (untuk anime ongoing/incomplete)
-    can_be_unknown = ['Episodes', 'Status', 'Premiered', 'Released_Season', 'Released_Year', 'Duration']
-
-    # Kolom yang boleh bernilai "N/A" (untuk anime yang belum ada data)
-    can_be_na = ['Score', 'Ranked']
-
-    null_fields = []
-    for key, value in data.items():
-        # Skip kolom opsional
-        if key in optional_fields:
-            continue
-
-        # Cek null/None/empty
-        if value is None or value == '':
-            null_fields.append(key)
-        elif value == 'Unknown':
-            # Untuk field tertentu, "Unknown" itu valid
-            if key not in can_be_unknown:
-                null_fields.append(key)
-        elif value == 'N/A':
-            # Untuk field tertentu, "N/A" itu valid
-            if key not in can_be_na:
-                null_fields.append(key)
-
-        # Cek untuk list kosong termasuk characters
-        if isinstance(value, list) and len(value) == 0:
-            if key == 'characters':
-                # Characters kosong juga dianggap null, perlu retry
-                null_fields.append(key)
-
-    return null_fields
-
-
 def fix_singular_plural_fields(data):
     """
     Cek apakah field yang null punya versi singular/plural.
@@ -320,34 +340,22 @@ def fix_singular_plural_fields(data):
     return fixed_fields
 
 
-def scrape_with_retry(anime_id, max_retries=4, index=None):
-    """
-    Scrape anime dengan retry untuk mengisi field yang null.
-    Hanya update field yang null, tidak re-scrape semua.
-    Return: (data, status_code)
-    """
-    # Scrape pertama kali
-    headers = {"User-Agent": random.choice(USER_AGENTS)}
-    data, status_code = scrape_myanimelist(anime_id, headers)
-
-    if not data:
-        # Anime tidak ditemukan atau error
-        return None, status_code
-
-    # Tambahkan index ke data
-    if index is not None:
-        data['csv_index'] = index
+# Kategori field (semi-optional, retry terbatas, boleh "Unknown"/"N/A") ada di anime_schema.FIELDS
+# Retry maksimal untuk LIMITED_RETRY_FIELDS (characters)
+LIMITED_MAX_RETRIES = 2
 
-    # Print URL anime yang sedang di-scrape
-    url = data.get('source_url', f'https://myanimelist.net/anime/{anime_id}')
-    print(f"{url}", end=" ")
 
+def plan_retry(data, max_retries=4):
+    """
+    Cek null values hasil scrape pertama dan tentukan strategi retry.
+    Return: (null_fields, jumlah retry). Jumlah retry 0 berarti data sudah final.
+    """
     # Cek null values
     null_fields = check_null_values(data)
 
     if not null_fields:
         # Tidak ada null, berhasil!
-        return data, status_code
+        return [], 0
 
     # Ada field yang null, coba fix dengan singular/plural dulu
     fixed = fix_singular_plural_fields(data)
@@ -356,18 +364,12 @@ def scrape_with_retry(anime_id, max_retries=4, index=None):
         # Cek lagi setelah di-fix
         null_fields = check_null_values(data)
         if not null_fields:
-            return data, status_code
-
-    # Field yang memang bisa tidak ada (semi-optional) - langsung null, tidak retry
-    semi_optional_fields = {'Premiered', 'Released_Season', 'Released_Year', 'Demographic', 'Themes', 'Genres'}
-
-    # Field yang butuh retry terbatas (retry max 2x)
-    limited_retry_fields = {'characters'}
+            return [], 0
 
     # Pisahkan null fields berdasarkan kategori
-    critical_nulls = [f for f in null_fields if f not in semi_optional_fields and f not in limited_retry_fields]
-    limited_nulls = [f for f in null_fields if f in limited_retry_fields]
-    semi_nulls = [f for f in null_fields if f in semi_optional_fields]
+    critical_nulls = [f for f in null_fields if f not in SEMI_OPTIONAL_FIELDS and f not in LIMITED_RETRY_FIELDS]
+    limited_nulls = [f for f in null_fields if f in LIMITED_RETRY_FIELDS]
+    semi_nulls = [f for f in null_fields if f in SEMI_OPTIONAL_FIELDS]
 
     # Tentukan strategi retry
     if not critical_nulls and not limited_nulls:
@@ -375,177 +377,335 @@ def scrape_with_retry(anime_id, max_retries=4, index=None):
         print(f"\n  ⚠ Found null fields (semi-optional only): {null_fields} → setting to null")
         for field in semi_nulls:
             data[field] = None
-        return data, status_code
+        return [], 0
     elif not critical_nulls and limited_nulls:
         # Hanya limited retry (characters) dan/atau semi-optional
-        actual_max_retries = 2
-        print(f"\n  ⚠ Found null fields (limited retry): {null_fields} → retry max {actual_max_retries}x")
+        print(f"\n  ⚠ Found null fields (limited retry): {null_fields} → retry max {LIMITED_MAX_RETRIES}x")
+        return null_fields, LIMITED_MAX_RETRIES
     else:
         # Ada critical fields
-        actual_max_retries = max_retries
         print(f"\n  ⚠ Found null fields: {null_fields}")
+        return null_fields, max_retries
 
-    for attempt in range(1, actual_max_retries + 1):
-        print(f"  → Retry attempt {attempt}/{actual_max_retries}...")
-        time.sleep(random.uniform(0.1, .5))  # Delay lebih lama untuk retry
-
-        # Scrape ulang
-        headers = {"User-Agent": random.choice(USER_AGENTS)}
-        new_data, retry_status = scrape_myanimelist(anime_id, headers)
-
-        if not new_data:
-            print(f"  ✗ Retry gagal (error scraping, status: {retry_status})")
-            break
-
-        # Update hanya field yang null
-        updated_fields = []
-        # Field yang boleh bernilai "Unknown"
-        can_be_unknown = ['Episodes', 'Status', 'Premiered', 'Released_Season', 'Released_Year', 'Duration']
-        # Field yang boleh bernilai "N/A"
-        can_be_na = ['Score', 'Ranked']
-
-        for field in null_fields:
-            # Special handling untuk characters (list)
-            if field == 'characters':
-                if field in new_data and isinstance(new_data[field], list) and len(new_data[field]) > 0:
-                    # Characters sekarang ada isinya
-                    data[field] = new_data[field]
-                    updated_fields.append(field)
-            else:
-                # Field biasa
-                if field in new_data and new_data[field] is not None and new_data[field] != '':
-                    # Untuk field tertentu, "Unknown" adalah nilai valid
-                    if new_data[field] == 'Unknown' and field not in can_be_unknown:
-                        # "Unknown" tidak valid untuk field ini, skip
-                        continue
-                    # Untuk field tertentu, "N/A" adalah nilai valid
-                    if new_data[field] == 'N/A' and field not in can_be_na:
-                        # "N/A" tidak valid untuk field ini, skip
-                        continue
-                    # Field yang tadinya null sekarang ada nilainya (bisa juga "Unknown" atau "N/A" untuk field tertentu)
-                    data[field] = new_data[field]
-                    updated_fields.append(field)
-
-        if updated_fields:
-            print(f"  ✓ Berhasil update: {updated_fields}", end=" ")
-
-        # Coba fix singular/plural lagi dari hasil retry
-        fixed = fix_singular_plural_fields(data)
-        if fixed:
-            print(f"\n  ✓ Fixed singular/plural: {fixed}", end=" ")
-
-        # Cek lagi apakah masih ada yang null
-        null_fields = check_null_values(data)
 
-        if not null_fields:
-            print(f"\n  ✓ Semua field terisi setelah {attempt} retries", end=" ")
-            return data, status_code
-
-        # Pisahkan lagi null fields yang tersisa
-        remaining_critical = [f for f in null_fields if f not in semi_optional_fields and f not in limited_retry_fields]
-        remaining_limited = [f for f in null_fields if f in limited_retry_fields]
-        remaining_semi = [f for f in null_fields if f in semi_optional_fields]
-
-        # Jika tidak ada critical yang tersisa
-        if not remaining_critical:
-            # Jika hanya semi-optional, langsung null-kan
-            if not remaining_limited:
-                print(f"\n  ✓ Sisa null hanya semi-optional: {null_fields} → setting to null", end=" ")
-                for field in remaining_semi:
-                    data[field] = None
-                return data, status_code
-            # Jika ada limited tapi sudah retry 2x, null-kan semua sisa (limited + semi)
-            elif attempt >= 2:
-                print(f"\n  ✓ Sisa null: {null_fields} (limited retry reached) → setting to null", end=" ")
-                for field in null_fields:
-                    data[field] = None
-                return data, status_code
-
-    # Masih ada yang null setelah max retries
-    if null_fields:
-        # Null-kan field yang semi-optional dan limited (yang sudah mencapai max retry)
-        final_critical = [f for f in null_fields if f not in semi_optional_fields and f not in limited_retry_fields]
-        final_nullables = [f for f in null_fields if f in semi_optional_fields or f in limited_retry_fields]
-
-        for field in final_nullables:
-            data[field] = None
-
-        if final_critical:
-            print(f"\n  ✗ Max retries reached, masih ada critical null: {final_critical}", end=" ")
+def merge_retry(data, new_data, null_fields, attempt):
+    """
+    Update hanya field yang null dari hasil retry.
+    Return: (null_fields yang tersisa, done). done=True berarti data sudah final.
+    """
+    updated_fields = []
+
+    for field in null_fields:
+        # Special handling untuk characters (list)
+        if field == 'characters':
+            if field in new_data and isinstance(new_data[field], list) and len(new_data[field]) > 0:
+                # Characters sekarang ada isinya
+                data[field] = new_data[field]
+                updated_fields.append(field)
         else:
-            print(f"\n  ✓ Max retries reached, non-critical nulls set to null: {final_nullables}", end=" ")
+            # Field biasa
+            if field in new_data and new_data[field] is not None and new_data[field] != '':
+                # Untuk field tertentu, "Unknown" adalah nilai valid
+                if new_data[field] == 'Unknown' and field not in CAN_BE_UNKNOWN:
+                    # "Unknown" tidak valid untuk field ini, skip
+                    continue
+                # Untuk field tertentu, "N/A" adalah nilai valid
+                if new_data[field] == 'N/A' and field not in CAN_BE_NA:
+                    # "N/A" tidak valid untuk field ini, skip
+                    continue
+                # Field yang tadinya null sekarang ada nilainya (bisa juga "Unknown" atau "N/A" untuk field tertentu)
+                data[field] = new_data[field]
+                updated_fields.append(field)
 
-    return data, status_code
+    if updated_fields:
+        print(f"  ✓ Berhasil update: {updated_fields}", end=" ")
 
+    # Coba fix singular/plural lagi dari hasil retry
+    fixed = fix_singular_plural_fields(data)
+    if fixed:
+        print(f"\n  ✓ Fixed singular/plural: {fixed}", end=" ")
 
-# ==========================================
-# WORKER FUNCTION
-# ==========================================
-class FailureCounter:
-    """Thread-safe failure counter"""
-    def __init__(self):
-        self.count = 0
-        self.lock = threading.Lock()
+    # Cek lagi apakah masih ada yang null
+    null_fields = check_null_values(data)
 
-    def increment(self):
-        with self.lock:
-            self.count += 1
-            return self.count
+    if not null_fields:
+        print(f"\n  ✓ Semua field terisi setelah {attempt} retries", end=" ")
+        return [], True
+
+    # Pisahkan lagi null fields yang tersisa
+    remaining_critical = [f for f in null_fields if f not in SEMI_OPTIONAL_FIELDS and f not in LIMITED_RETRY_FIELDS]
+    remaining_limited = [f for f in null_fields if f in LIMITED_RETRY_FIELDS]
+    remaining_semi = [f for f in null_fields if f in SEMI_OPTIONAL_FIELDS]
+
+    # Jika tidak ada critical yang tersisa
+    if not remaining_critical:
+        # Jika hanya semi-optional, langsung null-kan
+        if not remaining_limited:
+            print(f"\n  ✓ Sisa null hanya semi-optional: {null_fields} → setting to null", end=" ")
+            for field in remaining_semi:
+                data[field] = None
+            return [], True
+        # Jika ada limited tapi sudah retry 2x, null-kan semua sisa (limited + semi)
+        elif attempt >= LIMITED_MAX_RETRIES:
+            print(f"\n  ✓ Sisa null: {null_fields} (limited retry reached) → setting to null", end=" ")
+            for field in null_fields:
+                data[field] = None
+            return [], True
+
+    return null_fields, False
+
+
+def finish_retry(data, null_fields):
+    """Null-kan field yang masih null setelah max retries"""
+    if not null_fields:
+        return
 
-    def reset(self):
-        with self.lock:
-            self.count = 0
+    # Null-kan field yang semi-optional dan limited (yang sudah mencapai max retry)
+    final_critical = [f for f in null_fields if f not in SEMI_OPTIONAL_FIELDS and f not in LIMITED_RETRY_FIELDS]
+    final_nullables = [f for f in null_fields if f in SEMI_OPTIONAL_FIELDS or f in LIMITED_RETRY_FIELDS]
 
-    def get(self):
-        with self.lock:
-            return self.count
+    for field in final_nullables:
+        data[field] = None
 
+    if final_critical:
+        print(f"\n  ✗ Max retries reached, masih ada critical null: {final_critical}", end=" ")
+    else:
+        print(f"\n  ✓ Max retries reached, non-critical nulls set to null: {final_nullables}", end=" ")
 
-failure_counter = FailureCounter()
-MAX_CONSECUTIVE_FAILURES = 20
+
+# ==========================================
+# WORKER FUNCTION
+# ==========================================
+# Retry untuk field critical yang null (null fields characters: LIMITED_MAX_RETRIES)
+MAX_RETRIES = 4
+# Retry kalau fetch gagal (timeout/5xx/429/403), lewat retry queue
+MAX_FETCH_RETRIES = 3
 
 
-def process_anime(idx, url):
-    """
-    Worker function untuk memproses satu anime.
-    Return: (success: bool, status_code: int)
-    """
-    # Extract anime_id from URL
+def parse_anime_id(idx, url):
+    """Extract anime_id dari URL. Return None kalau URL tidak valid."""
     match = re.search(r'/anime/(\d+)', url)
     if not match:
         with print_lock:
             print(f"[Index {idx}] ✗ Invalid URL: {url}")
-        return False, 0
+        return None
+    return int(match.group(1))
 
-    anime_id = int(match.group(1))
 
-    with print_lock:
-        print(f"[Index {idx} | ID {anime_id}] ", end="", flush=True)
+def new_job(idx, url):
+    """Job untuk satu anime dari CSV input. Return None kalau URL tidak valid."""
+    anime_id = parse_anime_id(idx, url)
+    if anime_id is None:
+        return None
+    return {
+        "idx": idx,
+        "url": url,
+        "anime_id": anime_id,
+        "data": None,          # hasil fetch pertama yang berhasil
+        "null_fields": [],     # field yang masih null
+        "max_retries": 0,      # jatah retry null fields (dari plan_retry)
+        "attempt": 0,          # retry null fields yang sudah dilakukan
+        "fetch_failures": 0,   # fetch gagal berturut-turut
+    }
 
-    data, status_code = scrape_with_retry(anime_id, max_retries=4, index=idx)
 
+def record_result(data, status_code, key=None):
+    """
+    Simpan hasil akhir scrape. Kegagalan dicatat di checkpoint dengan key (404 → ABSENT).
+    Deteksi block ditangani circuit breaker di http_session / async_engine.
+    Return: "saved" / "failed"
+    """
     if data and status_code == 200:
-        append_to_csv(data, OUTPUT_FILE)
-        failure_counter.reset()  # Reset counter on success
+        save_result(data)
         with print_lock:
             print("→ ✓ Saved")
-        return True, status_code
+        return "saved"
+
+    if checkpoint is not None:
+        checkpoint.add(ABSENT if status_code == 404 else FAILED, [key])
+    with print_lock:
+        print(f"✗ Failed (status: {status_code})")
+    return "failed"
+
+
+def pages_for_retry(null_fields):
+    """
+    Halaman yang perlu di-fetch ulang untuk mengisi null_fields.
+    Field semi-optional tidak memicu fetch sendiri (tidak di-retry kalau sendirian).
+    """
+    pages = {anime_schema.FIELD_PAGES.get(f, "main") for f in null_fields if f not in SEMI_OPTIONAL_FIELDS}
+    return pages or {"main"}
+
+
+def handle_fetch(job, data, status_code):
+    """
+    Proses hasil satu fetch untuk job, baik fetch pertama maupun retry.
+    Tidak pernah menunggu: kalau perlu retry, caller yang menjadwalkan lewat retry queue.
+    Return: (outcome, status_code, failure_class)
+      outcome "saved" / "failed" / "retry"; failure_class hanya diisi untuk "retry".
+    """
+    if not data:
+        job["fetch_failures"] += 1
+        failure_class = classify_failure(status_code)
+        if failure_class and job["fetch_failures"] <= MAX_FETCH_RETRIES:
+            return "retry", status_code, failure_class
+
+        if job["data"] is None:
+            # Anime tidak ditemukan atau error
+            return record_result(None, status_code, job["anime_id"]), status_code, None
+
+        # Retry null fields gagal di-fetch, simpan data yang sudah ada
+        print(f"  ✗ Retry gagal (error scraping, status: {status_code})")
+        finish_retry(job["data"], job["null_fields"])
+        return record_result(job["data"], 200), 200, None
+
+    job["fetch_failures"] = 0
+
+    if job["data"] is None:
+        # Fetch pertama berhasil
+        data['csv_index'] = job["idx"]
+        # Print URL anime yang sedang di-scrape
+        url = data.get('source_url', ANIME_URL.format(job["anime_id"]))
+        print(f"{url}", end=" ")
+
+        null_fields, max_retries = plan_retry(data, MAX_RETRIES)
+        if not max_retries:
+            return record_result(data, 200), 200, None
+        job.update(data=data, null_fields=null_fields, max_retries=max_retries)
+        return "retry", 200, "missing_fields"
+
+    # Hasil retry: update hanya field yang null
+    job["attempt"] += 1
+    null_fields, done = merge_retry(job["data"], data, job["null_fields"], job["attempt"])
+    if not done and job["attempt"] >= job["max_retries"]:
+        # Masih ada yang null setelah max retries
+        finish_retry(job["data"], null_fields)
+        done = True
+    if done:
+        return record_result(job["data"], 200), 200, None
+
+    job["null_fields"] = null_fields
+    return "retry", 200, "missing_fields"
+
+
+def announce_job(job):
+    if job["data"] is None:
+        print(f"[Index {job['idx']} | ID {job['anime_id']}] ", end="", flush=True)
     else:
-        fail_count = failure_counter.increment()
-        with print_lock:
-            print(f"✗ Failed (status: {status_code})")
+        print(f"[Index {job['idx']} | ID {job['anime_id']}] "
+              f"→ Retry attempt {job['attempt'] + 1}/{job['max_retries']}...")
+
 
-        # Cek apakah sudah 20 kali berturut-turut gagal
-        if fail_count >= MAX_CONSECUTIVE_FAILURES:
-            with print_lock:
-                print(f"\n⚠ WARNING: {MAX_CONSECUTIVE_FAILURES} consecutive failures detected!")
-                print(f"⚠ Possible IP block. Sleeping for 10 seconds...")
-            time.sleep(10)
-            with print_lock:
-                print(f"⚠ Resuming scraping...\n")
-            failure_counter.reset()  # Reset counter
+def process_anime(job):
+    """
+    Worker function untuk satu fetch dari satu job.
+    Return: (outcome, status_code, failure_class), lihat handle_fetch.
+    """
+    with print_lock:
+        announce_job(job)
+
+    # Retry hanya fetch halaman sumber field yang masih null
+    pages = ALL_PAGES if job["data"] is None else pages_for_retry(job["null_fields"])
+
+    headers = {"User-Agent": random.choice(USER_AGENTS)}
+    data, status_code = scrape_myanimelist(job["anime_id"], headers, job["url"], pages)
+    return handle_fetch(job, data, status_code)
+
+
+def schedule_retry(retries, job, failure_class):
+    """Masukkan job ke retry queue dengan backoff sesuai kelas kegagalan."""
+    if failure_class == "missing_fields":
+        attempt = job["attempt"] + 1
+    else:
+        attempt = job["fetch_failures"]
+    delay = retries.push(job, failure_class, attempt)
+    with print_lock:
+        print(f"↻ [Index {job['idx']} | ID {job['anime_id']}] Retry ({failure_class}) dijadwalkan dalam {delay:.1f}s")
+
+
+def run_threads(jobs, num_workers):
+    """
+    Jalankan jobs di ThreadPoolExecutor. Job yang perlu retry masuk retry queue dan baru
+    disubmit lagi setelah jatuh tempo, jadi worker langsung lanjut ke anime berikutnya.
+    Return: (success_count, failed_count)
+    """
+    pending = deque(jobs)
+    retries = RetryQueue()
+    in_flight = {}
+    success_count = 0
+    failed_count = 0
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        while pending or in_flight or len(retries):
+            # Isi worker yang kosong: retry yang sudah jatuh tempo dulu, lalu anime baru
+            while len(in_flight) < num_workers:
+                job = retries.pop_due()
+                if job is None:
+                    if not pending:
+                        break
+                    job = pending.popleft()
+                in_flight[executor.submit(process_anime, job)] = job
+
+            timeout = retries.next_due_in()
+            if not in_flight:
+                # Hanya tersisa retry yang belum jatuh tempo
+                time.sleep(timeout)
+                continue
+
+            # Semua slot terisi: retry yang jatuh tempo tetap harus menunggu slot kosong, jadi
+            # tunggu job selesai saja (timeout 0 di sini membuat loop berputar tanpa henti)
+            if len(in_flight) >= num_workers:
+                timeout = None
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = in_flight.pop(future)
+                try:
+                    outcome, status_code, failure_class = future.result()
+                except Exception as e:
+                    with print_lock:
+                        print(f"[Index {job['idx']}] ✗ Exception: {e}")
+                    failed_count += 1
+                    continue
+
+                if outcome == "retry":
+                    schedule_retry(retries, job, failure_class)
+                elif outcome == "saved":
+                    success_count += 1
+                else:
+                    failed_count += 1
+
+    return success_count, failed_count
+
+
+# ==========================================
+# RESUME
+# ==========================================
+def output_exists(target):
+    if OUTPUT_FORMAT == "parquet":
+        return bool(parquet_writer.part_files(target))
+    return os.path.exists(target)
+
+
+def read_output_keys(target):
+    """CHECKPOINT_KEY semua baris di output (hanya kolom itu yang dibaca), untuk membangun ulang checkpoint."""
+    if OUTPUT_FORMAT == "parquet":
+        return parquet_writer.read_column(target, CHECKPOINT_KEY)
+    if OUTPUT_FORMAT == "sqlite":
+        return sqlite_store.scraped_anime_ids(target)
+    try:
+        return pd.read_csv(target, usecols=[CHECKPOINT_KEY])[CHECKPOINT_KEY].dropna().astype(int).tolist()
+    except (ValueError, pd.errors.ParserError) as e:
+        print(f"Warning: Could not read {CHECKPOINT_KEY} from output file: {e}. Will scrape all.")
+        return []
 
-        return False, status_code
+
+def open_checkpoint(target):
+    """Checkpoint di samping output utama (lihat checkpoint.open_checkpoint)."""
+    if OUTPUT_FORMAT == "parquet":
+        parquet_writer.require_pyarrow()
+    # Nama file memuat key, jadi checkpoint lama (key csv_index) tidak terbaca sebagai id MAL
+    return checkpoint_module.open_checkpoint(f"{target}.{CHECKPOINT_KEY}.checkpoint", target, output_exists(target),
+                                             lambda: read_output_keys(target))
 
 
 # ==========================================
@@ -563,65 +723,70 @@ if __name__ == "__main__":
     # Slice dataframe based on START_INDEX and END_INDEX
     df_slice = df.iloc[START_INDEX:end_idx]
 
-    # Check which indices already exist in output file
-    existing_indices = set()
-    if os.path.exists(OUTPUT_FILE):
-        print(f"Output file exists. Checking for already scraped indices...")
-        try:
-            df_output = pd.read_csv(OUTPUT_FILE)
-            if 'csv_index' in df_output.columns:
-                existing_indices = set(df_output['csv_index'].dropna().astype(int).tolist())
-                print(f"Found {len(existing_indices)} already scraped anime in output file")
-            else:
-                print(f"Warning: 'csv_index' column not found in output file. Will scrape all.")
-        except Exception as e:
-            print(f"Warning: Could not read output file: {e}. Will scrape all.")
-
-    # Filter tasks to only include indices that don't exist in output
-    all_tasks = [(idx, row['url']) for idx, row in df_slice.iterrows()]
-    tasks = [(idx, url) for idx, url in all_tasks if idx not in existing_indices]
+    # Check which anime already exist in output (lewat checkpoint, bukan membaca seluruh output)
+    target = output_target()
+    checkpoint = open_checkpoint(target)
+    existing_ids = checkpoint.ids(COMPLETED)
+    absent_ids = checkpoint.ids(ABSENT)
+    counts = checkpoint.counts()
+    print(f"Checkpoint {checkpoint.path}: {counts['completed']} completed, "
+          f"{counts['failed']} failed, {counts['absent']} absent (404, skipped)")
+
+    # Kolom file output lama harus sama dengan kolom run ini (cek sebelum scraping, bukan di writer)
+    if not output_columns_match():
+        exit(1)
+    if OUTPUT_FORMAT != "sqlite" and "characters" in ANIME_FIELDS:
+        print(f"Known characters in {output_path(OUTPUT_CHARACTERS)}: {load_seen_characters()}")
+
+    # Filter per myanimelist_id dari URL: anime yang sudah selesai, 404, atau dobel di input dilewati
+    all_jobs = [new_job(idx, row['url']) for idx, row in df_slice.iterrows()]
+    invalid_count = sum(job is None for job in all_jobs)
+    jobs = []
+    queued_ids = set()
+    for job in all_jobs:
+        if job is None or job["anime_id"] in existing_ids or job["anime_id"] in absent_ids or job["anime_id"] in queued_ids:
+            continue
+        queued_ids.add(job["anime_id"])
+        jobs.append(job)
 
     print(f"\nRange: index {START_INDEX} to {end_idx} ({len(df_slice)} anime total)")
-    print(f"Already scraped: {len(existing_indices)} anime")
-    print(f"To be scraped: {len(tasks)} anime")
-    print(f"Running with {NUM_WORKERS} parallel workers")
-    if USE_PROXY:
-        print(f"Using proxy: {PROXY_HOST}")
+    print(f"Already scraped: {len(existing_ids)} anime")
+    print(f"To be scraped: {len(jobs)} anime")
+    if ENGINE == "async":
+        print(f"Running async engine with {ASYNC_CONCURRENCY} concurrent requests")
+    else:
+        print(f"Running with {NUM_WORKERS} parallel workers")
+    print(f"Rate limit: {limiter.get_rate():.1f} req/s (adaptive)")
+    if proxy_pool.pool:
+        print(f"Using proxy pool: {len(proxy_pool.pool)} proxies")
     else:
         print("Not using proxy (direct connection)")
     print()
 
-    if len(tasks) == 0:
+    if len(jobs) == 0:
         print("✓ All anime in range already scraped. Nothing to do!")
         exit(0)
 
     # Run parallel scraping
-    success_count = 0
-    failed_count = 0
 
-    with ThreadPoolExecutor(max_workers=NUM_WORKERS) as executor:
-        # Submit all tasks
-        futures = {executor.submit(process_anime, idx, url): (idx, url) for idx, url in tasks}
+    parse_workers = parse_pool.start()
+    print(f"Parsing in {parse_workers} processes" if parse_workers else "Parsing inline (PARSE_WORKERS=inline)")
 
-        # Process completed tasks
-        for future in as_completed(futures):
-            try:
-                success, status_code = future.result()
-                if success:
-                    success_count += 1
-                else:
-                    failed_count += 1
-            except Exception as e:
-                idx, url = futures[future]
-                with print_lock:
-                    print(f"[Index {idx}] ✗ Exception: {e}")
-                failed_count += 1
-
-            # Small delay between processing completed tasks
-            time.sleep(random.uniform(0.1, 0.3))
+    if ENGINE == "async":
+        import async_engine
+        # Modul ini sendiri (writers, checkpoint, seen_characters), bukan hasil import ulang scrape_all_anime
+        success_count, failed_count = async_engine.run(sys.modules[__name__], jobs, ASYNC_CONCURRENCY)
+    else:
+        http_session.init_pool(NUM_WORKERS)
+        success_count, failed_count = run_threads(jobs, NUM_WORKERS)
+    failed_count += invalid_count
+    close_writers()
+    checkpoint.close()
 
     print("\n" + "="*80)
-    print(f"Selesai! Attempted to scrape {len(tasks)} anime (from range {START_INDEX} to {end_idx})")
+    print(f"Selesai! Attempted to scrape {len(jobs) + invalid_count} anime (from range {START_INDEX} to {end_idx})")
     print(f"Success: {success_count} | Failed: {failed_count}")
-    print(f"Total in output file now: {len(existing_indices) + success_count}")
+    print(f"Total in output file now: {len(existing_ids) + success_count}")
+    if http_session.stream_stats["pages"]:
+        print(http_session.stream_summary())
     print("="*80)
\ No newline at end of file
@@ -1,14 +1,22 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import Comment, NavigableString
 import pandas as pd
 import os
 import re
 import json
 import random
-import time
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+import http_session
+import page_cache
+import proxy_pool
+import parse_pool
+import sqlite_store
+from html_parser import make_soup
+from csv_writer import BackgroundWriter, CsvAppendWriter
+from checkpoint import open_checkpoint, COMPLETED, FAILED, ABSENT
+from rate_limiter import limiter
 
 # Load environment variables
 load_dotenv()
@@ -18,17 +26,17 @@ load_dotenv()
 # ==========================================
 INPUT_CSV = "mal_characters.csv"
 OUTPUT_FILE = "mal_characters_detailed.csv"
+OUTPUT_DB = sqlite_store.OUTPUT_DB
+
+# Output: "csv" (OUTPUT_FILE) atau "sqlite" (tabel character di OUTPUT_DB, lihat sqlite_store.py)
+OUTPUT_FORMAT = os.getenv("OUTPUT_FORMAT", "csv").lower()
 
 # Configuration from .env file
 START_INDEX = int(os.getenv("START_INDEX", "0"))
 END_INDEX = int(os.getenv("END_INDEX", "-1"))
 NUM_WORKERS = 5
 
-# Proxy configuration
-USE_PROXY = False
-PROXY_HOST = os.getenv("PROXY_HOST", "")
-PROXY_USER = os.getenv("PROXY_USER", "")
-PROXY_PASS = os.getenv("PROXY_PASS", "")
+# Proxy configuration: lihat proxy_pool.py (USE_PROXY, PROXY_LIST, PROXY_FILE, ...)
 
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
@@ -45,39 +53,26 @@ print_lock = threading.Lock()
 # ==========================================
 # HELPER FUNCTIONS
 # ==========================================
-def get_proxies():
-    """Generate proxy configuration for requests"""
-    if not USE_PROXY:
-        return None
-
-    proxy_url = f"http://{PROXY_USER}:{PROXY_PASS}@{PROXY_HOST}"
-    return {
-        'http': proxy_url,
-        'https': proxy_url
-    }
-
-
 def scrape_character(character_id, url):
     """Scrape character details from MyAnimeList character page"""
-    proxies = get_proxies()
     headers = {"User-Agent": random.choice(USER_AGENTS)}
 
     # Try up to 3 times with different user agents
     for attempt in range(3):
         try:
             if attempt > 0:
-                # Wait a bit before retry
-                time.sleep(random.uniform(0.2, 1))
+                # Pacing retry diatur oleh rate limiter global
                 headers = {"User-Agent": random.choice(USER_AGENTS)}
 
-            res = requests.get(url, headers=headers, proxies=proxies, timeout=30)
+            res = http_session.fetch(url, headers=headers, timeout=30)
         except requests.exceptions.RequestException:
             if attempt == 2:
                 return None, 0
             continue
 
         if res.status_code != 200:
-            if attempt == 2:
+            # Cache miss di mode offline tidak berubah dengan retry
+            if attempt == 2 or res.status_code == page_cache.CACHE_MISS:
                 return None, res.status_code
             continue
 
@@ -87,7 +82,65 @@ def scrape_character(character_id, url):
 
         break  # Success or final attempt
 
-    soup = BeautifulSoup(res.text, "html.parser")
+    # Parsing di process pool, thread ini hanya melakukan I/O
+    data = parse_pool.parse(parse_character_page, res.text, character_id, url)
+    return data, 200
+
+
+def is_section_break(tag):
+    """Elemen yang menandai akhir attributes/description: div iklan, table, h2/h3, div.normal_header"""
+    if tag.name in ("table", "h2", "h3"):
+        return True
+    if tag.name == "div":
+        class_str = " ".join(tag.get("class", []))
+        return "sUaidzctQfngSNMH" in class_str or "normal_header" in class_str
+    return False
+
+
+def spoiler_text(spoiler_div):
+    """Teks spoiler (tanpa tombol) untuk disisipkan inline, atau '' kalau tidak ada spoiler_content"""
+    spoiler_content = spoiler_div.find('span', class_='spoiler_content')
+    if not spoiler_content:
+        return ''
+    for button in spoiler_content.find_all('input'):
+        button.decompose()
+    # Jangan tambah newline, spoiler melanjutkan value sebelumnya
+    return f" {spoiler_content.get_text(separator=' ').strip()}"
+
+
+def text_after_header(header):
+    """
+    Teks semua sibling setelah header sampai section berikutnya, <br> menjadi newline
+    dan div.spoiler diganti isi spoilernya. Tree diubah di tempat (tidak di-parse ulang).
+    """
+    parts = []
+    for sibling in list(header.next_siblings):
+        if isinstance(sibling, NavigableString):
+            if not isinstance(sibling, Comment):
+                parts.append(str(sibling))
+            continue
+        if is_section_break(sibling) or sibling.find(is_section_break):
+            break
+
+        if sibling.name == "br":
+            parts.append("\n")
+            continue
+        for br in sibling.find_all("br"):
+            br.replace_with("\n")
+
+        if sibling.name == "div" and "spoiler" in sibling.get("class", []):
+            parts.append(spoiler_text(sibling))
+            continue
+        for spoiler_div in sibling.find_all('div', class_='spoiler'):
+            spoiler_div.replace_with(spoiler_text(spoiler_div))
+        parts.append(sibling.get_text())
+
+    return "".join(parts)
+
+
+def parse_character_page(html, character_id, url):
+    """Parse HTML halaman character. Return dict data, atau None kalau header tidak ditemukan."""
+    soup = make_soup(html)
 
     # Extract full name and alternate name from header
     # Try different selectors
@@ -118,8 +171,8 @@ def scrape_character(character_id, url):
 
     if not header:
         # Debug: print first 500 chars of HTML
-        print(f"\n  ⚠ Header not found. HTML preview: {res.text[:500]}")
-        return None, 200
+        print(f"\n  ⚠ Header not found. HTML preview: {html[:500]}")
+        return None
 
     # Get full name (text before <span>)
     full_name = ""
@@ -147,98 +200,9 @@ def scrape_character(character_id, url):
         "alternate_name": alternate_name,
     }
 
-    # Get HTML content after h2 header
-    # Strategy: The attributes and description are direct siblings after the h2 tag
-    # They are text nodes and <br> tags, not wrapped in any parent element
-
-    # Method 1: Get the parent and find content after h2
-    parent = header.parent
-
-    # Convert parent to string to work with raw HTML
-    parent_html = str(parent)
-
-    # Find the h2 tag position in parent HTML
-    h2_html = str(header)
-    h2_start = parent_html.find(h2_html)
-
-    if h2_start == -1:
-        # Fallback: try getting next siblings
-        content_parts = []
-        for sibling in header.next_siblings:
-            if sibling.name in ['div', 'table', 'h2', 'h3']:
-                # Check if it's an ad div we should skip
-                if sibling.name == 'div':
-                    classes = sibling.get('class', [])
-                    if classes:
-                        class_str = ' '.join(classes)
-                        if 'sUaidzctQfngSNMH' in class_str or 'ad-' in class_str:
-                            continue
-                # Otherwise stop at major sections
-                break
-            content_parts.append(str(sibling))
-
-        content_after_h2 = ''.join(content_parts)
-    else:
-        # Extract everything after the h2 closing tag
-        h2_end = h2_start + len(h2_html)
-        remaining_html = parent_html[h2_end:]
-
-        # Find next major section (div with ads, table, another h2, etc)
-        # Look for the FIRST occurrence of any major element
-        matches = []
-
-        # Find div with ad class
-        div_match = re.search(r'<div[^>]*sUaidzctQfngSNMH[^>]*>', remaining_html, re.IGNORECASE)
-        if div_match:
-            matches.append(div_match.start())
-
-        # Find table
-        table_match = re.search(r'<table', remaining_html, re.IGNORECASE)
-        if table_match:
-            matches.append(table_match.start())
-
-        # Find next h2 or h3
-        header_match = re.search(r'<h[23]', remaining_html, re.IGNORECASE)
-        if header_match:
-            matches.append(header_match.start())
-
-        # Find normal_header div
-        normal_header_match = re.search(r'<div[^>]*normal_header[^>]*>', remaining_html, re.IGNORECASE)
-        if normal_header_match:
-            matches.append(normal_header_match.start())
-
-        # Use the earliest match as cutoff point
-        if matches:
-            cutoff = min(matches)
-            content_after_h2 = remaining_html[:cutoff]
-        else:
-            content_after_h2 = remaining_html
-
-    # First, manually replace <br> tags with newlines in the raw HTML
-    # This avoids issues with BeautifulSoup truncating content
-    content_after_h2 = re.sub(r'<br\s*/?>', '\n', content_after_h2, flags=re.IGNORECASE)
-
-    # Now parse with BeautifulSoup to clean remaining HTML
-    temp_soup = BeautifulSoup(content_after_h2, 'html.parser')
-
-    # Handle spoiler divs - extract their content but mark as spoiler
-    for spoiler_div in temp_soup.find_all('div', class_='spoiler'):
-        # Find the spoiler content span
-        spoiler_content = spoiler_div.find('span', class_='spoiler_content')
-        if spoiler_content:
-            # Get the text inside spoiler, removing any buttons
-            for button in spoiler_content.find_all('input'):
-                button.decompose()
-            spoiler_text = spoiler_content.get_text(separator=' ').strip()
-            # Replace the entire spoiler div with the spoiler text inline
-            # Don't add newlines, just continue the value
-            spoiler_div.replace_with(f' {spoiler_text}')
-        else:
-            # If no spoiler content span, just remove the div
-            spoiler_div.decompose()
-
-    # Get the text content
-    text_content = temp_soup.get_text()
+    # Attributes dan description adalah sibling langsung setelah h2 (text node dan <br>),
+    # tidak dibungkus elemen apa pun. Ambil teksnya langsung dari tree yang sama.
+    text_content = text_after_header(header)
 
     # Split by newlines and process
     lines = text_content.split('\n')
@@ -290,60 +254,48 @@ def scrape_character(character_id, url):
         if len(description) > 20:
             data['description'] = description
 
-    return data, 200
+    return data
 
 
-def append_to_csv(data, filename):
-    """Thread-safe CSV writing with fixed columns"""
-    with csv_lock:
-        # Define fixed columns order
-        columns = ['character_id', 'full_name', 'alternate_name', 'name', 'url', 'attributes', 'description']
-
-        # Ensure all columns exist in data
-        for col in columns:
-            if col not in data:
-                data[col] = None
-
-        # Only keep the defined columns
-        data_clean = {col: data[col] for col in columns}
-
-        # Check if file exists
-        file_exists = os.path.exists(filename)
-
-        if file_exists:
-            # Append to existing file
-            df_existing = pd.read_csv(filename)
-            df_new = pd.DataFrame([data_clean])
-            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-            df_combined.to_csv(filename, index=False)
-        else:
-            # Create new file with fixed columns
-            df_new = pd.DataFrame([data_clean], columns=columns)
-            df_new.to_csv(filename, index=False)
+# Urutan kolom tetap output
+CSV_COLUMNS = ['character_id', 'full_name', 'alternate_name', 'name', 'url', 'attributes', 'description']
 
+# Satu BackgroundWriter per file output (dibuat saat baris pertama ditulis)
+writers = {}
 
-class FailureCounter:
-    """Thread-safe failure counter"""
-    def __init__(self):
-        self.count = 0
-        self.lock = threading.Lock()
+# Checkpoint resume (checkpoint.py), dibuka di main: character_id selesai / gagal / 404
+checkpoint = None
 
-    def increment(self):
-        with self.lock:
-            self.count += 1
-            return self.count
 
-    def reset(self):
-        with self.lock:
-            self.count = 0
+def get_writer(path, make_writer):
+    """BackgroundWriter untuk path; character_id dicatat di checkpoint setelah barisnya di-flush."""
+    with csv_lock:
+        writer = writers.get(path)
+        if writer is None:
+            writer = writers[path] = BackgroundWriter(make_writer(path), checkpoint, "character_id")
+    return writer
+
+
+def append_to_csv(data, filename):
+    """Thread-safe CSV writing with fixed columns (append-only, flush per batch)"""
+    # lineterminator "\n" sama dengan file lama yang ditulis pandas
+    get_writer(filename, lambda path: CsvAppendWriter(path, CSV_COLUMNS, lineterminator="\n")).write(data)
+
 
-    def get(self):
-        with self.lock:
-            return self.count
+def save_to_db(data, path):
+    """Upsert detail character ke tabel character (batch per transaksi)."""
+    get_writer(path, lambda path: sqlite_store.SqliteWriter(path, CSV_COLUMNS, table="character")).write(data)
 
 
-failure_counter = FailureCounter()
-MAX_CONSECUTIVE_FAILURES = 20
+def read_output_ids(target):
+    """character_id di output (hanya kolom itu yang dibaca), untuk membangun ulang checkpoint."""
+    if OUTPUT_FORMAT == "sqlite":
+        return sqlite_store.detailed_character_ids(target)
+    try:
+        return pd.read_csv(target, usecols=["character_id"])["character_id"].dropna().astype(int).tolist()
+    except (ValueError, pd.errors.ParserError) as e:
+        print(f"Warning: Could not read output file: {e}")
+        return []
 
 
 def process_character(idx, character_id, name, url):
@@ -358,26 +310,19 @@ def process_character(idx, character_id, name, url):
         data['name'] = name
         data['url'] = url
 
-        append_to_csv(data, OUTPUT_FILE)
-        failure_counter.reset()
+        if OUTPUT_FORMAT == "sqlite":
+            save_to_db(data, OUTPUT_DB)
+        else:
+            append_to_csv(data, OUTPUT_FILE)
         with print_lock:
             print("→ ✓ Saved")
         return True, status_code
     else:
-        fail_count = failure_counter.increment()
+        # Deteksi block ditangani circuit breaker di http_session
+        if checkpoint is not None:
+            checkpoint.add(ABSENT if status_code == 404 else FAILED, [character_id])
         with print_lock:
             print(f"✗ Failed (status: {status_code})")
-
-        # Check for consecutive failures
-        if fail_count >= MAX_CONSECUTIVE_FAILURES:
-            with print_lock:
-                print(f"\n⚠ WARNING: {MAX_CONSECUTIVE_FAILURES} consecutive failures!")
-                print(f"⚠ Possible IP block. Sleeping for 10 seconds...")
-            time.sleep(10)
-            with print_lock:
-                print(f"⚠ Resuming scraping...\n")
-            failure_counter.reset()
-
         return False, status_code
 
 
@@ -397,29 +342,29 @@ if __name__ == "__main__":
     df_slice = df.iloc[START_INDEX:end_idx]
 
     # Check which characters already scraped
-    existing_ids = set()
-    if os.path.exists(OUTPUT_FILE):
-        print(f"Output file exists. Checking already scraped characters...")
-        try:
-            df_output = pd.read_csv(OUTPUT_FILE)
-            if 'character_id' in df_output.columns:
-                existing_ids = set(df_output['character_id'].dropna().astype(int).tolist())
-                print(f"Found {len(existing_ids)} already scraped characters")
-        except Exception as e:
-            print(f"Warning: Could not read output file: {e}")
+    # Checkpoint di samping output (tabel character di OUTPUT_DB punya checkpoint sendiri)
+    target = OUTPUT_DB if OUTPUT_FORMAT == "sqlite" else OUTPUT_FILE
+    checkpoint_path = target + (".characters.checkpoint" if OUTPUT_FORMAT == "sqlite" else ".checkpoint")
+    checkpoint = open_checkpoint(checkpoint_path, target, os.path.exists(target), lambda: read_output_ids(target))
+    existing_ids = checkpoint.ids(COMPLETED)
+    absent_ids = checkpoint.ids(ABSENT)
+    counts = checkpoint.counts()
+    print(f"Checkpoint {checkpoint.path}: {counts['completed']} completed, "
+          f"{counts['failed']} failed, {counts['absent']} absent (404, skipped)")
 
     # Filter tasks
     all_tasks = [(idx, row['character_id'], row['name'], row['url'])
                  for idx, row in df_slice.iterrows()]
     tasks = [(idx, cid, name, url) for idx, cid, name, url in all_tasks
-             if cid not in existing_ids]
+             if cid not in existing_ids and cid not in absent_ids]
 
     print(f"\nRange: index {START_INDEX} to {end_idx} ({len(df_slice)} characters total)")
     print(f"Already scraped: {len(existing_ids)} characters")
     print(f"To be scraped: {len(tasks)} characters")
     print(f"Running with {NUM_WORKERS} parallel workers")
-    if USE_PROXY:
-        print(f"Using proxy: {PROXY_HOST}")
+    print(f"Rate limit: {limiter.get_rate():.1f} req/s (adaptive)")
+    if proxy_pool.pool:
+        print(f"Using proxy pool: {len(proxy_pool.pool)} proxies")
     print()
 
     if len(tasks) == 0:
@@ -427,6 +372,9 @@ if __name__ == "__main__":
         exit(0)
 
     # Run parallel scraping
+    parse_workers = parse_pool.start()
+    print(f"Parsing in {parse_workers} processes" if parse_workers else "Parsing inline (PARSE_WORKERS=inline)")
+    http_session.init_pool(NUM_WORKERS)
     success_count = 0
     failed_count = 0
 
@@ -447,7 +395,9 @@ if __name__ == "__main__":
                     print(f"[Index {idx} | ID {cid}] ✗ Exception: {e}")
                 failed_count += 1
 
-            time.sleep(random.uniform(0.1, 0.3))
+    for writer in writers.values():
+        writer.close()
+    checkpoint.close()
 
     print("\n" + "="*80)
     print(f"Selesai! Attempted to scrape {len(tasks)} characters")
@@ -0,0 +1,329 @@
+"""
+Output SQLite (OUTPUT_FORMAT=sqlite) untuk scrape_all_anime.py dan scrape_characters.py.
+
+Satu file database (OUTPUT_DB) dengan tabel:
+    anime            satu baris per myanimelist_id (upsert: scrape ulang menimpa baris lama)
+    character        satu baris per character_id; dari halaman /characters anime (id, name, url)
+                     dan dari scrape_characters.py (detail, detail_scraped_at)
+    anime_character  relasi (anime_id, character_id, role)
+
+Mode WAL, jadi query baca tidak menunggu writer dan kedua scraper bisa menulis ke file yang
+sama. Baris ditulis per batch dalam satu transaksi (WRITE_BATCH_SIZE / WRITE_FLUSH_INTERVAL).
+Kolom angka disimpan bertipe (Score REAL, Members/Ranked/... INTEGER, "N/A" → NULL), kolom
+list/dict sebagai JSON.
+
+Pengganti deduplicate_files.py + extract_missing_dedup.py:
+    python sqlite_store.py import mal_anime_merged_dedup.csv [mal_anime.db]
+    python sqlite_store.py missing mal_all_season_anime_dedup.csv mal_anime_to_scrape.csv [mal_anime.db]
+"""
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+from csv_writer import WRITE_BATCH_SIZE, WRITE_FLUSH_INTERVAL
+from parquet_writer import INT_FIELDS, FLOAT_FIELDS, parse_int, parse_float, parse_json
+
+# ==========================================
+# KONFIGURASI
+# ==========================================
+OUTPUT_DB = "mal_anime.db"
+
+# Detik menunggu lock tulis kalau proses lain (scraper lain) sedang commit
+BUSY_TIMEOUT = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS anime (
+    myanimelist_id INTEGER PRIMARY KEY,
+    scraped_at REAL
+);
+CREATE TABLE IF NOT EXISTS character (
+    character_id INTEGER PRIMARY KEY,
+    name TEXT,
+    url TEXT,
+    full_name TEXT,
+    alternate_name TEXT,
+    attributes TEXT,
+    description TEXT,
+    detail_scraped_at REAL
+);
+CREATE TABLE IF NOT EXISTS anime_character (
+    anime_id INTEGER NOT NULL,
+    character_id INTEGER NOT NULL,
+    role TEXT,
+    PRIMARY KEY (anime_id, character_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS anime_character_by_character ON anime_character (character_id);
+CREATE INDEX IF NOT EXISTS character_detail ON character (detail_scraped_at);
+"""
+
+# Index tabel anime, dibuat kalau kolomnya ada (kolom mengikuti ANIME_FIELDS)
+ANIME_INDEXES = {
+    "anime_season": ("Released_Year", "Released_Season"),
+    "anime_status": ("Status",),
+}
+
+CHARACTER_DETAIL_COLUMNS = ("name", "url", "full_name", "alternate_name", "attributes", "description")
+
+
+def quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def column_type(column):
+    if column in INT_FIELDS:
+        return "INTEGER"
+    if column in FLOAT_FIELDS:
+        return "REAL"
+    return "TEXT"
+
+
+def connect(path=OUTPUT_DB):
+    """Koneksi WAL dengan schema dasar. Boleh dipakai dari thread lain (akses dijaga caller)."""
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def ensure_anime_columns(conn, columns):
+    """Tambah kolom anime yang belum ada (ANIME_FIELDS bisa berubah antar run) dan index-nya."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(anime)")}
+    with conn:
+        for column in columns:
+            if column not in existing:
+                conn.execute(f"ALTER TABLE anime ADD COLUMN {quote(column)} {column_type(column)}")
+                existing.add(column)
+        for name, index_columns in ANIME_INDEXES.items():
+            if all(column in existing for column in index_columns):
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON anime "
+                             f"({', '.join(quote(column) for column in index_columns)})")
+
+
+# ==========================================
+# UPSERT
+# ==========================================
+def anime_value(column, value):
+    if column in INT_FIELDS:
+        return parse_int(value)
+    if column in FLOAT_FIELDS:
+        return parse_float(value)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, float) and value != value:
+        return None  # NaN dari pandas
+    return value
+
+
+def upsert_anime(conn, rows, columns):
+    """
+    Upsert hasil scrape_myanimelist (dict) ke anime; kolom characters masuk ke character +
+    anime_character. Baris tanpa myanimelist_id dilewati. Caller yang membuka transaksi.
+    """
+    columns = [column for column in columns if column not in ("myanimelist_id", "characters")]
+    names = ["myanimelist_id", *columns, "scraped_at"]
+    sql = (f"INSERT INTO anime ({', '.join(quote(n) for n in names)}) VALUES ({', '.join('?' * len(names))}) "
+           f"ON CONFLICT(myanimelist_id) DO UPDATE SET "
+           + ", ".join(f"{quote(n)} = excluded.{quote(n)}" for n in names[1:]))
+
+    now = time.time()
+    anime_rows, characters, edges, replaced = [], {}, [], []
+    for data in rows:
+        anime_id = parse_int(data.get("myanimelist_id"))
+        if anime_id is None:
+            continue
+        anime_rows.append([anime_id, *(anime_value(column, data.get(column)) for column in columns), now])
+
+        entries = parse_json(data.get("characters"))
+        if entries is None:
+            continue  # halaman characters tidak di-fetch: relasi lama dibiarkan
+        replaced.append((anime_id,))
+        for entry in entries:
+            character_id = parse_int(entry.get("id"))
+            if character_id is None:
+                continue
+            characters[character_id] = (character_id, entry.get("name"), entry.get("url"))
+            edges.append((anime_id, character_id, entry.get("role")))
+
+    conn.executemany(sql, anime_rows)
+    conn.executemany("DELETE FROM anime_character WHERE anime_id = ?", replaced)
+    conn.executemany("INSERT INTO character (character_id, name, url) VALUES (?, ?, ?) "
+                     "ON CONFLICT(character_id) DO UPDATE SET name = excluded.name, url = excluded.url",
+                     characters.values())
+    conn.executemany("INSERT OR REPLACE INTO anime_character (anime_id, character_id, role) VALUES (?, ?, ?)", edges)
+    return len(anime_rows)
+
+
+def upsert_character_details(conn, rows):
+    """Upsert hasil scrape_characters.parse_character_page (+ name, url). Caller yang membuka transaksi."""
+    now = time.time()
+    names = ["character_id", *CHARACTER_DETAIL_COLUMNS, "detail_scraped_at"]
+    values = [[parse_int(data.get("character_id")), *(anime_value(c, data.get(c)) for c in CHARACTER_DETAIL_COLUMNS), now]
+              for data in rows]
+    values = [row for row in values if row[0] is not None]
+    conn.executemany(f"INSERT INTO character ({', '.join(names)}) VALUES ({', '.join('?' * len(names))}) "
+                     f"ON CONFLICT(character_id) DO UPDATE SET "
+                     + ", ".join(f"{n} = excluded.{n}" for n in names[1:]), values)
+    return len(values)
+
+
+# ==========================================
+# WRITER
+# ==========================================
+class SqliteWriter:
+    """
+    Writer thread-safe dengan antarmuka sama seperti csv_writer.CsvAppendWriter: baris
+    dikumpulkan, setiap flush menjadi satu transaksi upsert.
+    table="anime" untuk hasil scrape_all_anime.py, "character" untuk scrape_characters.py.
+    """
+
+    def __init__(self, path, columns, batch_size=WRITE_BATCH_SIZE,
+                 flush_interval=WRITE_FLUSH_INTERVAL, table="anime"):
+        if table not in ("anime", "character"):
+            raise ValueError(f"table tidak dikenal: {table!r} (pilihan: anime, character)")
+        self.filename = path
+        self.columns = list(columns)
+        self.table = table
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self.lock = threading.Lock()
+        self.pending = []
+        self.last_flush = time.monotonic()
+        self.conn = connect(path)
+        if table == "anime":
+            ensure_anime_columns(self.conn, [c for c in self.columns if c != "characters"])
+
+    def write(self, row):
+        with self.lock:
+            if self.conn is None:
+                raise ValueError(f"{self.filename}: writer sudah ditutup")
+            self.pending.append(row)
+            if len(self.pending) >= self.batch_size or time.monotonic() - self.last_flush >= self.flush_interval:
+                self._flush()
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        self.last_flush = time.monotonic()
+        if self.conn is None or not self.pending:
+            return
+        with self.conn:
+            if self.table == "anime":
+                upsert_anime(self.conn, self.pending, self.columns)
+            else:
+                upsert_character_details(self.conn, self.pending)
+        self.rows_written += len(self.pending)
+        self.pending.clear()
+
+    def close(self):
+        with self.lock:
+            if self.conn is None:
+                return
+            self._flush()
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ==========================================
+# QUERY
+# ==========================================
+def scraped_anime_ids(path=OUTPUT_DB):
+    """myanimelist_id semua anime yang sudah tersimpan (untuk resume scrape_all_anime.py)."""
+    if not os.path.exists(path):
+        return set()
+    conn = connect(path)
+    try:
+        return {row[0] for row in conn.execute("SELECT myanimelist_id FROM anime")}
+    finally:
+        conn.close()
+
+
+def detailed_character_ids(path=OUTPUT_DB):
+    """character_id yang detailnya sudah di-scrape (untuk resume scrape_characters.py)."""
+    if not os.path.exists(path):
+        return set()
+    conn = connect(path)
+    try:
+        return {row[0] for row in conn.execute(
+            "SELECT character_id FROM character WHERE detail_scraped_at IS NOT NULL")}
+    finally:
+        conn.close()
+
+
+def missing_anime_ids(conn, anime_ids):
+    """anime_ids (urutan dipertahankan) yang belum ada di tabel anime, lewat lookup primary key."""
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (position INTEGER PRIMARY KEY, anime_id INTEGER)")
+    conn.execute("DELETE FROM temp.wanted")
+    conn.executemany("INSERT INTO temp.wanted (anime_id) VALUES (?)", ((i,) for i in anime_ids))
+    return [row[0] for row in conn.execute(
+        "SELECT w.anime_id FROM temp.wanted w LEFT JOIN anime a ON a.myanimelist_id = w.anime_id "
+        "WHERE a.myanimelist_id IS NULL ORDER BY w.position")]
+
+
+# ==========================================
+# CLI
+# ==========================================
+def extract_anime_id(url):
+    match = re.search(r'/anime/(\d+)', str(url))
+    return int(match.group(1)) if match else None
+
+
+def import_csv(csv_path, db_path=OUTPUT_DB, chunk_size=1000):
+    """Muat output CSV scrape_all_anime.py ke database (upsert: baris terakhir per id yang menang)."""
+    import pandas as pd
+
+    columns = [c for c in pd.read_csv(csv_path, nrows=0).columns]
+    conn = connect(db_path)
+    ensure_anime_columns(conn, [c for c in columns if c != "characters"])
+    total = 0
+    for chunk in pd.read_csv(csv_path, dtype=str, keep_default_na=False, na_values=[""], chunksize=chunk_size):
+        with conn:
+            total += upsert_anime(conn, chunk.to_dict("records"), columns)
+    count = conn.execute("SELECT COUNT(*) FROM anime").fetchone()[0]
+    conn.close()
+    return total, count
+
+
+def export_missing(input_csv, output_csv, db_path=OUTPUT_DB):
+    """Tulis anime di input_csv yang belum ada di database ke output_csv (kolom title, url)."""
+    import pandas as pd
+
+    df = pd.read_csv(input_csv)
+    df["anime_id"] = df["url"].map(extract_anime_id)
+    df = df[df["anime_id"].notna()].drop_duplicates(subset="anime_id")
+    conn = connect(db_path)
+    missing = set(missing_anime_ids(conn, df["anime_id"].astype(int).tolist()))
+    conn.close()
+    df_missing = df[df["anime_id"].isin(missing)][["title", "url"]]
+    df_missing.to_csv(output_csv, index=False)
+    return len(df), len(df_missing)
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command == "import" and len(sys.argv) > 2:
+        db_path = sys.argv[3] if len(sys.argv) > 3 else OUTPUT_DB
+        rows, count = import_csv(sys.argv[2], db_path)
+        print(f"✓ {rows} baris di-upsert → {db_path} ({count} anime unik)")
+    elif command == "missing" and len(sys.argv) > 3:
+        db_path = sys.argv[4] if len(sys.argv) > 4 else OUTPUT_DB
+        total, missing = export_missing(sys.argv[2], sys.argv[3], db_path)
+        print(f"✓ {missing} dari {total} anime belum di-scrape → {sys.argv[3]}")
+    else:
+        print("Usage:\n"
+              "  python sqlite_store.py import SCRAPED.csv [DB]\n"
+              "  python sqlite_store.py missing INPUT.csv OUTPUT.csv [DB]")
+        sys.exit(1)
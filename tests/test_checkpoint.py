@@ -0,0 +1,139 @@
+"""
+Resume lewat checkpoint setelah proses mati di tengah run.
+
+Scraper dijalankan di subprocess (file ini sebagai script) dengan output di tmp_path; "crash"
+berarti os._exit tanpa close_writers / atexit, jadi baris yang belum di-flush hilang.
+"""
+import os
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT_DIR, "benchmarks", "fixtures")
+NUM_ANIME = 10
+
+
+def run_scraper(tmp_path, mode, ids):
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), mode, *map(str, ids)],
+                            cwd=tmp_path, capture_output=True, text=True, timeout=60)
+    assert result.returncode == (1 if mode == "crash" else 0), result.stdout + result.stderr
+    return result.stdout
+
+
+def completed_ids(tmp_path):
+    from checkpoint import Checkpoint, COMPLETED
+    checkpoint = Checkpoint(os.path.join(tmp_path, "mal_anime_scraped.csv.myanimelist_id.checkpoint"))
+    ids = checkpoint.ids(COMPLETED)
+    checkpoint.close()
+    return ids
+
+
+def test_crash_keeps_character_rows_of_completed_anime(tmp_path):
+    run_scraper(tmp_path, "crash", range(1, 7))
+
+    # Anime yang sudah COMPLETED harus punya semua relasi dan character-nya di disk
+    completed = completed_ids(tmp_path)
+    assert completed
+    edges = pd.read_csv(tmp_path / "mal_anime_characters.csv")
+    characters = pd.read_csv(tmp_path / "mal_characters.csv")
+    per_anime = edges.groupby("anime_id").size()
+    assert all(per_anime.get(anime_id, 0) == 8 for anime_id in completed)
+    assert set(edges["character_id"]) <= set(characters["character_id"])
+
+    # Resume: hanya id yang belum COMPLETED yang di-scrape ulang
+    output = run_scraper(tmp_path, "resume", range(1, NUM_ANIME + 1))
+    assert f"todo {NUM_ANIME - len(completed)}" in output
+    assert completed_ids(tmp_path) == set(range(1, NUM_ANIME + 1))
+    edges = pd.read_csv(tmp_path / "mal_anime_characters.csv").drop_duplicates()
+    characters = pd.read_csv(tmp_path / "mal_characters.csv")
+    assert edges.groupby("anime_id").size().to_dict() == {anime_id: 8 for anime_id in range(1, NUM_ANIME + 1)}
+    assert characters["character_id"].is_unique and set(edges["character_id"]) == set(characters["character_id"])
+
+
+def test_absent_ids_survive_run_without_output(tmp_path, monkeypatch):
+    import scrape_all_anime as saa
+    from checkpoint import COMPLETED, FAILED, ABSENT
+
+    # Run pertama: semua fetch 404 / gagal, tidak ada baris output yang ditulis
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(saa, "checkpoint", saa.open_checkpoint(saa.output_target()))
+    for anime_id in (1, 2, 3):
+        saa.record_result(None, 404, anime_id)
+    saa.record_result(None, 503, 4)
+    saa.checkpoint.add(COMPLETED, [5])  # sisa run lama yang output-nya sudah dihapus
+    saa.checkpoint.close()
+    assert not os.path.exists(saa.output_target())
+
+    # Resume: id 404 tetap dilewati, id gagal di-retry, COMPLETED tanpa output dibuang
+    checkpoint = saa.open_checkpoint(saa.output_target())
+    assert checkpoint.ids(ABSENT) == {1, 2, 3}
+    assert checkpoint.ids(FAILED) == {4}
+    assert checkpoint.ids(COMPLETED) == set()
+    checkpoint.close()
+    checkpoint = saa.open_checkpoint(saa.output_target())
+    assert checkpoint.counts() == {"completed": 0, "failed": 1, "absent": 3}
+    checkpoint.close()
+
+
+def test_header_checked_for_every_output_file(tmp_path, monkeypatch):
+    import scrape_all_anime as saa
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(saa, "OUTPUT_FORMAT", "csv")
+    for filename, columns in ((saa.OUTPUT_FILE, saa.CSV_COLUMNS), (saa.OUTPUT_CHARACTERS, saa.CHARACTER_COLUMNS),
+                              (saa.OUTPUT_ANIME_CHARACTERS, saa.ANIME_CHARACTER_COLUMNS)):
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(",".join(columns) + "\n")
+    assert saa.output_columns_match()
+
+    # File relasi dari run lama dengan kolom lain: gagal sebelum scraping, bukan di writer
+    with open(saa.OUTPUT_ANIME_CHARACTERS, "w", encoding="utf-8") as f:
+        f.write("anime_id,character_id\n")
+    assert not saa.output_columns_match()
+
+def scrape(mode, ids):
+    """Isi subprocess: save_result untuk ids dari fixture, lalu crash atau selesai normal."""
+    sys.path.insert(0, ROOT_DIR)
+    import anime_schema
+    import scrape_all_anime as saa
+    from checkpoint import COMPLETED
+    from csv_writer import CsvAppendWriter
+
+    with open(os.path.join(FIXTURES_DIR, "anime_cowboy_bebop.html"), encoding="utf-8") as f:
+        page = anime_schema.parse_anime_page(f.read(), 1, "https://myanimelist.net/anime/1", saa.ANIME_FIELDS)
+    with open(os.path.join(FIXTURES_DIR, "anime_cowboy_bebop_characters.html"), encoding="utf-8") as f:
+        characters = anime_schema.parse_characters(f.read())
+
+    # Baris anime langsung di-flush, baris character / relasi hanya kalau dipaksa (close / sync)
+    def make_writer(path, columns):
+        if path == saa.OUTPUT_FILE:
+            return CsvAppendWriter(path, columns, batch_size=1)
+        return CsvAppendWriter(path, columns, batch_size=10_000, flush_interval=1e9)
+    saa.CsvAppendWriter = make_writer
+
+    saa.checkpoint = saa.open_checkpoint(saa.output_target())
+    saa.load_seen_characters()
+    todo = [anime_id for anime_id in ids if anime_id not in saa.checkpoint.ids(COMPLETED)]
+    print(f"todo {len(todo)}")
+    for anime_id in todo:
+        # Character 4-8 dipakai bersama oleh semua anime (dedup lewat seen_characters)
+        entries = [dict(entry, id=entry["id"] + anime_id * 1000 if i < 4 else entry["id"])
+                   for i, entry in enumerate(characters)]
+        saa.save_result(dict(page, csv_index=anime_id, myanimelist_id=anime_id, characters=entries))
+
+    if mode == "crash":
+        # Tunggu writer anime mencatat checkpoint, lalu mati tanpa flush apa pun
+        deadline = time.monotonic() + 5
+        while len(saa.checkpoint.ids(COMPLETED)) < len(todo) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        sys.stdout.flush()
+        os._exit(1)
+    saa.close_writers()
+    saa.checkpoint.close()
+
+
+if __name__ == "__main__":
+    scrape(sys.argv[1], [int(arg) for arg in sys.argv[2:]])
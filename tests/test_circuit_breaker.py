@@ -0,0 +1,63 @@
+"""Probe HALF-OPEN harus selalu dilepas, juga kalau request gagal dengan exception non-HTTP."""
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+import httpx
+import pytest
+
+from local_server import start_server
+import async_engine
+import circuit_breaker
+import http_session
+import rate_limiter
+from circuit_breaker import CircuitBreaker, CLOSED, OPEN
+
+
+@pytest.fixture
+def half_open(monkeypatch):
+    """Server lokal + breaker host-nya yang sudah OPEN dan langsung HALF-OPEN di request berikutnya."""
+    server, base_url = start_server()
+    host = urlsplit(base_url).netloc
+    breaker = CircuitBreaker(host, failure_threshold=1, open_seconds=0.01, max_open_seconds=0.01)
+    monkeypatch.setitem(circuit_breaker._breakers, host, breaker)
+    monkeypatch.setattr(rate_limiter, "limiter", rate_limiter.RateLimiter(rate=1e9, max_rate=1e9, burst=1e9))
+    breaker.record(503)
+    assert breaker.get_state() == OPEN
+    time.sleep(0.02)
+    yield base_url + "/", breaker
+    server.shutdown()
+
+
+def explode(status_code):
+    raise ValueError("bukan error HTTP")
+
+
+def test_probe_released_after_non_http_exception(half_open):
+    url, breaker = half_open
+    with pytest.raises(ValueError):
+        http_session.fetch(url, on_status=explode)
+    assert not breaker.probe_in_flight
+    assert breaker.get_state() == OPEN
+
+    time.sleep(0.02)
+    assert http_session.fetch(url).status_code == 200
+    assert breaker.get_state() == CLOSED
+
+
+def test_probe_released_after_non_http_exception_async(half_open):
+    url, breaker = half_open
+
+    async def run():
+        async with httpx.AsyncClient() as client:
+            clients = {None: client}
+            with pytest.raises(ValueError):
+                await async_engine.fetch(clients, url, {}, on_status=explode)
+            assert not breaker.probe_in_flight
+            assert breaker.get_state() == OPEN
+
+            await asyncio.sleep(0.02)
+            return await async_engine.fetch(clients, url, {})
+
+    assert asyncio.run(run())[1] == 200
+    assert breaker.get_state() == CLOSED
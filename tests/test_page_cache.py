@@ -0,0 +1,30 @@
+"""PAGE_CACHE=offline: halaman yang tidak ada di cache langsung gagal, tanpa network dan tanpa retry."""
+import asyncio
+
+import pytest
+
+import async_engine
+import http_session
+import page_cache
+import scrape_all_anime as saa
+from page_cache import CACHE_MISS, PageCache
+
+# Port discard: kalau fetch sampai menembak network, request ini gagal dengan status 0
+URL = "http://127.0.0.1:9/anime/1"
+
+
+@pytest.fixture
+def offline(tmp_path, monkeypatch):
+    monkeypatch.setattr(page_cache, "cache", PageCache(root=str(tmp_path), mode="offline"))
+
+
+def test_offline_miss_is_cache_miss(offline):
+    assert http_session.fetch(URL).status_code == CACHE_MISS
+    assert asyncio.run(async_engine.fetch({}, URL, {})) == (None, CACHE_MISS)
+
+
+def test_offline_miss_fails_without_retry(offline, monkeypatch):
+    monkeypatch.setattr(saa, "checkpoint", None)
+    job = saa.new_job(1, "https://myanimelist.net/anime/1")
+    outcome, status_code, failure_class = saa.handle_fetch(job, None, CACHE_MISS)
+    assert (outcome, status_code, failure_class) == ("failed", CACHE_MISS, None)
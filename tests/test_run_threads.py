@@ -0,0 +1,31 @@
+"""run_threads tidak boleh berputar tanpa henti saat retry sudah jatuh tempo tapi semua worker sibuk."""
+import time
+
+import retry_queue
+import scrape_all_anime as saa
+
+
+def test_due_retry_with_all_workers_busy_does_not_spin(monkeypatch):
+    calls = {"wait": 0}
+    real_wait = saa.wait
+
+    def counting_wait(*args, **kwargs):
+        calls["wait"] += 1
+        return real_wait(*args, **kwargs)
+
+    def process_anime(job):
+        if job["anime_id"] == 1 and not job["attempt"]:
+            # Gagal cepat, retry jatuh tempo selagi job 2 dan 3 masih jalan
+            job["attempt"] += 1
+            return "retry", 0, "timeout"
+        time.sleep(0.5)
+        return "saved", 200, None
+
+    monkeypatch.setattr(saa, "wait", counting_wait)
+    monkeypatch.setattr(saa, "process_anime", process_anime)
+    monkeypatch.setattr(retry_queue, "backoff_delay", lambda failure_class, attempt: 0.05)
+
+    jobs = [saa.new_job(i, f"https://myanimelist.net/anime/{i}") for i in (1, 2, 3)]
+    assert saa.run_threads(jobs, 2) == (3, 0)
+    # Beberapa wait per job selesai; busy-spin dengan timeout 0 memanggil wait ribuan kali
+    assert calls["wait"] < 20